@@ -2,6 +2,8 @@ from extensions.std.abc import ABC, abstractmethod
 
 
 class CharABC(ABC):
+    __slots__ = ("value",)
+
     def __init__(self, value: int | list[int]):
         self.value: int | list[int] = value
 
@@ -14,17 +16,23 @@ class CharABC(ABC):
         pass
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, CharABC):
             return self.value == other.value
         return self == other
 
     def __ne__(self, other: object) -> bool:
+        if self is other:
+            return False
         if isinstance(other, CharABC):
             return self.value != other.value
         return self != other
 
 
 class ASCIICharABC(CharABC):
+    __slots__ = ()
+
     def __init__(self, value: int):
         self.value: int = value
 
@@ -38,6 +46,8 @@ class ASCIICharABC(CharABC):
 
 
 class ByteCharABC(CharABC):
+    __slots__ = ()
+
     def __init__(self, char: int):
         self.value: int = char
 
@@ -55,6 +65,8 @@ class ByteCharABC(CharABC):
 
 
 class CustomCharABC(CharABC):
+    __slots__ = ("cgram",)
+
     def __init__(self, cgram: int, value: list[int]):
         self.cgram: int = cgram
         self.value: list[int] = value
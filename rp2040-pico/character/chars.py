@@ -1,7 +1,12 @@
-from character.abstracts import CharABC, ASCIICharABC, ByteCharABC
+from character.abstracts import CharABC, ASCIICharABC, ByteCharABC, CustomCharABC
+from extensions.std.typing import Optional
+
+# Characters are shared through the CharTable, they are immutable.
 
 
 class ASCIIChar(ASCIICharABC):
+    __slots__ = ()
+
     def __init__(self, value: int):
         self.value = value
 
@@ -9,10 +14,12 @@ class ASCIIChar(ASCIICharABC):
         return self.value
 
     def set_value(self, value: int):
-        self.value = value
+        raise AttributeError(f"Immutable character: {self}")
 
 
 class SpaceChar(ASCIICharABC):
+    __slots__ = ()
+
     def __init__(self):
         self.value = ord(" ")
 
@@ -20,10 +27,12 @@ class SpaceChar(ASCIICharABC):
         return self.value
 
     def set_value(self, value: int):
-        self.value = value
+        raise AttributeError(f"Immutable character: {self}")
 
 
 class RightAngleChar(ASCIICharABC):
+    __slots__ = ()
+
     def __init__(self):
         self.value = ord(">")
 
@@ -31,10 +40,12 @@ class RightAngleChar(ASCIICharABC):
         return self.value
 
     def set_value(self, value: int):
-        self.value = value
+        raise AttributeError(f"Immutable character: {self}")
 
 
 class LeftArrowChar(ByteCharABC):
+    __slots__ = ()
+
     def __init__(self):
         self.value = ord("\u007f")
 
@@ -45,10 +56,12 @@ class LeftArrowChar(ByteCharABC):
         return ord("←")
 
     def set_value(self, value: int):
-        self.value = value
+        raise AttributeError(f"Immutable character: {self}")
 
 
 class RightArrowChar(ByteCharABC):
+    __slots__ = ()
+
     def __init__(self):
         self.value = ord("\u007e")
 
@@ -59,7 +72,70 @@ class RightArrowChar(ByteCharABC):
         return ord("→")
 
     def set_value(self, value: int):
+        raise AttributeError(f"Immutable character: {self}")
+
+
+class CustomChar(CustomCharABC):
+    __slots__ = ("unicode_value",)
+
+    def __init__(self, cgram: int, value: list[int], unicode_value: int):
+        self.cgram = cgram & 0x7
         self.value = value
+        self.unicode_value = unicode_value
+
+    def get_value(self) -> list[int]:
+        return self.value
+
+    def get_unicode_value(self) -> int:
+        return self.unicode_value
+
+    def set_value(self, value: list[int]):
+        raise AttributeError(f"Immutable character: {self}")
+
+
+class CharTable:
+    def __init__(self):
+        self._space_char = SpaceChar()
+        self._right_angle_char = RightAngleChar()
+        self._left_arrow_char = LeftArrowChar()
+        self._right_arrow_char = RightArrowChar()
+        # Filled on first use, most of the 256 codes never reach the
+        # display and the RP2040 heap is small.
+        self._ascii_chars: list[Optional[ASCIICharABC]] = [None] * 256
+        self._ascii_chars[self._space_char.value] = self._space_char
+        self._ascii_chars[self._right_angle_char.value] = self._right_angle_char
+        self._custom_chars: list[Optional[CustomCharABC]] = [None] * 8
+
+    def get_ascii_char(self, code: int) -> ASCIICharABC:
+        if code >= 256:
+            return ASCIIChar(code)
+
+        ascii_char = self._ascii_chars[code]
+        if ascii_char is None:
+            ascii_char = ASCIIChar(code)
+            self._ascii_chars[code] = ascii_char
+        return ascii_char
+
+    def get_space_char(self) -> ASCIICharABC:
+        return self._space_char
+
+    def get_right_angle_char(self) -> ASCIICharABC:
+        return self._right_angle_char
+
+    def get_left_arrow_char(self) -> ByteCharABC:
+        return self._left_arrow_char
+
+    def get_right_arrow_char(self) -> ByteCharABC:
+        return self._right_arrow_char
+
+    def set_custom_char(self, char: CustomCharABC):
+        self._custom_chars[char.cgram] = char
+
+    def get_custom_char(self, cgram: int) -> Optional[CustomCharABC]:
+        return self._custom_chars[cgram & 0x7]
+
+
+char_table = CharTable()
 
 
 class CharArray:
@@ -67,8 +143,8 @@ class CharArray:
         pass
 
     def get_ascii_char_array(self, string: str) -> list[CharABC]:
+        get_ascii_char = char_table.get_ascii_char
         char_array = []
         for ch_str in string:
-            ascii_char = ASCIIChar(ord(ch_str))
-            char_array.append(ascii_char)
+            char_array.append(get_ascii_char(ord(ch_str)))
         return char_array
@@ -1,6 +1,6 @@
 from options.abstracts import OptionABC
 from character.abstracts import CharABC
-from character.chars import SpaceChar
+from character.chars import char_table
 
 from extensions.std.typing import Optional
 
@@ -153,7 +153,7 @@ class MenuCoordinator(MenuCoordinatorBase):
                 added_rows += 1
 
         for _ in range(self._rows - added_rows):
-            row_spaces: list[CharABC] = [SpaceChar()] * self._columns
+            row_spaces: list[CharABC] = [char_table.get_space_char()] * self._columns
             chars.append(row_spaces)
 
         return chars
@@ -1,11 +1,5 @@
 from character.abstracts import CharABC
-from character.chars import (
-    CharArray,
-    LeftArrowChar,
-    RightArrowChar,
-    RightAngleChar,
-    SpaceChar,
-)
+from character.chars import CharArray, char_table
 
 
 class MenuItemBase:
@@ -81,11 +75,11 @@ class MenuItemBase:
 
     def _fill_preceding_char(self, char_array: list[CharABC], st_range: int):
         if st_range > 0:
-            char_array.append(LeftArrowChar())
+            char_array.append(char_table.get_left_arrow_char())
 
     def _fill_proceeding_char(self, char_array: list[CharABC], en_range: int):
         if en_range != len(self._char_array):
-            char_array.append(RightArrowChar())
+            char_array.append(char_table.get_right_arrow_char())
 
     def _fill_char_array(self, char_array: list[CharABC]):
         shifted_length = self._get_shifted_length()
@@ -106,9 +100,10 @@ class MenuItemBase:
             char_array.append(self._char_array[idx])
 
     def _get_prefix_char_array(self) -> list[CharABC]:
+        space_char = char_table.get_space_char()
         if self._is_selected:
-            return [RightAngleChar(), SpaceChar()]
-        return [SpaceChar(), SpaceChar()]
+            return [char_table.get_right_angle_char(), space_char]
+        return [space_char, space_char]
 
     def _reset(self):
         self._st_idx = 0
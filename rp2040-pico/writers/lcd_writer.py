@@ -3,7 +3,7 @@ from time import sleep
 from lcd.api import LCDAPI
 from writers.abstracts import WriterABC
 from character.abstracts import CharABC, ASCIICharABC, ByteCharABC
-from character.chars import SpaceChar
+from character.chars import char_table
 
 
 class LCDWriterBase(WriterABC):
@@ -26,7 +26,7 @@ class LCDWriterBase(WriterABC):
         fill = row_state - len(chars)
         if fill > 0:
             for _ in range(fill):
-                chars.append(SpaceChar())
+                chars.append(char_table.get_space_char())
 
     def _insert_row_data(self, chars: list[CharABC], row: int):
         self._row_data[row] = chars
@@ -0,0 +1,280 @@
+import os
+
+# Benchmarks run against the emulated bus unless told otherwise.
+os.environ.setdefault("WGPIO_BACKEND", "emulated")
+
+import time
+import tracemalloc
+
+from menu.coordinator import MenuCoordinator
+from writers.lcd_frame_writer import LCDFrameWriter
+
+from configurations import LCDConfigABC
+from configurations import LCD1602Config, LCD2004Config
+
+from menu.tickrate import Tickrate
+from menu.scheduler import RenderScheduler
+from options.abstracts import OptionABC
+from menu.setups.dev.main import MainMenu
+
+from extensions.wgpio import emulatedio
+from extensions.acquisition import AcquisitionService
+from extensions.std.typing import Any, Callable, Optional
+
+# A scenario step is either a coordinator action name (a button event)
+# or None for an idle refresh tick.
+Step = Optional[str]
+
+
+class BenchmarkResult:
+    def __init__(
+        self,
+        name: str,
+        geometry: str,
+        frames: int,
+        fps: float,
+        peak_bytes_per_frame: float,
+        blocks_per_frame: float,
+        transactions_per_frame: float,
+        bytes_per_frame: float,
+        latency_p50_ms: float,
+        latency_p99_ms: float,
+    ):
+        self.name = name
+        self.geometry = geometry
+        self.frames = frames
+        self.fps = fps
+        self.peak_bytes_per_frame = peak_bytes_per_frame
+        self.blocks_per_frame = blocks_per_frame
+        self.transactions_per_frame = transactions_per_frame
+        self.bytes_per_frame = bytes_per_frame
+        self.latency_p50_ms = latency_p50_ms
+        self.latency_p99_ms = latency_p99_ms
+
+
+class StaticAcquisition(AcquisitionService):
+    # Samples a source once when it is registered and never starts the
+    # acquisition thread, nothing samples psutil or procfs during a pass.
+    def __init__(self):
+        super().__init__()
+
+    def register(self, key: str, sampler: Callable[[], Any], interval: float):
+        self._sample(key, sampler)
+
+
+class BenchmarkHarnessBase:
+    def __init__(self, lcd_config: LCDConfigABC, acquisition: AcquisitionService):
+        self._lcd_config = lcd_config
+        self._rows = lcd_config.lcd_rows
+        self._columns = lcd_config.lcd_columns
+        self._tick_rate = Tickrate(40)
+        self._scheduler = RenderScheduler(self._tick_rate)
+        # Idle ticks jump to the next deadline, as the main loop would
+        # after blocking on the input queue, without sleeping.
+        self._now = 0.0
+        self._writer = LCDFrameWriter(self._rows, self._columns)
+        self._device = emulatedio.get_device(1, 0x27)
+        self._acquisition = acquisition
+        main_menu = MainMenu(
+            self._writer, lcd_config, self._tick_rate, acquisition=acquisition
+        )
+        self._menu_coord = MenuCoordinator(
+            self._rows, self._columns, main_menu.get_menu()
+        )
+
+    def _render(self, due_options: Optional[list[OptionABC]] = None):
+        frame = self._menu_coord.get_frame(due_options)
+        self._writer.write_frame(frame, 0.0)
+
+    def _render_due_options(self):
+        # Same path as MenuHandler.update_due_options.
+        options = self._menu_coord.get_visible_options()
+        self._now += self._scheduler.get_timeout(options, self._now)
+        due_options = self._scheduler.get_due_options(options, self._now)
+        if due_options:
+            self._render(due_options)
+
+    def _run_step(self, step: Step):
+        if step is None:
+            self._render_due_options()
+            return
+
+        getattr(self._menu_coord, step)()
+        self._render()
+
+    def _get_bus_counts(self) -> tuple[int, int]:
+        if self._device is None:
+            return 0, 0
+        stats = self._device.get_stats()
+        return stats.transactions, stats.bytes
+
+    @staticmethod
+    def _get_percentile(samples: list[float], percentile: float) -> float:
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        idx = round(percentile * (len(ordered) - 1))
+        return ordered[idx]
+
+
+class BenchmarkHarness(BenchmarkHarnessBase):
+    def __init__(self, lcd_config: LCDConfigABC, acquisition: AcquisitionService):
+        super().__init__(lcd_config, acquisition)
+
+    def get_geometry(self) -> str:
+        return f"{self._columns}x{self._rows}"
+
+    def run_steps(self, steps: list[Step]) -> tuple[float, list[float]]:
+        latencies = []
+        st_time = time.perf_counter()
+        for step in steps:
+            step_time = time.perf_counter()
+            self._run_step(step)
+            if step is not None:
+                latencies.append(time.perf_counter() - step_time)
+        return time.perf_counter() - st_time, latencies
+
+    def measure_allocations(self, steps: list[Step]) -> tuple[float, float]:
+        # Returns the peak traced bytes above the live memory and the
+        # blocks a frame leaves allocated, both per frame. Call it on a
+        # fresh harness, tracing distorts the timings.
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        tracemalloc.start()
+        peak_bytes = 0
+        blocks = 0
+        for step in steps:
+            st_snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self._run_step(step)
+            _, peak = tracemalloc.get_traced_memory()
+            en_snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+            peak_bytes += peak - current
+            for stat in en_snapshot.compare_to(st_snapshot, "lineno"):
+                if stat.count_diff > 0:
+                    blocks += stat.count_diff
+        tracemalloc.stop()
+
+        frames = max(len(steps), 1)
+        return peak_bytes / frames, blocks / frames
+
+    def run(self, name: str, steps: list[Step]) -> BenchmarkResult:
+        st_transactions, st_bytes = self._get_bus_counts()
+        elapsed, latencies = self.run_steps(steps)
+        en_transactions, en_bytes = self._get_bus_counts()
+        # The timed pass moved this harness, the allocation pass starts
+        # from the same menu position and scroll state on a new one.
+        harness = BenchmarkHarness(self._lcd_config, self._acquisition)
+        peak_bytes, blocks = harness.measure_allocations(steps)
+
+        frames = len(steps)
+        result = BenchmarkResult(
+            name,
+            self.get_geometry(),
+            frames,
+            frames / elapsed if elapsed else 0.0,
+            peak_bytes,
+            blocks,
+            (en_transactions - st_transactions) / frames,
+            (en_bytes - st_bytes) / frames,
+            self._get_percentile(latencies, 0.50) * 1000,
+            self._get_percentile(latencies, 0.99) * 1000,
+        )
+        return result
+
+
+def get_idle_steps() -> list[Step]:
+    return [None] * 400
+
+
+def get_add_device_steps() -> list[Step]:
+    # Devices > [Add Device] > set Pin to 12 > [Confirm], then browse the
+    # new device's Info and Control pages and return to the root.
+    steps: list[Step] = []
+    for _ in range(10):
+        steps += ["apply_selection", "apply_selection", "increment_selection"]
+        steps += ["apply_selection"] + ["increment_selection"] * 12
+        steps += ["back_selection"] + ["increment_selection"] * 3
+        steps += ["apply_selection", "back_selection", "increment_selection"]
+        steps += ["apply_selection", "apply_selection", "apply_selection"]
+        steps += ["increment_selection"] * 3 + [None] * 4
+        steps += ["back_selection", "back_selection", "back_selection"]
+        steps += ["back_selection"]
+    return steps
+
+
+def get_scroll_steps() -> list[Step]:
+    # Configuration > Types set to "Long String Test", left selected so
+    # the marquee keeps scrolling.
+    steps: list[Step] = ["increment_selection", "apply_selection"]
+    steps += ["increment_selection"] * 3
+    steps += ["apply_selection", "increment_selection", "back_selection"]
+    steps += [None] * 400
+    return steps
+
+
+def get_system_info_steps() -> list[Step]:
+    steps: list[Step] = ["increment_selection"] * 2 + ["apply_selection"]
+    for _ in range(8):
+        steps += ["increment_selection"] + [None] * 25
+    return steps
+
+
+def get_scenarios() -> list[tuple[str, Callable[[], list[Step]]]]:
+    scenarios = [
+        ("idle", get_idle_steps),
+        ("add-device", get_add_device_steps),
+        ("scroll", get_scroll_steps),
+        ("system-info", get_system_info_steps),
+    ]
+    return scenarios
+
+
+def print_results(results: list[BenchmarkResult]):
+    header = "{:<12} {:>6} {:>6} {:>9} {:>9} {:>8} {:>8} {:>8} {:>8} {:>8}"
+    row = (
+        "{:<12} {:>6} {:>6} {:>9.1f} {:>9.1f} {:>8.1f} "
+        "{:>8.2f} {:>8.1f} {:>8.3f} {:>8.3f}"
+    )
+    print(
+        header.format(
+            "scenario",
+            "lcd",
+            "frames",
+            "fps",
+            "peak B/f",
+            "blocks/f",
+            "i2c tx/f",
+            "i2c B/f",
+            "p50 ms",
+            "p99 ms",
+        )
+    )
+    for result in results:
+        print(
+            row.format(
+                result.name,
+                result.geometry,
+                result.frames,
+                result.fps,
+                result.peak_bytes_per_frame,
+                result.blocks_per_frame,
+                result.transactions_per_frame,
+                result.bytes_per_frame,
+                result.latency_p50_ms,
+                result.latency_p99_ms,
+            )
+        )
+
+
+if __name__ == "__main__":
+    # One acquisition stub for every harness, the menus read the values
+    # sampled when their sources were registered.
+    acquisition = StaticAcquisition()
+    results = []
+    for lcd_config in (LCD1602Config(), LCD2004Config()):
+        for name, get_steps in get_scenarios():
+            harness = BenchmarkHarness(lcd_config, acquisition)
+            results.append(harness.run(name, get_steps()))
+
+    print_results(results)
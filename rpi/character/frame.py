@@ -0,0 +1,9 @@
+from character.abstracts import CustomCharABC
+
+
+class Frame:
+    def __init__(self, rows: list[bytes], glyphs: dict[int, CustomCharABC]):
+        # Each row holds HD44780 character codes, codes 0-7 refer to the
+        # custom glyphs that have to be present in CGRAM for this frame.
+        self.rows = rows
+        self.glyphs = glyphs
@@ -45,6 +45,60 @@ class KBCtrlConfigABC(ABC):
         pass
 
 
+class RotaryConfigABC(ABC):
+    @property
+    @abstractmethod
+    def a_pin(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def b_pin(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def sw_pin(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def steps_per_detent(self) -> int:
+        pass
+
+
+class InputConfigABC(ABC):
+    @property
+    @abstractmethod
+    def debounce_ms(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def long_press_ms(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def repeat_delay_ms(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def repeat_interval_ms(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def repeat_min_interval_ms(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def repeat_acceleration(self) -> float:
+        pass
+
+
 class LCDConfigABC(ABC):
     @property
     @abstractmethod
@@ -56,6 +110,16 @@ class LCDConfigABC(ABC):
     def lcd_columns(self) -> int:
         pass
 
+    @property
+    @abstractmethod
+    def lcd_bus(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def lcd_addresses(self) -> tuple[int, ...]:
+        pass
+
 
 class CtrlConfig(CtrlConfigABC):
     prev_pin: int = 6
@@ -71,11 +135,32 @@ class KBCtrlConfig(KBCtrlConfigABC):
     back_key: int = ord("1")
 
 
+class RotaryConfig(RotaryConfigABC):
+    a_pin: int = 17
+    b_pin: int = 18
+    sw_pin: int = 23
+    steps_per_detent: int = 4
+
+
+class InputConfig(InputConfigABC):
+    debounce_ms: int = 5
+    long_press_ms: int = 800
+    repeat_delay_ms: int = 400
+    repeat_interval_ms: int = 150
+    repeat_min_interval_ms: int = 25
+    # Each repeat shortens the interval by this factor.
+    repeat_acceleration: float = 0.85
+
+
 class LCD1602Config(LCDConfigABC):
     lcd_rows: int = 2
     lcd_columns: int = 16
+    lcd_bus: int = 1
+    lcd_addresses: tuple[int, ...] = (0x27,)
 
 
 class LCD2004Config(LCDConfigABC):
     lcd_rows: int = 4
     lcd_columns: int = 20
+    lcd_bus: int = 1
+    lcd_addresses: tuple[int, ...] = (0x27,)
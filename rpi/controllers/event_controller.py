@@ -0,0 +1,186 @@
+import time
+from queue import Queue, Empty
+
+from devices.button import Button
+from controllers.input_engine import InputEngine
+from configurations import CtrlConfigABC, InputConfigABC, InputConfig
+
+from extensions.std.typing import Callable, Optional
+
+
+class EventControllerBase:
+    BACK_EVENT = 0
+    PREV_EVENT = 1
+    NEXT_EVENT = 2
+    APPLY_EVENT = 3
+    LONG_BACK_EVENT = 4
+    LONG_APPLY_EVENT = 5
+
+    def __init__(self, ctrl_config: CtrlConfigABC, input_config: InputConfigABC):
+        self._levels: Queue[tuple[int, int, float]] = Queue()
+        self._events: list[int] = []
+        self._engine = InputEngine(input_config, [self.PREV_EVENT, self.NEXT_EVENT])
+        self._back_button = self._register_button(ctrl_config.back_pin, self.BACK_EVENT)
+        self._prev_button = self._register_button(ctrl_config.prev_pin, self.PREV_EVENT)
+        self._next_button = self._register_button(ctrl_config.next_pin, self.NEXT_EVENT)
+        self._apply_button = self._register_button(
+            ctrl_config.apply_pin, self.APPLY_EVENT
+        )
+        self._back_callback = None
+        self._prev_callback = None
+        self._next_callback = None
+        self._apply_callback = None
+        self._long_back_callback = None
+        self._long_apply_callback = None
+
+    def _register_button(self, pin: int, key: int) -> Button:
+        # Edge callbacks run on the pigpio notification thread,
+        # they only enqueue and the menu callbacks run in check().
+        button = Button(pin)
+        button.register_level_callback(
+            lambda level: self._levels.put((key, level, time.monotonic()))
+        )
+        return button
+
+    def _get_level(self, timeout: float) -> Optional[tuple[int, int, float]]:
+        try:
+            return self._levels.get(timeout=max(timeout, 0.0))
+        except Empty:
+            return None
+
+    def _get_pending_level(self) -> Optional[tuple[int, int, float]]:
+        try:
+            return self._levels.get_nowait()
+        except Empty:
+            return None
+
+    def _get_engine_timeout(self, timeout: float) -> float:
+        engine_timeout = self._engine.get_timeout(time.monotonic())
+        if engine_timeout is None or engine_timeout > timeout:
+            return timeout
+        return engine_timeout
+
+    def _add_events(self, events: list[tuple[int, int]]):
+        for key, kind in events:
+            if kind == InputEngine.LONG_PRESS:
+                if key == self.BACK_EVENT:
+                    key = self.LONG_BACK_EVENT
+                elif key == self.APPLY_EVENT:
+                    key = self.LONG_APPLY_EVENT
+            self._events.append(key)
+
+    def _feed_level(self, level: tuple[int, int, float]):
+        key, value, level_time = level
+        # The buttons are pulled up, a low level is a held button.
+        self._add_events(self._engine.update(key, value == 0, level_time))
+
+    def _get_event(self, timeout: float) -> Optional[int]:
+        deadline = time.monotonic() + max(timeout, 0.0)
+        while not self._events:
+            remaining = deadline - time.monotonic()
+            level = self._get_level(self._get_engine_timeout(remaining))
+            while level is not None:
+                self._feed_level(level)
+                level = self._get_pending_level()
+            self._add_events(self._engine.poll(time.monotonic()))
+            if remaining <= 0.0:
+                break
+
+        if self._events:
+            return self._events.pop(0)
+        return None
+
+    def _dispatch_event(self, event: int):
+        if event == self.BACK_EVENT:
+            self._execute_back_callback()
+
+        elif event == self.PREV_EVENT:
+            self._execute_prev_callback()
+
+        elif event == self.NEXT_EVENT:
+            self._execute_next_callback()
+
+        elif event == self.APPLY_EVENT:
+            self._execute_apply_callback()
+
+        elif event == self.LONG_BACK_EVENT:
+            self._execute_long_back_callback()
+
+        elif event == self.LONG_APPLY_EVENT:
+            self._execute_long_apply_callback()
+
+    def _execute_back_callback(self):
+        if self._back_callback:
+            self._back_callback()
+
+    def _execute_prev_callback(self):
+        if self._prev_callback:
+            self._prev_callback()
+
+    def _execute_next_callback(self):
+        if self._next_callback:
+            self._next_callback()
+
+    def _execute_apply_callback(self):
+        if self._apply_callback:
+            self._apply_callback()
+
+    def _execute_long_back_callback(self):
+        # Without a long press handler a long press acts as a press.
+        if self._long_back_callback:
+            self._long_back_callback()
+            return
+        self._execute_back_callback()
+
+    def _execute_long_apply_callback(self):
+        if self._long_apply_callback:
+            self._long_apply_callback()
+            return
+        self._execute_apply_callback()
+
+
+class EventController(EventControllerBase):
+    def __init__(
+        self,
+        ctrl_config: CtrlConfigABC,
+        input_config: Optional[InputConfigABC] = None,
+    ):
+        if input_config is None:
+            input_config = InputConfig()
+        super().__init__(ctrl_config, input_config)
+
+    def register_back_callback(self, callback: Callable):
+        self._back_callback = callback
+
+    def register_prev_callback(self, callback: Callable):
+        self._prev_callback = callback
+
+    def register_next_callback(self, callback: Callable):
+        self._next_callback = callback
+
+    def register_apply_callback(self, callback: Callable):
+        self._apply_callback = callback
+
+    def register_long_back_callback(self, callback: Callable):
+        self._long_back_callback = callback
+
+    def register_long_apply_callback(self, callback: Callable):
+        self._long_apply_callback = callback
+
+    def get_event(self, timeout: float = 0.0) -> Optional[int]:
+        return self._get_event(timeout)
+
+    def dispatch_event(self, event: int):
+        self._dispatch_event(event)
+
+    def check(self, timeout: float = 0.0):
+        event = self._get_event(timeout)
+        while event is not None:
+            self._dispatch_event(event)
+            event = self._get_event(0.0)
+
+    def close(self):
+        self._back_button.cancel_callbacks()
+        self._prev_button.cancel_callbacks()
+        self._next_button.cancel_callbacks()
+        self._apply_button.cancel_callbacks()
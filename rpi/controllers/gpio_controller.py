@@ -1,19 +1,32 @@
+import time
+
 from devices.button import Button
-from configurations import CtrlConfigABC
+from controllers.input_engine import InputEngine
+from extensions.wgpio import InputBank
+from configurations import CtrlConfigABC, InputConfigABC, InputConfig
 
-from extensions.std.typing import Callable
+from extensions.std.typing import Callable, Optional
 
 
 class ControllerBase:
-    def __init__(self, ctrl_config: CtrlConfigABC):
+    BACK_KEY = 0
+    PREV_KEY = 1
+    NEXT_KEY = 2
+    APPLY_KEY = 3
+
+    def __init__(self, ctrl_config: CtrlConfigABC, input_config: InputConfigABC):
         self._back_button = self._register_button(ctrl_config.back_pin)
         self._prev_button = self._register_button(ctrl_config.prev_pin)
         self._next_button = self._register_button(ctrl_config.next_pin)
         self._apply_button = self._register_button(ctrl_config.apply_pin)
+        self._bank = InputBank()
+        self._engine = InputEngine(input_config, [self.PREV_KEY, self.NEXT_KEY])
         self._back_callback = None
         self._prev_callback = None
         self._next_callback = None
         self._apply_callback = None
+        self._long_back_callback = None
+        self._long_apply_callback = None
 
     def _register_button(self, pin: int) -> Button:
         return Button(pin)
@@ -34,10 +47,65 @@ class ControllerBase:
         if self._apply_callback:
             self._apply_callback()
 
+    def _execute_long_back_callback(self):
+        # Without a long press handler a long press acts as a press.
+        if self._long_back_callback:
+            self._long_back_callback()
+            return
+        self._execute_back_callback()
+
+    def _execute_long_apply_callback(self):
+        if self._long_apply_callback:
+            self._long_apply_callback()
+            return
+        self._execute_apply_callback()
+
+    def _update_engine(self, levels: int, now: float) -> list[tuple[int, int]]:
+        # The buttons are pulled up, a low level is a held button.
+        back_level = self._back_button.get_state(levels)
+        prev_level = self._prev_button.get_state(levels)
+        next_level = self._next_button.get_state(levels)
+        apply_level = self._apply_button.get_state(levels)
+
+        events = []
+        events.extend(self._engine.update(self.BACK_KEY, not back_level, now))
+        events.extend(self._engine.update(self.PREV_KEY, not prev_level, now))
+        events.extend(self._engine.update(self.NEXT_KEY, not next_level, now))
+        events.extend(self._engine.update(self.APPLY_KEY, not apply_level, now))
+        events.extend(self._engine.poll(now))
+        return events
+
+    def _dispatch(self, key: int, kind: int):
+        long_press = kind == InputEngine.LONG_PRESS
+
+        if key == self.BACK_KEY:
+            if long_press:
+                self._execute_long_back_callback()
+                return
+            self._execute_back_callback()
+
+        elif key == self.PREV_KEY:
+            self._execute_prev_callback()
+
+        elif key == self.NEXT_KEY:
+            self._execute_next_callback()
+
+        elif key == self.APPLY_KEY:
+            if long_press:
+                self._execute_long_apply_callback()
+                return
+            self._execute_apply_callback()
+
 
 class Controller(ControllerBase):
-    def __init__(self, ctrl_config: CtrlConfigABC):
-        super().__init__(ctrl_config)
+    def __init__(
+        self,
+        ctrl_config: CtrlConfigABC,
+        input_config: Optional[InputConfigABC] = None,
+    ):
+        if input_config is None:
+            input_config = InputConfig()
+        super().__init__(ctrl_config, input_config)
 
     def register_back_callback(self, callback: Callable):
         self._back_callback = callback
@@ -51,15 +119,15 @@ class Controller(ControllerBase):
     def register_apply_callback(self, callback: Callable):
         self._apply_callback = callback
 
-    def check(self):
-        if self._back_button.is_pressed():
-            self._execute_back_callback()
-
-        if self._prev_button.is_pressed():
-            self._execute_prev_callback()
+    def register_long_back_callback(self, callback: Callable):
+        self._long_back_callback = callback
 
-        if self._next_button.is_pressed():
-            self._execute_next_callback()
+    def register_long_apply_callback(self, callback: Callable):
+        self._long_apply_callback = callback
 
-        if self._apply_button.is_pressed():
-            self._execute_apply_callback()
+    def check(self):
+        # One bank read gives all four buttons a same-instant sample.
+        levels = self._bank.read()
+        now = time.monotonic()
+        for key, kind in self._update_engine(levels, now):
+            self._dispatch(key, kind)
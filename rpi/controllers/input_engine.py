@@ -0,0 +1,127 @@
+from configurations import InputConfigABC
+
+from extensions.std.typing import Optional
+
+
+class KeyState:
+    def __init__(self):
+        self.raw = False
+        self.raw_time = 0.0
+        self.pressed = False
+        self.deadline: Optional[float] = None
+        self.interval = 0.0
+        self.long_sent = False
+
+
+class InputEngineBase:
+    PRESS = 0
+    LONG_PRESS = 1
+    REPEAT = 2
+
+    def __init__(self, input_config: InputConfigABC, repeat_keys: list[int]):
+        self._debounce = input_config.debounce_ms / 1000
+        self._long_press = input_config.long_press_ms / 1000
+        self._repeat_delay = input_config.repeat_delay_ms / 1000
+        self._repeat_interval = input_config.repeat_interval_ms / 1000
+        self._repeat_min_interval = input_config.repeat_min_interval_ms / 1000
+        self._repeat_acceleration = input_config.repeat_acceleration
+        self._repeat_keys = set(repeat_keys)
+        self._states: dict[int, KeyState] = {}
+
+    def _get_state(self, key: int) -> KeyState:
+        state = self._states.get(key)
+        if state is None:
+            state = KeyState()
+            self._states[key] = state
+        return state
+
+    def _press(self, key: int, state: KeyState, now: float) -> list[tuple[int, int]]:
+        state.long_sent = False
+        # Repeating keys act on the way down, others wait for the
+        # release or the long press threshold.
+        if key in self._repeat_keys:
+            state.interval = self._repeat_interval
+            state.deadline = now + self._repeat_delay
+            return [(key, self.PRESS)]
+
+        state.deadline = now + self._long_press
+        return []
+
+    def _release(self, key: int, state: KeyState) -> list[tuple[int, int]]:
+        state.deadline = None
+        if key in self._repeat_keys or state.long_sent:
+            return []
+        return [(key, self.PRESS)]
+
+    def _expire(self, key: int, state: KeyState, now: float) -> list[tuple[int, int]]:
+        if key not in self._repeat_keys:
+            state.long_sent = True
+            state.deadline = None
+            return [(key, self.LONG_PRESS)]
+
+        # A late poll yields a single repeat instead of a burst.
+        deadline = state.deadline + state.interval
+        if deadline <= now:
+            deadline = now + state.interval
+        state.deadline = deadline
+
+        interval = state.interval * self._repeat_acceleration
+        state.interval = max(interval, self._repeat_min_interval)
+        return [(key, self.REPEAT)]
+
+    def _get_debounce_deadline(self, state: KeyState) -> Optional[float]:
+        if state.raw == state.pressed:
+            return None
+        return state.raw_time + self._debounce
+
+    def _settle(self, key: int, state: KeyState, now: float) -> list[tuple[int, int]]:
+        # A level is only accepted once it held for the debounce time.
+        debounce_deadline = self._get_debounce_deadline(state)
+        if debounce_deadline is None or debounce_deadline > now:
+            return []
+
+        state.pressed = state.raw
+        if state.pressed:
+            return self._press(key, state, debounce_deadline)
+        return self._release(key, state)
+
+    def _advance(self, key: int, state: KeyState, now: float) -> list[tuple[int, int]]:
+        events = self._settle(key, state, now)
+        if state.pressed and state.deadline is not None:
+            if state.deadline <= now:
+                events.extend(self._expire(key, state, now))
+        return events
+
+
+class InputEngine(InputEngineBase):
+    def __init__(self, input_config: InputConfigABC, repeat_keys: list[int]):
+        super().__init__(input_config, repeat_keys)
+
+    def update(self, key: int, pressed: bool, now: float) -> list[tuple[int, int]]:
+        # Levels are timestamped, so a press shorter than the poll period
+        # still settles before the release replaces it.
+        state = self._get_state(key)
+        events = self._advance(key, state, now)
+        if pressed != state.raw:
+            state.raw = pressed
+            state.raw_time = now
+        return events
+
+    def poll(self, now: float) -> list[tuple[int, int]]:
+        events = []
+        for key, state in self._states.items():
+            events.extend(self._advance(key, state, now))
+        return events
+
+    def get_timeout(self, now: float) -> Optional[float]:
+        deadlines = []
+        for state in self._states.values():
+            debounce_deadline = self._get_debounce_deadline(state)
+            if debounce_deadline is not None:
+                deadlines.append(debounce_deadline)
+            if state.pressed and state.deadline is not None:
+                deadlines.append(state.deadline)
+
+        if not deadlines:
+            return None
+        return max(min(deadlines) - now, 0.0)
@@ -0,0 +1,177 @@
+import time
+from queue import Queue, Empty
+
+from devices.rotary import RotaryEncoder
+from controllers.input_engine import InputEngine
+from configurations import RotaryConfigABC, InputConfigABC, InputConfig
+
+from extensions.std.typing import Callable, Optional
+
+
+class RotaryControllerBase:
+    BACK_EVENT = 0
+    PREV_EVENT = 1
+    NEXT_EVENT = 2
+    APPLY_EVENT = 3
+
+    # Queued instead of a switch level to wake the loop after a detent.
+    ROTATION_KEY = -1
+    SWITCH_KEY = 0
+
+    def __init__(self, rotary_config: RotaryConfigABC, input_config: InputConfigABC):
+        self._levels: Queue[tuple[int, int, float]] = Queue()
+        self._events: list[int] = []
+        self._engine = InputEngine(input_config, [])
+        self._consumed = 0
+        self._encoder = self._register_encoder(rotary_config)
+        self._back_callback = None
+        self._prev_callback = None
+        self._next_callback = None
+        self._apply_callback = None
+
+    def _register_encoder(self, rotary_config: RotaryConfigABC) -> RotaryEncoder:
+        # Edge callbacks run on the pigpio notification thread, the
+        # decoder counts detents there and check() consumes them.
+        encoder = RotaryEncoder(
+            rotary_config.a_pin,
+            rotary_config.b_pin,
+            rotary_config.sw_pin,
+            rotary_config.steps_per_detent,
+        )
+        encoder.register_rotation_callback(
+            lambda detents: self._levels.put((self.ROTATION_KEY, 0, time.monotonic()))
+        )
+        encoder.register_switch_callback(
+            lambda level: self._levels.put((self.SWITCH_KEY, level, time.monotonic()))
+        )
+        return encoder
+
+    def _get_level(self, timeout: float) -> Optional[tuple[int, int, float]]:
+        try:
+            return self._levels.get(timeout=max(timeout, 0.0))
+        except Empty:
+            return None
+
+    def _get_pending_level(self) -> Optional[tuple[int, int, float]]:
+        try:
+            return self._levels.get_nowait()
+        except Empty:
+            return None
+
+    def _get_engine_timeout(self, timeout: float) -> float:
+        engine_timeout = self._engine.get_timeout(time.monotonic())
+        if engine_timeout is None or engine_timeout > timeout:
+            return timeout
+        return engine_timeout
+
+    def _add_rotation_events(self):
+        # A fast spin queues several wake-ups, the position already
+        # holds all of them and the later ones find nothing left.
+        position = self._encoder.get_position()
+        detents = position - self._consumed
+        self._consumed = position
+
+        if detents > 0:
+            self._events.extend([self.NEXT_EVENT] * detents)
+        elif detents < 0:
+            self._events.extend([self.PREV_EVENT] * -detents)
+
+    def _add_events(self, events: list[tuple[int, int]]):
+        # The only button applies on a press and goes back on a long press.
+        for _, kind in events:
+            if kind == InputEngine.LONG_PRESS:
+                self._events.append(self.BACK_EVENT)
+                continue
+            self._events.append(self.APPLY_EVENT)
+
+    def _feed_level(self, level: tuple[int, int, float]):
+        key, value, level_time = level
+        if key == self.ROTATION_KEY:
+            self._add_rotation_events()
+            return
+
+        # The switch is pulled up, a low level is a held switch.
+        self._add_events(self._engine.update(key, value == 0, level_time))
+
+    def _get_event(self, timeout: float) -> Optional[int]:
+        deadline = time.monotonic() + max(timeout, 0.0)
+        while not self._events:
+            remaining = deadline - time.monotonic()
+            level = self._get_level(self._get_engine_timeout(remaining))
+            while level is not None:
+                self._feed_level(level)
+                level = self._get_pending_level()
+            self._add_events(self._engine.poll(time.monotonic()))
+            if remaining <= 0.0:
+                break
+
+        if self._events:
+            return self._events.pop(0)
+        return None
+
+    def _dispatch_event(self, event: int):
+        if event == self.BACK_EVENT:
+            self._execute_back_callback()
+
+        elif event == self.PREV_EVENT:
+            self._execute_prev_callback()
+
+        elif event == self.NEXT_EVENT:
+            self._execute_next_callback()
+
+        elif event == self.APPLY_EVENT:
+            self._execute_apply_callback()
+
+    def _execute_back_callback(self):
+        if self._back_callback:
+            self._back_callback()
+
+    def _execute_prev_callback(self):
+        if self._prev_callback:
+            self._prev_callback()
+
+    def _execute_next_callback(self):
+        if self._next_callback:
+            self._next_callback()
+
+    def _execute_apply_callback(self):
+        if self._apply_callback:
+            self._apply_callback()
+
+
+class RotaryController(RotaryControllerBase):
+    def __init__(
+        self,
+        rotary_config: RotaryConfigABC,
+        input_config: Optional[InputConfigABC] = None,
+    ):
+        if input_config is None:
+            input_config = InputConfig()
+        super().__init__(rotary_config, input_config)
+
+    def register_back_callback(self, callback: Callable):
+        self._back_callback = callback
+
+    def register_prev_callback(self, callback: Callable):
+        self._prev_callback = callback
+
+    def register_next_callback(self, callback: Callable):
+        self._next_callback = callback
+
+    def register_apply_callback(self, callback: Callable):
+        self._apply_callback = callback
+
+    def get_event(self, timeout: float = 0.0) -> Optional[int]:
+        return self._get_event(timeout)
+
+    def dispatch_event(self, event: int):
+        self._dispatch_event(event)
+
+    def check(self, timeout: float = 0.0):
+        event = self._get_event(timeout)
+        while event is not None:
+            self._dispatch_event(event)
+            event = self._get_event(0.0)
+
+    def close(self):
+        self._encoder.cancel_callbacks()
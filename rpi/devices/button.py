@@ -1,4 +1,5 @@
 from extensions.wgpio import InputGPIO
+from extensions.std.typing import Callable, Optional
 
 
 class Button:
@@ -13,13 +14,25 @@ class Button:
         gpio.set_pull_up()
         return gpio
 
-    def get_state(self) -> int:
-        self.state = self.gpio.read()
+    def get_state(self, levels: Optional[int] = None) -> int:
+        # Levels is an InputBank sample, read the pin on its own without one.
+        if levels is None:
+            self.state = self.gpio.read()
+            return self.state
+
+        self.state = (levels >> self.bcm_pin) & 1
         return self.state
 
-    def is_pressed(self) -> bool:
+    def is_pressed(self, levels: Optional[int] = None) -> bool:
         self.p_state = self.state
-        state = self.get_state()
+        state = self.get_state(levels)
         if state == 1 and self.p_state == 0:
             return True
         return False
+
+    def register_level_callback(self, callback: Callable[[int], None]):
+        # Unfiltered, the InputEngine debounces the levels.
+        self.gpio.register_either_callback(lambda pin, level, tick: callback(level))
+
+    def cancel_callbacks(self):
+        self.gpio.cancel_callbacks()
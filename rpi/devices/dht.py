@@ -1,5 +1,13 @@
 import time
-import pigpio
+import threading
+
+try:
+    import pigpio
+    from extensions.wgpio.connection import connection
+except ImportError:
+    # Without pigpio every read reports missing data, for development.
+    pigpio = None
+from extensions.std.typing import Optional
 
 
 class DHT11Result:
@@ -17,23 +25,93 @@ class DHT11Result:
 
 
 class DHT11:
-    def __init__(self, pin: int):
+    # High pulses above this width (us) are ones, ~26us zeros, ~70us ones.
+    BIT_THRESHOLD_US = 50
+    # Covers the 18ms start signal plus the ~5ms response.
+    READ_TIMEOUT = 0.1
+
+    def __init__(self, pin: int, min_interval: float = 2.0):
         self._pin = pin
-        self._pi = pigpio.pi()
+        self._min_interval = min_interval
+        self._last_time = 0.0
+        self._last_result = DHT11Result(0, 0, DHT11Result.ERR_MISSING_DATA)
+        self._last_valid: Optional[DHT11Result] = None
+        self._lock = threading.Lock()
+        self._high_tick: Optional[int] = None
+        self._widths: list[int] = []
+        self._done = threading.Event()
 
     def read(self) -> DHT11Result:
-        self._pi.set_mode(self._pin, pigpio.OUTPUT)
-        self._send_and_sleep(pigpio.HIGH, 0.05)
-        self._send_and_sleep(pigpio.LOW, 0.02)
-        self._pi.set_mode(self._pin, pigpio.INPUT)
-        self._pi.set_pull_up_down(self._pin, pigpio.PUD_UP)
-
-        data = self._collect_input()
-        pull_up_lengths = self._parse_data_pull_up_lengths(data)
-        if len(pull_up_lengths) != 40:
+        # The sensor needs about a second to recover between reads, a
+        # read within min_interval returns the previous result instead.
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_time < self._min_interval:
+                return self._last_result
+
+            # Stamped at the start, reads scheduled min_interval apart are
+            # not skipped for the time the previous measurement took.
+            self._last_time = now
+            result = self._measure()
+            self._last_result = result
+            if result.is_valid():
+                self._last_valid = result
+            return result
+
+    def get_min_interval(self) -> float:
+        return self._min_interval
+
+    def get_last_valid(self) -> Optional[DHT11Result]:
+        return self._last_valid
+
+    def _measure(self) -> DHT11Result:
+        if pigpio is None:
+            return DHT11Result(0, 0, DHT11Result.ERR_MISSING_DATA)
+
+        # Fetched per read, the shared connection may have been replaced.
+        pi = connection.get_pi()
+        self._high_tick = None
+        self._widths = []
+        self._done.clear()
+
+        edge_callback = pi.callback(self._pin, pigpio.EITHER_EDGE, self._record_edge)
+        try:
+            self._send_start(pi)
+            self._done.wait(self.READ_TIMEOUT)
+        finally:
+            edge_callback.cancel()
+
+        return self._decode(self._widths)
+
+    def _send_start(self, pi: "pigpio.pi"):
+        pi.set_mode(self._pin, pigpio.OUTPUT)
+        pi.write(self._pin, pigpio.LOW)
+        time.sleep(0.018)
+        pi.set_mode(self._pin, pigpio.INPUT)
+        pi.set_pull_up_down(self._pin, pigpio.PUD_UP)
+
+    def _record_edge(self, pin: int, level: int, tick: int):
+        # Runs on the pigpio notification thread, ticks are microseconds
+        # taken by the daemon and unaffected by socket latency.
+        if level == pigpio.HIGH:
+            self._high_tick = tick
+            return
+
+        if level == pigpio.LOW and self._high_tick is not None:
+            self._widths.append(pigpio.tickDiff(self._high_tick, tick))
+            self._high_tick = None
+            # The host release and the 80us response pulse come before
+            # the 40 data bits, the decode only keeps the last 40.
+            if len(self._widths) >= 42:
+                self._done.set()
+
+    def _decode(self, widths: list[int]) -> DHT11Result:
+        if len(widths) < 40:
             return DHT11Result(0, 0, DHT11Result.ERR_MISSING_DATA)
 
-        bits = self._calculate_bits(pull_up_lengths)
+        bits = []
+        for width in widths[-40:]:
+            bits.append(width > self.BIT_THRESHOLD_US)
         the_bytes = self._bits_to_bytes(bits)
 
         checksum = self._calculate_checksum(the_bytes)
@@ -51,91 +129,6 @@ class DHT11:
 
         return DHT11Result(temperature, humidity)
 
-    def _send_and_sleep(self, output: int, sleep: float):
-        self._pi.write(self._pin, output)
-        time.sleep(sleep)
-
-    def _collect_input(self) -> list[int]:
-        unchanged_count = 0
-        max_unchanged_count = 100
-
-        last = -1
-        data = []
-        while True:
-            current = self._pi.read(self._pin)
-            data.append(current)
-            if last != current:
-                unchanged_count = 0
-                last = current
-            else:
-                unchanged_count += 1
-                if unchanged_count > max_unchanged_count:
-                    break
-
-        return data
-
-    def _parse_data_pull_up_lengths(self, data: list[int]) -> list[int]:
-        state_init_pull_down = 1
-        state_init_pull_up = 2
-        state_data_first_pull_down = 3
-        state_data_pull_up = 4
-        state_data_pull_down = 5
-
-        state = state_init_pull_down
-
-        lengths = []
-        current_length = 0
-
-        for i in range(len(data)):
-            current = data[i]
-            current_length += 1
-
-            if state == state_init_pull_down:
-                if current == pigpio.LOW:
-                    state = state_init_pull_up
-
-            elif state == state_init_pull_up:
-                if current == pigpio.HIGH:
-                    state = state_data_first_pull_down
-
-            elif state == state_data_first_pull_down:
-                if current == pigpio.LOW:
-                    state = state_data_pull_up
-
-            elif state == state_data_pull_up:
-                if current == pigpio.HIGH:
-                    current_length = 0
-                    state = state_data_pull_down
-
-            elif state == state_data_pull_down:
-                if current == pigpio.LOW:
-                    lengths.append(current_length)
-                    state = state_data_pull_up
-
-        return lengths
-
-    def _calculate_bits(self, pull_up_lengths) -> list[int]:
-        shortest_pull_up = 1000
-        longest_pull_up = 0
-
-        for i in range(0, len(pull_up_lengths)):
-            length = pull_up_lengths[i]
-            if length < shortest_pull_up:
-                shortest_pull_up = length
-            if length > longest_pull_up:
-                longest_pull_up = length
-
-        halfway = shortest_pull_up + (longest_pull_up - shortest_pull_up) / 2
-        bits = []
-
-        for i in range(0, len(pull_up_lengths)):
-            bit = False
-            if pull_up_lengths[i] > halfway:
-                bit = True
-            bits.append(bit)
-
-        return bits
-
     def _bits_to_bytes(self, bits: list[int]) -> list[int]:
         the_bytes = []
         byte = 0
@@ -0,0 +1,45 @@
+class QuadratureDecoderBase:
+    # Indexed by (previous AB << 2) | current AB. Gray-code neighbours
+    # count one step, no change and skipped states count nothing.
+    # Clockwise runs 11 -> 10 -> 00 -> 01 -> 11.
+    TRANSITIONS = (0, 1, -1, 0, -1, 0, 0, 1, 1, 0, 0, -1, 0, -1, 1, 0)
+    REST_STATE = 0b11
+
+    def __init__(self, steps_per_detent: int):
+        self._steps_per_detent = steps_per_detent
+        self._state = self.REST_STATE
+        self._steps = 0
+        # Only the decoding thread writes the position, readers keep
+        # their own consumed count, so no lock is needed.
+        self._position = 0
+
+    def _step(self, state: int) -> int:
+        transition = self.TRANSITIONS[(self._state << 2) | state]
+        self._state = state
+        self._steps += transition
+
+        if self._steps >= self._steps_per_detent:
+            self._steps = 0
+            self._position += 1
+            return 1
+
+        if self._steps <= -self._steps_per_detent:
+            self._steps = 0
+            self._position -= 1
+            return -1
+
+        # Realign on the rest state, a half turn backed out counts nothing.
+        if state == self.REST_STATE:
+            self._steps = 0
+        return 0
+
+
+class QuadratureDecoder(QuadratureDecoderBase):
+    def __init__(self, steps_per_detent: int = 4):
+        super().__init__(steps_per_detent)
+
+    def update(self, a_state: int, b_state: int) -> int:
+        return self._step((a_state << 1) | b_state)
+
+    def get_position(self) -> int:
+        return self._position
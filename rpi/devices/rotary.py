@@ -1,57 +1,98 @@
 from extensions.wgpio import InputGPIO
-from extensions.std.typing import Optional, Literal
+from devices.quadrature import QuadratureDecoder
+from extensions.std.typing import Callable, Optional, Literal
 
 
 class RotaryEncoderBase:
-    def __init__(self, a_pin: int, b_pin: int, sw_pin: int):
+    def __init__(self, a_pin: int, b_pin: int, sw_pin: int, steps_per_detent: int):
+        self._a_pin = a_pin
+        self._b_pin = b_pin
+        self._sw_pin = sw_pin
         self._a_gpio = self._register_pin(a_pin)
         self._b_gpio = self._register_pin(b_pin)
         self._sw_gpio = self._register_pin(sw_pin)
-        self._a_state = 0
-        self._b_state = 0
-        self._sw_state = 1
-        self._ap_state = 1
-        self._bp_state = 1
-        self._swp_state = 1
+        self._decoder = QuadratureDecoder(steps_per_detent)
+        self.a_state = 1
+        self.b_state = 1
+        self.sw_state = 1
+        self.swp_state = 1
 
     def _register_pin(self, pin: int) -> InputGPIO:
         gpio = InputGPIO(pin)
         return gpio
 
+    def _read_pin(self, gpio: InputGPIO, pin: int, levels: Optional[int]) -> int:
+        # Levels is an InputBank sample, read the pin on its own without one.
+        if levels is None:
+            return gpio.read()
+        return (levels >> pin) & 1
+
+    def _decode_edge(self, pin: int, level: int, callback: Callable[[int], None]):
+        # Runs on the pigpio notification thread for every A and B edge.
+        if pin == self._a_pin:
+            self.a_state = level
+        else:
+            self.b_state = level
+
+        detents = self._decoder.update(self.a_state, self.b_state)
+        if detents:
+            callback(detents)
+
 
 class RotaryEncoder(RotaryEncoderBase):
-    def __init__(self, a_pin: int, b_pin: int, sw_pin: int):
-        super().__init__(a_pin, b_pin, sw_pin)
+    def __init__(self, a_pin: int, b_pin: int, sw_pin: int, steps_per_detent: int = 4):
+        super().__init__(a_pin, b_pin, sw_pin, steps_per_detent)
 
-    def get_a_state(self):
-        self.a_state = self._a_gpio.read()
+    def get_a_state(self, levels: Optional[int] = None) -> int:
+        self.a_state = self._read_pin(self._a_gpio, self._a_pin, levels)
         return self.a_state
 
-    def get_b_state(self):
-        self.b_state = self._b_gpio.read()
+    def get_b_state(self, levels: Optional[int] = None) -> int:
+        self.b_state = self._read_pin(self._b_gpio, self._b_pin, levels)
         return self.b_state
 
-    def get_sw_state(self):
-        self.sw_state = self._sw_gpio.read()
+    def get_sw_state(self, levels: Optional[int] = None) -> int:
+        self.sw_state = self._read_pin(self._sw_gpio, self._sw_pin, levels)
         return self.sw_state
 
-    def get_direction(self) -> Optional[Literal[1, -1]]:
-        self.ap_state = self.a_state
-        self.bp_state = self.b_state
-
-        a_state = self.get_a_state()
-        b_state = self.get_b_state()
-
-        p_state = self.ap_state == 1 and self.bp_state == 1
+    def get_direction(self, levels: Optional[int] = None) -> Optional[Literal[1, -1]]:
+        # Sampled decoding, steps between two samples are lost when the
+        # encoder moves more than one Gray-code state in between.
+        a_state = self.get_a_state(levels)
+        b_state = self.get_b_state(levels)
 
-        if a_state == 1 and b_state == 0 and p_state:
+        detents = self._decoder.update(a_state, b_state)
+        if detents > 0:
             return 1
-        elif a_state == 0 and b_state == 1 and p_state:
+        elif detents < 0:
             return -1
 
-    def is_pressed(self) -> bool:
+    def is_pressed(self, levels: Optional[int] = None) -> bool:
         self.swp_state = self.sw_state
-        state = self.get_sw_state()
+        state = self.get_sw_state(levels)
         if state == 1 and self.swp_state == 0:
             return True
         return False
+
+    def get_position(self) -> int:
+        return self._decoder.get_position()
+
+    def register_rotation_callback(self, callback: Callable[[int], None]):
+        # Edge driven decoding, the callback receives each completed detent.
+        self.a_state = self._a_gpio.read()
+        self.b_state = self._b_gpio.read()
+        self._a_gpio.register_either_callback(
+            lambda pin, level, tick: self._decode_edge(pin, level, callback)
+        )
+        self._b_gpio.register_either_callback(
+            lambda pin, level, tick: self._decode_edge(pin, level, callback)
+        )
+
+    def register_switch_callback(self, callback: Callable[[int], None]):
+        # Unfiltered, the InputEngine debounces the levels.
+        self._sw_gpio.register_either_callback(lambda pin, level, tick: callback(level))
+
+    def cancel_callbacks(self):
+        self._a_gpio.cancel_callbacks()
+        self._b_gpio.cancel_callbacks()
+        self._sw_gpio.cancel_callbacks()
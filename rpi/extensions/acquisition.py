@@ -0,0 +1,142 @@
+import time
+import heapq
+import logging
+import threading
+
+from menu.instrumentation import Instrumentation
+from extensions.std.typing import Any, Callable, Optional
+
+
+class SnapshotStore:
+    def __init__(self):
+        self._values: dict[str, Any] = {}
+        self._timestamps: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._values[key] = value
+            self._timestamps[key] = time.monotonic()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._values.get(key, default)
+
+    def get_timestamp(self, key: str) -> Optional[float]:
+        with self._lock:
+            return self._timestamps.get(key)
+
+
+class AcquisitionServiceBase:
+    def __init__(self, store: SnapshotStore):
+        self._store = store
+        self._sources: dict[str, tuple[Callable[[], Any], float]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._scheduled: set[str] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._instrumentation: Optional[Instrumentation] = None
+
+    def _get_sample(self, key: str, sampler: Callable[[], Any]) -> Any:
+        if self._instrumentation is None:
+            return sampler()
+
+        # Failed samples are timed as well, a timing out sensor shows up.
+        st_time = time.perf_counter()
+        try:
+            return sampler()
+        finally:
+            en_time = time.perf_counter()
+            self._instrumentation.record_source(key, en_time - st_time)
+
+    def _sample(self, key: str, sampler: Callable[[], Any]):
+        # A failing or empty sample keeps the previous value.
+        try:
+            value = self._get_sample(key, sampler)
+        except Exception as error:
+            logging.warning(f"Sampling {key} failed: {error}")
+            return
+
+        if value is not None:
+            self._store.set(key, value)
+
+    def _get_due_source(self) -> tuple[Optional[str], float]:
+        with self._lock:
+            if not self._deadlines:
+                return None, 1.0
+
+            deadline, key = self._deadlines[0]
+            timeout = deadline - time.monotonic()
+            if timeout > 0.0:
+                return None, timeout
+
+            heapq.heappop(self._deadlines)
+            if key not in self._sources:
+                self._scheduled.discard(key)
+                return None, 0.0
+
+            _, interval = self._sources[key]
+            next_deadline = deadline + interval
+            if next_deadline <= time.monotonic():
+                next_deadline = time.monotonic() + interval
+            heapq.heappush(self._deadlines, (next_deadline, key))
+            return key, 0.0
+
+    def _run(self):
+        while not self._stopped:
+            # Cleared before looking at the deadlines, a source registered
+            # meanwhile wakes the wait below instead of being missed.
+            self._wake.clear()
+            key, timeout = self._get_due_source()
+            if key is None:
+                self._wake.wait(timeout)
+                continue
+
+            source = self._sources.get(key)
+            if source is not None:
+                self._sample(key, source[0])
+
+    def _start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+
+class AcquisitionService(AcquisitionServiceBase):
+    def __init__(self, store: Optional[SnapshotStore] = None):
+        if store is None:
+            store = SnapshotStore()
+        super().__init__(store)
+
+    def get_store(self) -> SnapshotStore:
+        return self._store
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]):
+        self._instrumentation = instrumentation
+
+    def register(self, key: str, sampler: Callable[[], Any], interval: float):
+        # The first sample is taken right away, options built after
+        # registering always find a value in the store.
+        self._sample(key, sampler)
+        with self._lock:
+            self._sources[key] = (sampler, interval)
+            if key not in self._scheduled:
+                self._scheduled.add(key)
+                deadline = time.monotonic() + interval
+                heapq.heappush(self._deadlines, (deadline, key))
+        self._start()
+        self._wake.set()
+
+    def unregister(self, key: str):
+        with self._lock:
+            self._sources.pop(key, None)
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
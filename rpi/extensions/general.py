@@ -34,3 +34,7 @@ class System:
 
     def get_memory_usage(self) -> float:
         return psutil.virtual_memory().percent
+
+    def get_memory_stats(self) -> tuple[int, int, int, float]:
+        memory = psutil.virtual_memory()
+        return memory.total, memory.used, memory.free, memory.percent
@@ -0,0 +1,135 @@
+import os
+
+from extensions.std.typing import Optional
+
+# Block devices that are virtual or stacked on other disks, their
+# traffic is already counted on the disks below them.
+SKIPPED_DISKS = ("loop", "ram", "zram", "dm-", "md")
+
+
+class KeptFileBase:
+    def __init__(self, path: str, size: int):
+        self._path = path
+        self._size = size
+        self._fd: Optional[int] = None
+        self._missing = False
+
+    def _open(self) -> Optional[int]:
+        try:
+            return os.open(self._path, os.O_RDONLY)
+        except OSError:
+            # Files such as the Pi firmware ones do not exist elsewhere,
+            # they are not looked up again.
+            self._missing = True
+            return None
+
+    def _read(self) -> Optional[bytes]:
+        if self._missing:
+            return None
+
+        if self._fd is None:
+            self._fd = self._open()
+            if self._fd is None:
+                return None
+
+        # procfs and sysfs regenerate the content for a read at offset 0,
+        # the descriptor stays open and a refresh is a single pread.
+        try:
+            return os.pread(self._fd, self._size, 0)
+        except OSError:
+            self._close()
+            return None
+
+    def _close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class KeptFile(KeptFileBase):
+    def __init__(self, path: str, size: int = 65536):
+        super().__init__(path, size)
+
+    def read(self) -> Optional[str]:
+        data = self._read()
+        if data is None:
+            return None
+        return data.decode()
+
+    def close(self):
+        self._close()
+
+
+class DiskStatsBase:
+    SECTOR_SIZE = 512
+
+    def __init__(self, path: str):
+        self._file = KeptFile(path)
+        self._disks = self._get_disks()
+
+    def _get_disks(self) -> set[str]:
+        try:
+            names = os.listdir("/sys/block")
+        except OSError:
+            return set()
+
+        disks = set()
+        for name in names:
+            if not name.startswith(SKIPPED_DISKS):
+                disks.add(name)
+        return disks
+
+    def _get_counters(self, text: str) -> tuple[int, int]:
+        # Fields: major minor name reads merged sectors_read ms writes
+        # merged sectors_written, sectors are always 512 bytes here.
+        read_sectors = 0
+        written_sectors = 0
+        for line in text.splitlines():
+            fields = line.split()
+            if len(fields) < 10 or fields[2] not in self._disks:
+                continue
+            read_sectors += int(fields[5])
+            written_sectors += int(fields[9])
+        return read_sectors * self.SECTOR_SIZE, written_sectors * self.SECTOR_SIZE
+
+
+class DiskStats(DiskStatsBase):
+    def __init__(self, path: str = "/proc/diskstats"):
+        super().__init__(path)
+
+    def read(self) -> Optional[tuple[int, int]]:
+        # Bytes read and written since boot, summed over all disks.
+        text = self._file.read()
+        if text is None:
+            return None
+        return self._get_counters(text)
+
+
+class NetDevStatsBase:
+    def __init__(self, path: str):
+        self._file = KeptFile(path)
+
+    def _get_counters(self, text: str) -> tuple[int, int]:
+        # Two header lines, then "name: 8 receive fields 8 transmit fields".
+        rx_bytes = 0
+        tx_bytes = 0
+        for line in text.splitlines()[2:]:
+            name, _, counters = line.partition(":")
+            fields = counters.split()
+            if name.strip() == "lo" or len(fields) < 9:
+                continue
+            rx_bytes += int(fields[0])
+            tx_bytes += int(fields[8])
+        return rx_bytes, tx_bytes
+
+
+class NetDevStats(NetDevStatsBase):
+    def __init__(self, path: str = "/proc/net/dev"):
+        super().__init__(path)
+
+    def read(self) -> Optional[tuple[int, int]]:
+        # Bytes received and transmitted, loopback excluded.
+        text = self._file.read()
+        if text is None:
+            return None
+        return self._get_counters(text)
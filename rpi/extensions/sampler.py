@@ -0,0 +1,225 @@
+import time
+
+from extensions.general import Processor, System
+from extensions.procfs import KeptFile, DiskStats, NetDevStats
+from extensions.acquisition import SnapshotStore
+from extensions.std.abc import ABC, abstractmethod
+from extensions.std.typing import Any, Callable, Optional
+
+
+class SystemSnapshot:
+    def __init__(
+        self,
+        processor_name: str,
+        core_count: int,
+        cpu_usage: Optional[float],
+        cpu_frequency_mhz: Optional[float],
+        memory_total: Optional[int],
+        memory_used: Optional[int],
+        memory_free: Optional[int],
+        memory_usage: Optional[float],
+    ):
+        self.processor_name = processor_name
+        self.core_count = core_count
+        self.cpu_usage = cpu_usage
+        self.cpu_frequency_mhz = cpu_frequency_mhz
+        self.memory_total = memory_total
+        self.memory_used = memory_used
+        self.memory_free = memory_free
+        self.memory_usage = memory_usage
+
+
+class DiskSnapshot:
+    def __init__(self, disk_read_rate: float, disk_write_rate: float):
+        # Bytes per second.
+        self.disk_read_rate = disk_read_rate
+        self.disk_write_rate = disk_write_rate
+
+
+class NetworkSnapshot:
+    def __init__(self, net_rx_rate: float, net_tx_rate: float):
+        # Bytes per second.
+        self.net_rx_rate = net_rx_rate
+        self.net_tx_rate = net_tx_rate
+
+
+class LoadSnapshot:
+    def __init__(self, load_1: float, load_5: float, load_15: float):
+        self.load_1 = load_1
+        self.load_5 = load_5
+        self.load_15 = load_15
+
+
+class SoCSnapshot:
+    def __init__(self, soc_temperature: Optional[float], throttled: Optional[str]):
+        self.soc_temperature = soc_temperature
+        self.throttled = throttled
+
+
+class SnapshotSourceABC(ABC):
+    @abstractmethod
+    def get_snapshot(self) -> Any:
+        pass
+
+
+class SystemSamplerBase:
+    def __init__(self):
+        self._processor = Processor()
+        self._system = System()
+        self._processor_name = self._processor.get_processor_name()
+        self._core_count = self._processor.get_core_count()
+
+    def _read(self, getter: Callable[[], Any]) -> Any:
+        # A failing source only blanks its own rows, e.g. cpu_freq()
+        # returns None on kernels without cpufreq.
+        try:
+            return getter()
+        except Exception:
+            return None
+
+    def _sample(self) -> SystemSnapshot:
+        # One pass over /proc: a single call per psutil source.
+        cpu_usage = self._read(self._processor.get_usage)
+        cpu_frequency = self._read(self._processor.get_frequency_mhz)
+        memory_stats = self._read(self._system.get_memory_stats)
+        if memory_stats is None:
+            memory_stats = (None, None, None, None)
+        total, used, free, usage = memory_stats
+
+        snapshot = SystemSnapshot(
+            self._processor_name,
+            self._core_count,
+            cpu_usage,
+            cpu_frequency,
+            total,
+            used,
+            free,
+            usage,
+        )
+        return snapshot
+
+
+class SystemSampler(SystemSamplerBase):
+    def __init__(self):
+        super().__init__()
+
+    def sample(self) -> SystemSnapshot:
+        # Used by the AcquisitionService, which keeps its own schedule.
+        return self._sample()
+
+
+class RateSamplerBase:
+    def __init__(self):
+        self._counters: Optional[tuple[int, ...]] = None
+        self._timestamp = 0.0
+
+    def _get_rates(
+        self, counters: Optional[tuple[int, ...]]
+    ) -> Optional[tuple[float, ...]]:
+        # Rates come from the difference to the previous sample, nothing
+        # blocks for a measuring interval. The first sample has no rate.
+        if counters is None:
+            return None
+
+        now = time.monotonic()
+        previous = self._counters
+        elapsed = now - self._timestamp
+        self._counters = counters
+        self._timestamp = now
+        if previous is None or elapsed <= 0.0:
+            return None
+
+        rates = []
+        for current, last in zip(counters, previous):
+            # A counter that went backwards was reset, it counts as idle.
+            rates.append(max(current - last, 0) / elapsed)
+        return tuple(rates)
+
+
+class DiskSampler(RateSamplerBase):
+    def __init__(self):
+        super().__init__()
+        self._disk_stats = DiskStats()
+
+    def sample(self) -> Optional[DiskSnapshot]:
+        rates = self._get_rates(self._disk_stats.read())
+        if rates is None:
+            return None
+        return DiskSnapshot(*rates)
+
+
+class NetworkSampler(RateSamplerBase):
+    def __init__(self):
+        super().__init__()
+        self._net_dev_stats = NetDevStats()
+
+    def sample(self) -> Optional[NetworkSnapshot]:
+        rates = self._get_rates(self._net_dev_stats.read())
+        if rates is None:
+            return None
+        return NetworkSnapshot(*rates)
+
+
+class LoadSampler:
+    def __init__(self):
+        self._loadavg = KeptFile("/proc/loadavg")
+
+    def sample(self) -> Optional[LoadSnapshot]:
+        text = self._loadavg.read()
+        if text is None:
+            return None
+
+        load_1, load_5, load_15 = text.split()[:3]
+        return LoadSnapshot(float(load_1), float(load_5), float(load_15))
+
+
+class SoCSamplerBase:
+    # Current state bits of the firmware throttling mask.
+    THROTTLE_FLAGS = ((0x1, "UV"), (0x2, "CAP"), (0x4, "THR"), (0x8, "TMP"))
+
+    def __init__(self, thermal_path: str, throttled_path: str):
+        self._thermal = KeptFile(thermal_path)
+        self._throttled = KeptFile(throttled_path)
+
+    def _get_temperature(self) -> Optional[float]:
+        text = self._thermal.read()
+        if text is None:
+            return None
+        # Millidegrees Celsius.
+        return int(text) / 1000
+
+    def _get_throttled(self) -> Optional[str]:
+        text = self._throttled.read()
+        if text is None:
+            return None
+
+        mask = int(text, 16)
+        flags = [name for bit, name in self.THROTTLE_FLAGS if mask & bit]
+        if not flags:
+            return "OK"
+        return " ".join(flags)
+
+
+class SoCSampler(SoCSamplerBase):
+    def __init__(
+        self,
+        thermal_path: str = "/sys/class/thermal/thermal_zone0/temp",
+        throttled_path: str = "/sys/devices/platform/soc/soc:firmware/get_throttled",
+    ):
+        super().__init__(thermal_path, throttled_path)
+
+    def sample(self) -> Optional[SoCSnapshot]:
+        temperature = self._get_temperature()
+        throttled = self._get_throttled()
+        if temperature is None and throttled is None:
+            return None
+        return SoCSnapshot(temperature, throttled)
+
+
+class StoredSnapshot(SnapshotSourceABC):
+    def __init__(self, store: SnapshotStore, key: str = "system"):
+        self._store = store
+        self._key = key
+
+    def get_snapshot(self) -> Any:
+        return self._store.get(self._key)
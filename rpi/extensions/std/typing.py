@@ -1,5 +1,5 @@
-from typing import Callable, Optional, Literal
+from typing import Any, Callable, Optional, Literal
 
 # For compatibility with MicroPython.
 # The MicroPython codebase will have its own implementation here.
-__all__ = ["Callable", "Optional", "Literal"]
+__all__ = ["Any", "Callable", "Optional", "Literal"]
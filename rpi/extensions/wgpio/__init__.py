@@ -1,19 +1,30 @@
-try:
-    import pigpio
-    from .gpio import InputGPIO, OutputGPIO, I2CGPIO
+import os
 
-    if not pigpio.pi().connected:
-        raise Exception(
-            "PiGPIO library could not be loaded, "
-            "fallback to Dummy GPIO for development."
-        )
+if os.environ.get("WGPIO_BACKEND") == "emulated":
+    from .emulatedio import InputGPIO, InputBank, OutputGPIO, I2CGPIO
 
-    __all__ = ["InputGPIO", "OutputGPIO", "I2CGPIO"]
+    __all__ = ["InputGPIO", "InputBank", "OutputGPIO", "I2CGPIO"]
 
-except Exception as error:
-    import logging
-    from .dummyio import InputGPIO, OutputGPIO, I2CGPIO
+else:
+    try:
+        from .connection import connection
+        from .gpio import InputGPIO, InputBank, OutputGPIO, I2CGPIO
 
-    logging.critical(error)
+        try:
+            # Opens the connection shared by every wrapper.
+            connection.get_pi()
+        except Exception:
+            raise Exception(
+                "PiGPIO library could not be loaded, "
+                "fallback to Dummy GPIO for development."
+            )
 
-    __all__ = ["InputGPIO", "OutputGPIO", "I2CGPIO"]
+        __all__ = ["InputGPIO", "InputBank", "OutputGPIO", "I2CGPIO"]
+
+    except Exception as error:
+        import logging
+        from .dummyio import InputGPIO, InputBank, OutputGPIO, I2CGPIO
+
+        logging.critical(error)
+
+        __all__ = ["InputGPIO", "InputBank", "OutputGPIO", "I2CGPIO"]
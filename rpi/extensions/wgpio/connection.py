@@ -0,0 +1,89 @@
+import atexit
+import functools
+import struct
+import threading
+import pigpio
+
+from extensions.std.typing import Callable, Optional
+
+# A lost daemon surfaces as a socket error, or as a short read that
+# pigpio fails to unpack.
+CONNECTION_ERRORS = (OSError, struct.error)
+
+
+class PiConnectionBase:
+    def __init__(self):
+        self._pi: Optional[pigpio.pi] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> pigpio.pi:
+        pi = pigpio.pi()
+        if not pi.connected:
+            raise Exception("Could not connect to the pigpio daemon.")
+        self._generation += 1
+        return pi
+
+    def _disconnect(self):
+        if self._pi is None:
+            return
+
+        try:
+            self._pi.stop()
+        except CONNECTION_ERRORS:
+            pass
+        self._pi = None
+
+
+class PiConnection(PiConnectionBase):
+    def __init__(self):
+        super().__init__()
+
+    def get_pi(self) -> pigpio.pi:
+        pi = self._pi
+        if pi is not None:
+            return pi
+
+        with self._lock:
+            if self._pi is None:
+                self._pi = self._connect()
+            return self._pi
+
+    def is_connected(self) -> bool:
+        return self._pi is not None
+
+    def get_generation(self) -> int:
+        # Incremented on every (re)connect, handles and callbacks that
+        # belong to an older generation are gone with the old daemon.
+        return self._generation
+
+    def reconnect(self, generation: int) -> pigpio.pi:
+        with self._lock:
+            # Another thread may already have replaced the failed connection.
+            if self._pi is None or self._generation == generation:
+                self._disconnect()
+                self._pi = self._connect()
+            return self._pi
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+
+def reconnecting(method: Callable) -> Callable:
+    # Retries a wrapper method once on a fresh connection if the daemon
+    # went away, the wrapper restores its own state in _get_pi().
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        generation = connection.get_generation()
+        try:
+            return method(self, *args, **kwargs)
+        except CONNECTION_ERRORS:
+            connection.reconnect(generation)
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+connection = PiConnection()
+atexit.register(connection.close)
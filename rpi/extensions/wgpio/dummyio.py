@@ -1,4 +1,7 @@
 # Dummy GPIO for development testing.
+import time
+
+from extensions.std.typing import Callable
 
 
 class InputGPIO:
@@ -17,6 +20,30 @@ class InputGPIO:
     def read(self) -> int:
         return 1
 
+    def set_glitch_filter(self, steady_us: int):
+        pass
+
+    def register_rising_callback(self, callback: Callable[[int, int, int], None]):
+        pass
+
+    def register_falling_callback(self, callback: Callable[[int, int, int], None]):
+        pass
+
+    def register_either_callback(self, callback: Callable[[int, int, int], None]):
+        pass
+
+    def cancel_callbacks(self):
+        pass
+
+
+class InputBank:
+    def __init__(self):
+        pass
+
+    def read(self) -> int:
+        # Every pin reads high, matching InputGPIO.read.
+        return 0xFFFFFFFF
+
 
 class OutputGPIO:
     def __init__(self, pin: int):
@@ -33,6 +60,9 @@ class I2CGPIO:
     def write_device(self, buffer: list[int]):
         pass
 
+    def sleep_us(self, microseconds: int):
+        time.sleep(microseconds / 1_000_000)
+
     def close(self):
         pass
 
@@ -0,0 +1,193 @@
+# Emulated HD44780 behind a PCF8574 I2C expander, for benchmarking
+# and asserting on display contents without hardware.
+from .dummyio import InputGPIO, InputBank, OutputGPIO
+
+from extensions.std.typing import Optional
+
+
+class BusStats:
+    def __init__(self):
+        self.transactions = 0
+        self.bytes = 0
+        self.commands = 0
+        self.data_writes = 0
+        self.sleep_us = 0
+
+    def copy(self) -> "BusStats":
+        stats = BusStats()
+        stats.transactions = self.transactions
+        stats.bytes = self.bytes
+        stats.commands = self.commands
+        stats.data_writes = self.data_writes
+        stats.sleep_us = self.sleep_us
+        return stats
+
+
+class HD44780:
+    # PCF8574 pin mapping, identical to LCDAPI.
+    RS = 0x01
+    RW = 0x02
+    EN = 0x04
+    BACKLIGHT = 0x08
+
+    def __init__(self, stats: BusStats):
+        self.stats = stats
+        self.ddram = bytearray(b" ") * 0x80
+        self.cgram = bytearray(64)
+        self.address = 0
+        self.cgram_mode = False
+        self.increment = True
+        self.four_bit = False
+        self.display_on = False
+        self.cursor_on = False
+        self.blink_on = False
+        self.backlight = False
+        self._pins = 0
+        self._nibble: Optional[int] = None
+
+    def _next_address(self) -> int:
+        if self.cgram_mode:
+            step = 1 if self.increment else -1
+            return (self.address + step) & 0x3F
+
+        if self.increment:
+            if self.address == 0x27:
+                return 0x40
+            if self.address == 0x67:
+                return 0x00
+            return self.address + 1
+
+        if self.address == 0x00:
+            return 0x67
+        if self.address == 0x40:
+            return 0x27
+        return self.address - 1
+
+    def _write_data(self, data: int):
+        self.stats.data_writes += 1
+        if self.cgram_mode:
+            self.cgram[self.address] = data & 0x1F
+        else:
+            self.ddram[self.address] = data
+        self.address = self._next_address()
+
+    def _write_command(self, cmd: int):
+        self.stats.commands += 1
+        if cmd & 0x80:
+            self.address = cmd & 0x7F
+            self.cgram_mode = False
+        elif cmd & 0x40:
+            self.address = cmd & 0x3F
+            self.cgram_mode = True
+        elif cmd & 0x20:
+            four_bit = not cmd & 0x10
+            if four_bit != self.four_bit:
+                self._nibble = None
+            self.four_bit = four_bit
+        elif cmd & 0x10:
+            if not cmd & 0x08:
+                self.address = self._next_address()
+        elif cmd & 0x08:
+            self.display_on = bool(cmd & 0x04)
+            self.cursor_on = bool(cmd & 0x02)
+            self.blink_on = bool(cmd & 0x01)
+        elif cmd & 0x04:
+            self.increment = bool(cmd & 0x02)
+        elif cmd & 0x02:
+            self.address = 0
+            self.cgram_mode = False
+        elif cmd & 0x01:
+            self.ddram[:] = bytearray(b" ") * 0x80
+            self.address = 0
+            self.cgram_mode = False
+            self.increment = True
+
+    def _latch(self, pins: int):
+        nibble = pins >> 4
+        if not self.four_bit:
+            # D0-D3 are not wired on the backpack, they read as zero.
+            byte = nibble << 4
+        elif self._nibble is None:
+            self._nibble = nibble
+            return
+        else:
+            byte = (self._nibble << 4) | nibble
+            self._nibble = None
+
+        if pins & self.RS:
+            self._write_data(byte)
+            return
+        self._write_command(byte)
+
+    def write_pins(self, pins: int):
+        # The controller latches the data lines on the falling edge of EN.
+        falling_edge = self._pins & self.EN and not pins & self.EN
+        self._pins = pins
+        self.backlight = bool(pins & self.BACKLIGHT)
+        if falling_edge and not pins & self.RW:
+            self._latch(pins)
+
+    def get_row(self, row: int, columns: int) -> bytes:
+        address = 0
+        if row & 1:
+            address += 0x40
+        if row & 2:
+            address += columns
+        return bytes(self.ddram[address : address + columns])
+
+    def get_rows(self, rows: int, columns: int) -> list[str]:
+        display_rows = []
+        for row in range(rows):
+            display_rows.append(self.get_row(row, columns).decode("latin-1"))
+        return display_rows
+
+
+class I2CGPIO:
+    def __init__(self, bus: int, address: int):
+        self.bus = bus
+        self.address = address
+        self.stats = BusStats()
+        self.lcd = HD44780(self.stats)
+        _devices[(bus, address)] = self
+
+    def write_device(self, buffer: list[int]):
+        self.stats.transactions += 1
+        self.stats.bytes += len(buffer)
+        for pins in buffer:
+            self.lcd.write_pins(pins)
+
+    def sleep_us(self, microseconds: int):
+        # Delays are accounted for, not slept.
+        self.stats.sleep_us += microseconds
+
+    def get_stats(self) -> BusStats:
+        return self.stats.copy()
+
+    def reset_stats(self):
+        # The controller counts into the same object as the bus.
+        self.stats = BusStats()
+        self.lcd.stats = self.stats
+
+    def close(self):
+        pass
+
+    def __del__(self):
+        self.close()
+
+
+_devices: dict[tuple[int, int], I2CGPIO] = {}
+
+
+def get_device(bus: int, address: int) -> Optional[I2CGPIO]:
+    return _devices.get((bus, address))
+
+
+__all__ = [
+    "InputGPIO",
+    "InputBank",
+    "OutputGPIO",
+    "I2CGPIO",
+    "BusStats",
+    "HD44780",
+    "get_device",
+]
@@ -1,74 +1,171 @@
+import time
 import pigpio
 
+from extensions.std.typing import Callable, Optional
+from extensions.wgpio.connection import connection, reconnecting
+
 # For compatibility with MicroPython.
 # The MicroPython codebase will have its own implementation here.
 
 
 class InputGPIOBase:
     def __init__(self, pin: int):
-        self._pi = pigpio.pi()
         self._pin = pin
+        self._generation = 0
+        self._pull: Optional[int] = None
+        self._steady_us: Optional[int] = None
+        self._edges: list[tuple[int, Callable[[int, int, int], None]]] = []
+        self._callbacks = []
+
+    def _get_pi(self) -> pigpio.pi:
+        pi = connection.get_pi()
+        if self._generation != connection.get_generation():
+            self._generation = connection.get_generation()
+            self._restore(pi)
+        return pi
+
+    def _restore(self, pi: pigpio.pi):
+        # Reapplies the daemon-side state after a (re)connect.
+        if self._pull is not None:
+            pi.set_pull_up_down(self._pin, self._pull)
+        if self._steady_us is not None:
+            pi.set_glitch_filter(self._pin, self._steady_us)
+        self._callbacks.clear()
+        for edge, callback in self._edges:
+            self._callbacks.append(pi.callback(self._pin, edge, callback))
 
     def _setup_input_mode(self):
-        self._pi.set_mode(self._pin, pigpio.INPUT)
+        self._get_pi().set_mode(self._pin, pigpio.INPUT)
+
+    def _set_pull(self, pull: int):
+        self._pull = pull
+        self._get_pi().set_pull_up_down(self._pin, pull)
+
+    def _register_callback(self, edge: int, callback: Callable[[int, int, int], None]):
+        pi = self._get_pi()
+        self._edges.append((edge, callback))
+        self._callbacks.append(pi.callback(self._pin, edge, callback))
 
 
 class InputGPIO(InputGPIOBase):
     def __init__(self, pin: int):
         super().__init__(pin)
 
+    @reconnecting
     def set_pull_up(self):
-        self._pi.set_pull_up_down(self._pin, pigpio.PUD_UP)
+        self._set_pull(pigpio.PUD_UP)
 
+    @reconnecting
     def set_pull_down(self):
-        self._pi.set_pull_up_down(self._pin, pigpio.PUD_DOWN)
+        self._set_pull(pigpio.PUD_DOWN)
 
+    @reconnecting
     def set_pull_off(self):
-        self._pi.set_pull_up_down(self._pin, pigpio.PUD_OFF)
+        self._set_pull(pigpio.PUD_OFF)
 
+    @reconnecting
     def read(self) -> int:
-        return self._pi.read(self._pin)
+        return self._get_pi().read(self._pin)
+
+    @reconnecting
+    def set_glitch_filter(self, steady_us: int):
+        self._steady_us = steady_us
+        self._get_pi().set_glitch_filter(self._pin, steady_us)
+
+    @reconnecting
+    def register_rising_callback(self, callback: Callable[[int, int, int], None]):
+        self._register_callback(pigpio.RISING_EDGE, callback)
+
+    @reconnecting
+    def register_falling_callback(self, callback: Callable[[int, int, int], None]):
+        self._register_callback(pigpio.FALLING_EDGE, callback)
+
+    @reconnecting
+    def register_either_callback(self, callback: Callable[[int, int, int], None]):
+        self._register_callback(pigpio.EITHER_EDGE, callback)
+
+    def cancel_callbacks(self):
+        for edge_callback in self._callbacks:
+            edge_callback.cancel()
+        self._callbacks.clear()
+        self._edges.clear()
+
+
+class InputBank:
+    def __init__(self):
+        pass
+
+    @reconnecting
+    def read(self) -> int:
+        # Levels of GPIO 0-31 in a single call, bit n holds GPIO n.
+        return connection.get_pi().read_bank_1()
 
 
 class OutputGPIOBase:
     def __init__(self, pin: int):
-        self._pi = pigpio.pi()
         self._pin = pin
-        self._setup_output_mode()
+        self._generation = 0
+        self._get_pi()
 
-    def _setup_output_mode(self):
-        self._pi.set_mode(self._pin, pigpio.OUTPUT)
+    def _get_pi(self) -> pigpio.pi:
+        pi = connection.get_pi()
+        if self._generation != connection.get_generation():
+            self._generation = connection.get_generation()
+            self._setup_output_mode(pi)
+        return pi
+
+    def _setup_output_mode(self, pi: pigpio.pi):
+        pi.set_mode(self._pin, pigpio.OUTPUT)
 
 
 class OutputGPIO(OutputGPIOBase):
     def __init__(self, pin: int):
         super().__init__(pin)
 
+    @reconnecting
     def write(self, state: bool):
-        self._pi.write(self._pin, state)
+        self._get_pi().write(self._pin, state)
 
 
 class I2CGPIOBase:
     def __init__(self, bus: int, address: int):
-        self._pi = pigpio.pi()
         self._bus = bus
         self._address = address
-        self._handle = self._setup_i2c()
+        self._generation = 0
+        self._handle: Optional[int] = None
+        self._get_pi()
+
+    def _get_pi(self) -> pigpio.pi:
+        pi = connection.get_pi()
+        if self._generation != connection.get_generation():
+            self._generation = connection.get_generation()
+            self._handle = self._setup_i2c(pi)
+        return pi
 
-    def _setup_i2c(self):
-        return self._pi.i2c_open(self._bus, self._address)
+    def _setup_i2c(self, pi: pigpio.pi) -> int:
+        return pi.i2c_open(self._bus, self._address)
 
 
 class I2CGPIO(I2CGPIOBase):
     def __init__(self, bus: int, address: int):
         super().__init__(bus, address)
 
+    @reconnecting
     def write_device(self, buffer: list[int]):
-        self._pi.i2c_write_device(self._handle, buffer)
+        pi = self._get_pi()
+        pi.i2c_write_device(self._handle, buffer)
+
+    def sleep_us(self, microseconds: int):
+        time.sleep(microseconds / 1_000_000)
 
     def close(self):
-        if hasattr(self, "_handle"):
-            self._pi.i2c_close(self._handle)
+        # The handle is only valid on the connection that opened it.
+        if self._handle is None:
+            return
+        if connection.is_connected():
+            if self._generation == connection.get_generation():
+                connection.get_pi().i2c_close(self._handle)
+        self._handle = None
 
     def __del__(self):
         self.close()
@@ -1,5 +1,6 @@
 import time
 from extensions.wgpio import I2CGPIO
+from extensions.std.typing import Optional
 
 
 class LCDAPI:
@@ -41,7 +42,14 @@ class LCDAPI:
     RS = 0x01  # Register select bit
     BACKLIGHT = 0x08  # Backlight bit
 
-    def __init__(self, bus: int, address: int, rows: int, columns: int):
+    def __init__(
+        self,
+        bus: int,
+        address: int,
+        rows: int,
+        columns: int,
+        batched: bool = False,
+    ):
         self.rows = rows
         self.columns = columns
         self.gpio = I2CGPIO(bus, address)
@@ -49,7 +57,14 @@ class LCDAPI:
         self.cursor_y = 0
         self.implied_newline = False
         self.backlight = True
+        # Mirror of the controller's address counter, None while unknown
+        # or while it points into CGRAM.
+        self.address: Optional[int] = None
+        # The initialization sequence relies on the explicit delays,
+        # batching is only enabled once the controller is in 4-bit mode.
+        self.batched = False
         self.initialize_display()
+        self.batched = batched
 
     def initialize_display(self):
         self.display_off()
@@ -59,6 +74,7 @@ class LCDAPI:
         self.set_entry_mode()
         self.hide_cursor()
         self.display_on()
+        self.address = None
 
     def initialize_4bit_mode(self):
         self.hal_send_bytes(0x03, mode=0)
@@ -124,15 +140,20 @@ class LCDAPI:
     def get_backlight_state(self) -> bool:
         return self.backlight
 
-    def move_to(self, cursor_x: int, cursor_y: int):
-        self.cursor_x = cursor_x
-        self.cursor_y = cursor_y
+    def get_address(self, cursor_x: int, cursor_y: int) -> int:
         addr = cursor_x & 0x3F
         if cursor_y & 1:
             addr += 0x40  # Lines 1 & 3 add 0x40
         if cursor_y & 2:  # Lines 2 & 3 add number of columns
             addr += self.columns
-        self.hal_write_command(self.LCD_DDRAM | addr)
+        return addr
+
+    def move_to(self, cursor_x: int, cursor_y: int):
+        self.cursor_x = cursor_x
+        self.cursor_y = cursor_y
+        addr = self.get_address(cursor_x, cursor_y)
+        if addr != self.address:
+            self.hal_write_command(self.LCD_DDRAM | addr)
 
     def handle_new_line(self):
         if self.implied_newline:
@@ -165,6 +186,25 @@ class LCDAPI:
         for char in string:
             self.put_character(char)
 
+    def put_character_codes(self, char_codes: list[int]):
+        idx = 0
+        while idx < len(char_codes):
+            available = self.columns - self.cursor_x
+            run = char_codes[idx : idx + available]
+            self.hal_write_data_run(run)
+            self.cursor_x += len(run)
+            idx += len(run)
+
+            # Within a row the address counter already matches the cursor,
+            # only a wrap onto the next row needs a new DDRAM address.
+            if self.cursor_x >= self.columns:
+                self.cursor_x = 0
+                self.cursor_y += 1
+                self.implied_newline = True
+                if self.cursor_y >= self.rows:
+                    self.cursor_y = 0
+                self.move_to(self.cursor_x, self.cursor_y)
+
     def put_custom_char(self, location: int, charmap: list[int]) -> None:
         location &= 0x7
         self.hal_write_command(self.LCD_CGRAM | (location << 3))
@@ -182,13 +222,75 @@ class LCDAPI:
         self.BACKLIGHT = 0x00
         self.gpio.write_device([self.BACKLIGHT])
 
+    def hal_track_command(self, cmd: int):
+        if cmd & self.LCD_DDRAM:
+            self.address = cmd & 0x7F
+        elif cmd & self.LCD_CGRAM:
+            self.address = None
+        elif cmd & 0xF0 == self.LCD_MOVE:
+            self.address = None
+        elif cmd in (self.LCD_CLR, self.LCD_HOME):
+            self.address = 0
+
+    def hal_track_data(self, count: int):
+        # In LCD_ENTRY_INC mode the counter advances after every write,
+        # in 2-line mode it runs 0x00-0x27 then 0x40-0x67 and wraps around.
+        if self.address is None:
+            return
+        for _ in range(count):
+            if self.address == 0x27:
+                self.address = 0x40
+            elif self.address == 0x67:
+                self.address = 0x00
+            else:
+                self.address += 1
+
     def hal_write_command(self, cmd):
         self.hal_send_bytes(cmd, mode=0)
+        self.hal_track_command(cmd)
+        if self.batched and cmd in (self.LCD_CLR, self.LCD_HOME):
+            # Clear and home take ~1.52ms, without the per-pulse delays
+            # the next transfer could otherwise arrive while still busy.
+            self.hal_sleep_us(2000)
 
     def hal_write_data(self, data):
         self.hal_send_bytes(data, mode=self.RS)
+        self.hal_track_data(1)
+
+    def hal_write_data_run(self, data: list[int]):
+        if self.batched:
+            buffer = []
+            for char_code in data:
+                buffer.extend(self.hal_encode_bytes(char_code, mode=self.RS))
+            if buffer:
+                self.gpio.write_device(buffer)
+            self.hal_track_data(len(data))
+            return
+
+        for char_code in data:
+            self.hal_write_data(char_code)
+
+    def hal_encode_bytes(self, data: int, mode: int) -> list[int]:
+        high_bits = mode | (data & 0xF0) | self.BACKLIGHT
+        low_bits = mode | ((data << 4) & 0xF0) | self.BACKLIGHT
+
+        # Each nibble is latched on the falling edge of EN, at standard
+        # I2C clock rates the byte transfer time alone satisfies both the
+        # enable pulse width and the instruction execution time.
+        return [
+            high_bits,
+            high_bits | self.EN,
+            high_bits & ~self.EN,
+            low_bits,
+            low_bits | self.EN,
+            low_bits & ~self.EN,
+        ]
 
     def hal_send_bytes(self, data: int, mode: int):
+        if self.batched:
+            self.gpio.write_device(self.hal_encode_bytes(data, mode))
+            return
+
         high_bits = mode | (data & 0xF0) | self.BACKLIGHT
         low_bits = mode | ((data << 4) & 0xF0) | self.BACKLIGHT
 
@@ -206,9 +308,8 @@ class LCDAPI:
         self.gpio.write_device([data & ~self.EN])
         self.hal_sleep_us(50)
 
-    @staticmethod
-    def hal_sleep_us(microseconds: int):
-        time.sleep(microseconds / 1_000_000)
+    def hal_sleep_us(self, microseconds: int):
+        self.gpio.sleep_us(microseconds)
 
     @staticmethod
     def hal_sleep_ms(milliseconds: int):
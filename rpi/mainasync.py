@@ -0,0 +1,209 @@
+import time
+import asyncio
+
+from options.abstracts import OptionABC
+from menu.coordinator import MenuCoordinator
+from writers.abstracts import WriterABC
+from writers.lcd_frame_writer import LCDFrameWriter
+from writers.lcd_group_writer import LCDGroupWriter
+from writers.async_writer import AsyncWriter
+from controllers.event_controller import EventController
+from controllers.rotary_controller import RotaryController
+
+from configurations import CtrlConfigABC, RotaryConfigABC, LCDConfigABC
+from configurations import CtrlConfig, LCD1602Config
+
+from menu.tickrate import Tickrate
+from menu.scheduler import RenderScheduler
+from menu.instrumentation import Instrumentation
+from menu.setups.default.main import MainMenu
+from extensions.acquisition import AcquisitionService
+from main import get_instrumentation
+
+from character.frame import Frame
+from extensions.std.typing import Optional
+
+# For interchangeable compatibility with MicroPython
+from collections import OrderedDict as OrdDict
+
+
+class AsyncMenuHandler:
+    def __init__(
+        self,
+        ctrl_config: CtrlConfigABC | RotaryConfigABC,
+        lcd_config: LCDConfigABC,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        self.tick_rate = Tickrate(40)
+        self.ctrl_config = ctrl_config
+        self.lcd_config = lcd_config
+        self.instrumentation = instrumentation
+        # Sensors and psutil are sampled on the acquisition thread, options
+        # only read the stored snapshots.
+        self.acquisition = self.get_acquisition()
+        self.writer = self.get_async_writer()
+        self.main_menu = self.get_main_menu()
+        self.menu_coord = self.get_menu_coord()
+        self.controller = self.get_controller()
+        self.scheduler = self.get_scheduler()
+        self.input_poll = 0.1
+        self.menu_lock = asyncio.Lock()
+        self.render_request = asyncio.Event()
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_controller(self) -> EventController | RotaryController:
+        if isinstance(self.ctrl_config, RotaryConfigABC):
+            controller = RotaryController(self.ctrl_config)
+        else:
+            controller = EventController(self.ctrl_config)
+        controller.register_back_callback(self.back_option)
+        controller.register_prev_callback(self.decrement_option)
+        controller.register_next_callback(self.increment_option)
+        controller.register_apply_callback(self.apply_option)
+        return controller
+
+    def get_main_menu(self) -> OrdDict[OptionABC, OrdDict]:
+        main_menu = MainMenu(
+            self.writer,
+            self.lcd_config,
+            self.tick_rate,
+            self.instrumentation,
+            self.acquisition,
+        )
+        menu = main_menu.get_menu()
+        return menu
+
+    def get_lcd_writer(self) -> WriterABC:
+        rows = self.lcd_config.lcd_rows
+        columns = self.lcd_config.lcd_columns
+        bus = self.lcd_config.lcd_bus
+        addresses = self.lcd_config.lcd_addresses
+        if len(addresses) > 1:
+            # Every display mirrors the menu, the frame is rendered once.
+            writer = LCDGroupWriter(rows, columns, bus, addresses)
+            return writer
+
+        writer = LCDFrameWriter(rows, columns, bus, addresses[0])
+        return writer
+
+    def get_async_writer(self) -> AsyncWriter:
+        writer = AsyncWriter(self.get_lcd_writer())
+        return writer
+
+    def get_acquisition(self) -> AcquisitionService:
+        acquisition = AcquisitionService()
+        acquisition.set_instrumentation(self.instrumentation)
+        return acquisition
+
+    def get_scheduler(self) -> RenderScheduler:
+        scheduler = RenderScheduler(self.tick_rate)
+        return scheduler
+
+    def get_menu_coord(self) -> MenuCoordinator:
+        rows = self.lcd_config.lcd_rows
+        columns = self.lcd_config.lcd_columns
+        menu_coord = MenuCoordinator(rows, columns, self.main_menu)
+        menu_coord.set_instrumentation(self.instrumentation)
+        return menu_coord
+
+    def request_render(self):
+        # Input callbacks run in a worker thread, the event belongs to the loop.
+        self.event_loop.call_soon_threadsafe(self.render_request.set)
+
+    def increment_option(self):
+        self.menu_coord.increment_selection()
+        self.request_render()
+
+    def decrement_option(self):
+        self.menu_coord.decrement_selection()
+        self.request_render()
+
+    def apply_option(self):
+        self.menu_coord.apply_selection()
+        self.request_render()
+
+    def back_option(self):
+        self.menu_coord.back_selection()
+        self.request_render()
+
+    def record(self, stage: str, duration: float):
+        if self.instrumentation is not None:
+            self.instrumentation.record(stage, duration)
+
+    def get_timeout(self) -> float:
+        options = self.menu_coord.get_visible_options()
+        timeout = self.scheduler.get_timeout(options, time.monotonic())
+        return timeout
+
+    async def wait_render_request(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self.render_request.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self.render_request.clear()
+        return True
+
+    def get_due_frame(self) -> Optional[Frame]:
+        options = self.menu_coord.get_visible_options()
+        due_options = self.scheduler.get_due_options(options, time.monotonic())
+        if not due_options:
+            return None
+
+        self.record("jitter", self.scheduler.get_lateness())
+        return self.menu_coord.get_frame(due_options)
+
+    async def get_frame(self, requested: bool) -> Optional[Frame]:
+        # Option updates may sample slow data, they run in a worker thread
+        # while the lock keeps input dispatch away from the coordinator.
+        async with self.menu_lock:
+            st_time = time.perf_counter()
+            if requested:
+                frame = await asyncio.to_thread(self.menu_coord.get_frame)
+            else:
+                frame = await asyncio.to_thread(self.get_due_frame)
+            if frame is not None:
+                self.record("render", time.perf_counter() - st_time)
+            return frame
+
+    async def input_task(self):
+        while True:
+            event = await asyncio.to_thread(self.controller.get_event, self.input_poll)
+            if event is None:
+                continue
+
+            # Actions may write to the display (e.g. the backlight), they
+            # run in a worker thread so the loop keeps rendering.
+            async with self.menu_lock:
+                st_time = time.perf_counter()
+                await asyncio.to_thread(self.controller.dispatch_event, event)
+                self.record("input", time.perf_counter() - st_time)
+
+    async def render_task(self):
+        self.render_request.set()
+        while True:
+            requested = await self.wait_render_request(self.get_timeout())
+            frame = await self.get_frame(requested)
+            if frame is not None:
+                st_time = time.perf_counter()
+                await self.writer.write_frame_async(frame, 0.0)
+                self.record("write", time.perf_counter() - st_time)
+
+    async def close(self):
+        # Joining waits for a sample in progress, e.g. a DHT read.
+        await asyncio.to_thread(self.acquisition.stop)
+
+    async def run(self):
+        self.event_loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(self.input_task(), self.render_task())
+        finally:
+            await self.close()
+
+
+if __name__ == "__main__":
+    ctrl_config = CtrlConfig()
+    lcd_config = LCD1602Config()
+    instrumentation = get_instrumentation()
+
+    menu_handler = AsyncMenuHandler(ctrl_config, lcd_config, instrumentation)
+    asyncio.run(menu_handler.run())
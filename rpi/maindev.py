@@ -1,14 +1,24 @@
+import os
 import time
+import signal
 
 from options.abstracts import OptionABC
 from menu.coordinator import MenuCoordinator
-from writers.lcd_writer import LCDWriter
+from writers.abstracts import WriterABC
+from writers.lcd_frame_writer import LCDFrameWriter
+from writers.lcd_group_writer import LCDGroupWriter
+from controllers.event_controller import EventController
+from controllers.rotary_controller import RotaryController
 from controllers.gpio_controller import Controller
 
-from configurations import CtrlConfigABC, LCDConfigABC
+from configurations import CtrlConfigABC, RotaryConfigABC, LCDConfigABC
 from configurations import CtrlConfig, LCD1602Config
 
 from menu.tickrate import Tickrate
+from menu.scheduler import RenderScheduler
+from menu.instrumentation import Instrumentation
+from extensions.acquisition import AcquisitionService
+from extensions.std.typing import Callable, Optional
 from menu.setups.dev.main import MainMenu
 
 # For interchangeable compatibility with MicroPython
@@ -16,17 +26,36 @@ from collections import OrderedDict as OrdDict
 
 
 class MenuHandler:
-    def __init__(self, ctrl_config: CtrlConfigABC, lcd_config: LCDConfigABC):
+    def __init__(
+        self,
+        ctrl_config: CtrlConfigABC | RotaryConfigABC,
+        lcd_config: LCDConfigABC,
+        instrumentation: Optional[Instrumentation] = None,
+        polled: bool = False,
+    ):
         self.tick_rate = Tickrate(40)
+        # Opt-in: read all buttons with one bank read per poll instead of
+        # edge callbacks, for boards where callbacks are unreliable.
+        self.polled = polled
+        self.poll_interval = 0.01
         self.ctrl_config = ctrl_config
         self.lcd_config = lcd_config
+        self.instrumentation = instrumentation
+        self.action_time = 0.0
+        self.acquisition = self.get_acquisition()
         self.writer = self.get_lcd_writer()
         self.main_menu = self.get_main_menu()
         self.menu_coord = self.get_menu_coord()
         self.controller = self.get_controller()
-
-    def get_controller(self) -> Controller:
-        controller = Controller(self.ctrl_config)
+        self.scheduler = self.get_scheduler()
+
+    def get_controller(self) -> EventController | RotaryController | Controller:
+        if isinstance(self.ctrl_config, RotaryConfigABC):
+            controller = RotaryController(self.ctrl_config)
+        elif self.polled:
+            controller = Controller(self.ctrl_config)
+        else:
+            controller = EventController(self.ctrl_config)
         controller.register_back_callback(self.back_option)
         controller.register_prev_callback(self.decrement_option)
         controller.register_next_callback(self.increment_option)
@@ -34,64 +63,175 @@ class MenuHandler:
         return controller
 
     def get_main_menu(self) -> OrdDict[OptionABC, OrdDict]:
-        main_menu = MainMenu(self.writer, self.lcd_config, self.tick_rate)
+        main_menu = MainMenu(
+            self.writer,
+            self.lcd_config,
+            self.tick_rate,
+            self.instrumentation,
+            self.acquisition,
+        )
         menu = main_menu.get_menu()
         return menu
 
-    def get_lcd_writer(self) -> LCDWriter:
+    def get_lcd_writer(self) -> WriterABC:
         rows = self.lcd_config.lcd_rows
         columns = self.lcd_config.lcd_columns
-        writer = LCDWriter(rows, columns)
+        bus = self.lcd_config.lcd_bus
+        addresses = self.lcd_config.lcd_addresses
+        if len(addresses) > 1:
+            # Every display mirrors the menu, the frame is rendered once.
+            writer = LCDGroupWriter(rows, columns, bus, addresses)
+            return writer
+
+        writer = LCDFrameWriter(rows, columns, bus, addresses[0])
         return writer
 
+    def get_acquisition(self) -> AcquisitionService:
+        acquisition = AcquisitionService()
+        acquisition.set_instrumentation(self.instrumentation)
+        return acquisition
+
+    def get_scheduler(self) -> RenderScheduler:
+        scheduler = RenderScheduler(self.tick_rate)
+        return scheduler
+
     def get_menu_coord(self) -> MenuCoordinator:
         rows = self.lcd_config.lcd_rows
         columns = self.lcd_config.lcd_columns
         menu_coord = MenuCoordinator(rows, columns, self.main_menu)
+        menu_coord.set_instrumentation(self.instrumentation)
         return menu_coord
 
+    def render(self, due_options: Optional[list[OptionABC]] = None):
+        if self.instrumentation is None:
+            frame = self.menu_coord.get_frame(due_options)
+            self.writer.write_frame(frame, 0.0)
+            return
+
+        st_time = time.perf_counter()
+        frame = self.menu_coord.get_frame(due_options)
+        md_time = time.perf_counter()
+        self.writer.write_frame(frame, 0.0)
+        en_time = time.perf_counter()
+        self.instrumentation.record("render", md_time - st_time)
+        self.instrumentation.record("write", en_time - md_time)
+
+    def handle_input(self, action: Callable[[], None]):
+        if self.instrumentation is None:
+            action()
+            self.render()
+            return
+
+        st_time = time.perf_counter()
+        action()
+        md_time = time.perf_counter()
+        self.render()
+        en_time = time.perf_counter()
+        self.instrumentation.record("input", md_time - st_time)
+        self.action_time += en_time - st_time
+
     def increment_option(self):
-        self.menu_coord.increment_selection()
-        chars = self.menu_coord.get_chars()
-        self.writer.write(chars, 0.0)
+        self.handle_input(self.menu_coord.increment_selection)
 
     def decrement_option(self):
-        self.menu_coord.decrement_selection()
-        chars = self.menu_coord.get_chars()
-        self.writer.write(chars, 0.0)
+        self.handle_input(self.menu_coord.decrement_selection)
 
     def apply_option(self):
-        self.menu_coord.apply_selection()
-        chars = self.menu_coord.get_chars()
-        self.writer.write(chars, 0.0)
+        self.handle_input(self.menu_coord.apply_selection)
 
     def back_option(self):
-        self.menu_coord.back_selection()
-        chars = self.menu_coord.get_chars()
-        self.writer.write(chars, 0.0)
+        self.handle_input(self.menu_coord.back_selection)
 
     def update_options(self):
-        chars = self.menu_coord.get_chars()
-        self.writer.write(chars, 0.0)
+        self.render()
+
+    def update_due_options(self):
+        options = self.menu_coord.get_visible_options()
+        due_options = self.scheduler.get_due_options(options, time.monotonic())
+        if due_options:
+            self.render(due_options)
+            if self.instrumentation is not None:
+                lateness = self.scheduler.get_lateness()
+                self.instrumentation.record("jitter", lateness)
+
+    def get_timeout(self) -> float:
+        options = self.menu_coord.get_visible_options()
+        timeout = self.scheduler.get_timeout(options, time.monotonic())
+        return timeout
+
+    def record_check(self, check: Callable[[], None]):
+        if self.instrumentation is None:
+            check()
+            return
+
+        # The actions a check triggers are timed as "input" and "render",
+        # "check" is what is left.
+        self.action_time = 0.0
+        st_time = time.perf_counter()
+        check()
+        en_time = time.perf_counter()
+        self.instrumentation.record("check", en_time - st_time - self.action_time)
+
+    def dispatch_events(self, event: Optional[int]):
+        while event is not None:
+            self.controller.dispatch_event(event)
+            event = self.controller.get_event(0.0)
+
+    def poll_input(self, timeout: float):
+        # One bank read per poll, sleeping in between until the deadline.
+        deadline = time.monotonic() + timeout
+        while True:
+            self.record_check(self.controller.check)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                return
+            time.sleep(min(self.poll_interval, remaining))
+
+    def check_input(self, timeout: float):
+        if self.polled and isinstance(self.controller, Controller):
+            self.poll_input(timeout)
+            return
+
+        if self.instrumentation is None:
+            self.controller.check(timeout)
+            return
+
+        # Waiting for an event is idle time and is not part of the check.
+        event = self.controller.get_event(timeout)
+        self.record_check(lambda: self.dispatch_events(event))
+
+    def close(self):
+        self.acquisition.stop()
 
     def loop(self):
-        chars = self.menu_coord.get_chars()
-        self.writer.write(chars, 0.0)
-        counter = 0
+        self.update_options()
 
-        while True:
-            counter += 1
-            self.controller.check()
-            if counter >= self.tick_rate.get_tickrate():
-                self.update_options()
-                counter = 0
+        try:
+            while True:
+                # Blocks on the input queue until an event or the next deadline.
+                self.check_input(self.get_timeout())
+                self.update_due_options()
+        finally:
+            self.close()
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    # MENU_STATS=<path> enables the Stats page, SIGUSR1 dumps it to <path>.
+    path = os.environ.get("MENU_STATS")
+    if not path:
+        return None
 
-            time.sleep(0.01)
+    instrumentation = Instrumentation()
+    signal.signal(signal.SIGUSR1, lambda *_: instrumentation.dump(path))
+    return instrumentation
 
 
 if __name__ == "__main__":
     ctrl_config = CtrlConfig()
     lcd_config = LCD1602Config()
+    instrumentation = get_instrumentation()
+    # MENU_POLLED=1 selects the polled bank-read Controller.
+    polled = os.environ.get("MENU_POLLED") == "1"
 
-    menu_handler = MenuHandler(ctrl_config, lcd_config)
+    menu_handler = MenuHandler(ctrl_config, lcd_config, instrumentation, polled)
     menu_handler.loop()
@@ -1,6 +1,10 @@
+import time
+
 from options.abstracts import OptionABC
-from character.abstracts import CharABC
-from character.chars import SpaceChar
+from character.abstracts import CharABC, CustomCharABC
+from character.chars import char_table
+from character.frame import Frame
+from menu.instrumentation import Instrumentation
 
 from extensions.std.typing import Optional
 
@@ -15,6 +19,15 @@ class MenuCoordinatorBase:
         self._selected: int = 0
         self._options: OrdDict[OptionABC, OrdDict] = options
         self._entries: list[tuple[int, OptionABC]] = []
+        self._level_options: Optional[OrdDict[OptionABC, OrdDict]] = None
+        self._level_options_list: Optional[list[OptionABC]] = None
+        self._blank_row: list[CharABC] = [char_table.get_space_char()] * columns
+        self._blank_code_row = (
+            bytes([char_table.get_space_char().get_value()]) * columns
+        )
+        self._instrumentation: Optional[Instrumentation] = None
+        self._frame: Optional[Frame] = None
+        self._frame_options: list[OptionABC] = []
         self._initiate_options(self._options)
 
     def _initiate_options(self, options: OrdDict[OptionABC, OrdDict]):
@@ -23,7 +36,14 @@ class MenuCoordinatorBase:
             option_item.set_selected(True)
             return
 
+    def _invalidate_level(self):
+        self._level_options = None
+        self._level_options_list = None
+
     def _get_options(self) -> OrdDict[OptionABC, OrdDict]:
+        if self._level_options is not None:
+            return self._level_options
+
         options = self._options
         for _, entry_option in self._entries:
             if entry_option in options:
@@ -33,11 +53,16 @@ class MenuCoordinatorBase:
             self._selected = 0
             option = list(options)[0]
             option.get_item().set_selected(True)
+        self._level_options = options
         return options
 
     def _get_options_list(self) -> list[OptionABC]:
+        if self._level_options_list is not None:
+            return self._level_options_list
+
         options = self._get_options()
         options_list = list(options)
+        self._level_options_list = options_list
         return options_list
 
     def _get_option_range(self) -> tuple[int, int]:
@@ -62,6 +87,8 @@ class MenuCoordinatorBase:
     def _add_entry(self, option: OptionABC):
         options = self._get_options()
         option.apply()
+        # Applying may mutate the menu, e.g. AddDeviceMenu adding a device.
+        self._invalidate_level()
         if option in options:
             new_options = options[option]
             if new_options:
@@ -76,15 +103,57 @@ class MenuCoordinatorBase:
         if self._entries:
             entry_idx, _ = self._entries.pop(-1)
             self._selected = entry_idx
+            self._invalidate_level()
 
             option.get_item().set_selected(False)
             option.get_item().reset()
 
-    def _get_option(
-        self, options_list: list[OptionABC], idx: int
-    ) -> Optional[OptionABC]:
-        if len(options_list) > idx:
-            return options_list[idx]
+    def _update_option(self, option: OptionABC) -> bool:
+        if self._instrumentation is None:
+            dirty = option.update()
+            option.update_shift()
+            return dirty or option.is_dirty()
+
+        st_time = time.perf_counter()
+        dirty = option.update()
+        option.update_shift()
+        en_time = time.perf_counter()
+        name = option.get_name()
+        self._instrumentation.record_option(name, en_time - st_time)
+        return dirty or option.is_dirty()
+
+    def _update_options(
+        self, options: list[OptionABC], due_options: Optional[list[OptionABC]]
+    ) -> bool:
+        # Due rows are updated before any row is read, so the frame shows
+        # the values sampled at their deadline and not the previous ones.
+        dirty = False
+        for option in options:
+            if due_options is None or option in due_options:
+                if self._update_option(option):
+                    dirty = True
+        return dirty
+
+    def _is_frame_current(self, options: list[OptionABC]) -> bool:
+        # Navigation marks items dirty or shows other options, scrolling
+        # the level shows the same options at other rows.
+        if self._frame is None or options != self._frame_options:
+            return False
+        for option in options:
+            if option.is_dirty():
+                return False
+        return True
+
+    def _get_frame(self, rows: list[bytes], glyphs: dict[int, CustomCharABC]) -> Frame:
+        # A screen where no row changed hands out the previous Frame, so
+        # writers can skip it without looking at the rows.
+        frame = self._frame
+        if frame is not None and len(frame.rows) == len(rows):
+            if all(map(bytes.__eq__, frame.rows, rows)) and frame.glyphs == glyphs:
+                return frame
+
+        self._frame = Frame(rows, glyphs)
+        return self._frame
 
 
 class MenuCoordinator(MenuCoordinatorBase):
@@ -137,27 +206,52 @@ class MenuCoordinator(MenuCoordinatorBase):
         self._set_option_selected(new_option)
         self._selected = new_select
 
-    def get_chars(self) -> list[list[CharABC]]:
+    def get_visible_options(self) -> list[OptionABC]:
         st_range, en_range = self._get_option_range()
         options_list = self._get_options_list()
+        return options_list[st_range:en_range]
+
+    def get_chars(
+        self, due_options: Optional[list[OptionABC]] = None
+    ) -> list[list[CharABC]]:
+        options = self.get_visible_options()
+        self._update_options(options, due_options)
 
         chars: list[list[CharABC]] = []
-        added_rows = 0
-        for idx in range(st_range, en_range):
-            option = self._get_option(options_list, idx)
-            if option:
-                option_name = option.get_char_array()
-                option.update()
-                option.update_shift()
-                chars.append(option_name)
-                added_rows += 1
-
-        for _ in range(self._rows - added_rows):
-            row_spaces: list[CharABC] = [SpaceChar()] * self._columns
-            chars.append(row_spaces)
+        for option in options:
+            chars.append(option.get_char_array())
+
+        for _ in range(self._rows - len(chars)):
+            chars.append(self._blank_row)
 
         return chars
 
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]):
+        self._instrumentation = instrumentation
+
+    def invalidate(self):
+        self._invalidate_level()
+
+    def get_frame(self, due_options: Optional[list[OptionABC]] = None) -> Frame:
+        options = self.get_visible_options()
+        dirty = self._update_options(options, due_options)
+        if not dirty and self._is_frame_current(options):
+            return self._frame
+
+        rows: list[bytes] = []
+        glyphs = {}
+        for option in options:
+            rows.append(option.get_code_array())
+            item_glyphs = option.get_item().get_glyphs()
+            if item_glyphs:
+                glyphs.update(item_glyphs)
+
+        for _ in range(self._rows - len(rows)):
+            rows.append(self._blank_code_row)
+
+        self._frame_options = options
+        return self._get_frame(rows, glyphs)
+
     def apply_selection(self):
         options_list = self._get_options_list()
         option = options_list[self._selected]
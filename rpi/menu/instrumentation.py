@@ -0,0 +1,110 @@
+import json
+import threading
+from collections import deque
+
+from extensions.std.typing import Optional
+
+
+class StageStats:
+    def __init__(self, size: int):
+        self.durations: deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, duration: float):
+        self.durations.append(duration)
+        self.count += 1
+
+    def get_last(self) -> float:
+        if self.durations:
+            return self.durations[-1]
+        return 0.0
+
+    def get_average(self) -> float:
+        if self.durations:
+            return sum(self.durations) / len(self.durations)
+        return 0.0
+
+    def get_maximum(self) -> float:
+        if self.durations:
+            return max(self.durations)
+        return 0.0
+
+    def get_dump(self) -> dict:
+        dump = {
+            "count": self.count,
+            "last": self.get_last(),
+            "average": self.get_average(),
+            "maximum": self.get_maximum(),
+        }
+        return dump
+
+
+class InstrumentationBase:
+    def __init__(self, size: int):
+        self._size = size
+        self._stages: dict[str, StageStats] = {}
+        self._options: dict[str, StageStats] = {}
+        # Sources are recorded on the acquisition thread.
+        self._sources: dict[str, StageStats] = {}
+        self._sources_lock = threading.Lock()
+
+    def _get_stats(self, stages: dict[str, StageStats], name: str) -> StageStats:
+        stats = stages.get(name)
+        if stats is None:
+            stats = StageStats(self._size)
+            stages[name] = stats
+        return stats
+
+    def _get_slowest(
+        self, stages: dict[str, StageStats]
+    ) -> Optional[tuple[str, float]]:
+        slowest = None
+        for name, stats in stages.items():
+            average = stats.get_average()
+            if slowest is None or average > slowest[1]:
+                slowest = (name, average)
+        return slowest
+
+    def _get_dumps(self, stages: dict[str, StageStats]) -> dict:
+        dumps = {}
+        for name, stats in stages.items():
+            dumps[name] = stats.get_dump()
+        return dumps
+
+
+class Instrumentation(InstrumentationBase):
+    def __init__(self, size: int = 256):
+        super().__init__(size)
+
+    def record(self, stage: str, duration: float):
+        self._get_stats(self._stages, stage).add(duration)
+
+    def record_option(self, name: str, duration: float):
+        self._get_stats(self._options, name).add(duration)
+
+    def record_source(self, key: str, duration: float):
+        with self._sources_lock:
+            self._get_stats(self._sources, key).add(duration)
+
+    def get_stage(self, stage: str) -> StageStats:
+        return self._get_stats(self._stages, stage)
+
+    def get_slowest_option(self) -> Optional[tuple[str, float]]:
+        return self._get_slowest(self._options)
+
+    def get_slowest_source(self) -> Optional[tuple[str, float]]:
+        with self._sources_lock:
+            return self._get_slowest(self._sources)
+
+    def get_dump(self) -> dict:
+        stages = self._get_dumps(self._stages)
+        options = self._get_dumps(self._options)
+        with self._sources_lock:
+            sources = self._get_dumps(self._sources)
+
+        dump = {"stages": stages, "options": options, "sources": sources}
+        return dump
+
+    def dump(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.get_dump(), file, indent=2)
@@ -0,0 +1,78 @@
+from menu.tickrate import Tickrate
+from options.abstracts import OptionABC
+
+
+class RenderSchedulerBase:
+    def __init__(self, tick_rate: Tickrate):
+        self._tick_rate = tick_rate
+        self._deadlines: dict[OptionABC, float] = {}
+        self._lateness: float = 0.0
+
+    def _get_interval(self, option: OptionABC) -> float:
+        interval = option.get_refresh_interval()
+        if interval is None:
+            return self._tick_rate.get_interval()
+        return interval
+
+    def _get_deadline(self, option: OptionABC, now: float) -> float:
+        # Options seen for the first time were just rendered by the
+        # navigation that revealed them, and a shortened interval
+        # (e.g. through the Tickrate option) takes effect immediately.
+        latest = now + self._get_interval(option)
+        deadline = self._deadlines.get(option, latest)
+        if deadline > latest:
+            deadline = latest
+        self._deadlines[option] = deadline
+        return deadline
+
+    def _advance_deadline(self, option: OptionABC, now: float):
+        interval = self._get_interval(option)
+        deadline = self._deadlines[option] + interval
+        if deadline <= now:
+            deadline = now + interval
+        self._deadlines[option] = deadline
+
+    def _drop_hidden(self, options: list[OptionABC]):
+        # Every visible option has a deadline, extra entries belong to
+        # hidden or deleted options. A hidden option gets a new deadline
+        # when it is shown again.
+        if len(self._deadlines) <= len(options):
+            return
+        deadlines = {}
+        for option in options:
+            deadlines[option] = self._deadlines[option]
+        self._deadlines = deadlines
+
+
+class RenderScheduler(RenderSchedulerBase):
+    def __init__(self, tick_rate: Tickrate):
+        super().__init__(tick_rate)
+
+    def get_timeout(self, options: list[OptionABC], now: float) -> float:
+        if not options:
+            return self._tick_rate.get_interval()
+
+        deadline = min(self._get_deadline(option, now) for option in options)
+        self._drop_hidden(options)
+        timeout = deadline - now
+        if timeout < 0.0:
+            return 0.0
+        return timeout
+
+    def get_due_options(self, options: list[OptionABC], now: float) -> list[OptionABC]:
+        due_options = []
+        lateness = 0.0
+        for option in options:
+            deadline = self._get_deadline(option, now)
+            if deadline <= now:
+                lateness = max(lateness, now - deadline)
+                self._advance_deadline(option, now)
+                due_options.append(option)
+        self._drop_hidden(options)
+        if due_options:
+            self._lateness = lateness
+        return due_options
+
+    def get_lateness(self) -> float:
+        # How far behind its deadline the most overdue option was rendered.
+        return self._lateness
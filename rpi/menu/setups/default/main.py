@@ -1,6 +1,9 @@
 from menu.tickrate import Tickrate
 from writers.abstracts import WriterABC
 from configurations import LCDConfigABC
+from menu.instrumentation import Instrumentation
+from extensions.acquisition import AcquisitionService
+from extensions.std.typing import Optional
 
 from options.abstracts import OptionABC
 from options.standards import StaticOption
@@ -20,10 +23,21 @@ class MainMenu:
         writer: WriterABC,
         lcd_config: LCDConfigABC,
         tickrate: Tickrate,
+        instrumentation: Optional[Instrumentation] = None,
+        acquisition: Optional[AcquisitionService] = None,
     ):
         self.writer = writer
         self.lcd_config = lcd_config
         self.tickrate = tickrate
+        self.instrumentation = instrumentation
+        self.acquisition = self.get_acquisition(acquisition)
+
+    def get_acquisition(
+        self, acquisition: Optional[AcquisitionService]
+    ) -> AcquisitionService:
+        if acquisition is None:
+            return AcquisitionService()
+        return acquisition
 
     def get_menu_item(self) -> MenuItem:
         columns = self.lcd_config.lcd_columns
@@ -45,7 +59,11 @@ class MainMenu:
             self.lcd_config,
             self.tickrate,
         )
-        system_menu = SystemInfoMenu(self.lcd_config)
+        system_menu = SystemInfoMenu(
+            self.lcd_config,
+            self.acquisition,
+            self.instrumentation,
+        )
 
         submenus: list[OrdDict] = [
             config_menu.get_menu(),
@@ -0,0 +1,61 @@
+from configurations import LCDConfigABC
+
+from options.abstracts import OptionABC
+from options.stats import StageTime, SlowestOption
+from options.item import MenuItem
+from options.utils import MenuCreator
+from menu.instrumentation import Instrumentation
+from extensions.std.typing import Callable, Optional
+
+# For interchangeable compatibility with MicroPython
+from collections import OrderedDict as OrdDict
+
+
+class StatsMenu:
+    def __init__(self, lcd_config: LCDConfigABC, instrumentation: Instrumentation):
+        self.lcd_config = lcd_config
+        self.instrumentation = instrumentation
+
+    def get_menu_item(self) -> MenuItem:
+        columns = self.lcd_config.lcd_columns
+        return MenuItem(columns)
+
+    def get_stage_time(self, label: str, stage: str) -> StageTime:
+        item = self.get_menu_item()
+        return StageTime(label, stage, item, self.instrumentation)
+
+    def get_slowest(
+        self, label: str, get_slowest: Callable[[], Optional[tuple[str, float]]]
+    ) -> SlowestOption:
+        item = self.get_menu_item()
+        return SlowestOption(label, item, get_slowest)
+
+    def get_heads(self) -> list[OptionABC]:
+        render = self.get_stage_time("Render", "render")
+        write = self.get_stage_time("Write", "write")
+        latency = self.get_stage_time("Input", "input")
+        check = self.get_stage_time("Check", "check")
+        jitter = self.get_stage_time("Jitter", "jitter")
+        slowest = self.get_slowest("Slowest", self.instrumentation.get_slowest_option)
+        source = self.get_slowest("Source", self.instrumentation.get_slowest_source)
+
+        heads = [
+            render,
+            write,
+            latency,
+            check,
+            jitter,
+            slowest,
+            source,
+        ]
+        return heads
+
+    def get_submenus(self, heads: list[OptionABC]) -> list[OrdDict]:
+        submenus = [OrdDict()] * len(heads)
+        return submenus
+
+    def get_menu(self) -> OrdDict[OptionABC, OrdDict]:
+        heads = self.get_heads()
+        submenus = self.get_submenus(heads)
+        menu = MenuCreator(heads, submenus).create()
+        return menu
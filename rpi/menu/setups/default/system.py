@@ -1,51 +1,116 @@
 from configurations import LCDConfigABC
 
 from options.abstracts import OptionABC
-from options.customs import CPUArch, CPUPerc, CPUFreq, CPUCoreCount
-from options.customs import MemoryTotal, MemoryFree, MemoryUsed, MemoryPerc
+from options.metrics import MetricOption
+from options.standards import StaticOption
 from options.item import MenuItem
 from options.utils import MenuCreator
+from extensions.sampler import SystemSampler, StoredSnapshot
+from extensions.sampler import DiskSampler, NetworkSampler, LoadSampler, SoCSampler
+from extensions.std.typing import Any, Callable, Optional
+from extensions.acquisition import AcquisitionService
+from menu.instrumentation import Instrumentation
+from menu.setups.default.stats import StatsMenu
 
 # For interchangeable compatibility with MicroPython
 from collections import OrderedDict as OrdDict
 
+SYSTEM_METRICS = (
+    "processor_name",
+    "cpu_usage",
+    "cpu_frequency_mhz",
+    "core_count",
+    "memory_total",
+    "memory_free",
+    "memory_used",
+    "memory_usage",
+)
+DISK_METRICS = ("disk_read_rate", "disk_write_rate")
+NETWORK_METRICS = ("net_rx_rate", "net_tx_rate")
+LOAD_METRICS = ("load_1", "load_5", "load_15")
+SOC_METRICS = ("soc_temperature", "throttled")
+
 
 class SystemInfoMenu:
-    def __init__(self, lcd_config: LCDConfigABC):
+    def __init__(
+        self,
+        lcd_config: LCDConfigABC,
+        acquisition: AcquisitionService,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
         self.lcd_config = lcd_config
+        self.acquisition = acquisition
+        self.instrumentation = instrumentation
+        self.sampler = self.get_sampler()
+
+    def get_sampler(self) -> StoredSnapshot:
+        # psutil is read on the acquisition thread, options read the store.
+        system_sampler = SystemSampler()
+        self.acquisition.register("system", system_sampler.sample, 0.5)
+        sampler = StoredSnapshot(self.acquisition.get_store(), "system")
+        return sampler
 
     def get_menu_item(self) -> MenuItem:
         columns = self.lcd_config.lcd_columns
         return MenuItem(columns)
 
     def get_heads(self) -> list[OptionABC]:
-        cpu_arch = CPUArch(self.get_menu_item())
-        cpu_perc = CPUPerc(self.get_menu_item())
-        cpu_freq = CPUFreq(self.get_menu_item())
-        cpu_cores = CPUCoreCount(self.get_menu_item())
-        mem_total = MemoryTotal(self.get_menu_item())
-        mem_free = MemoryFree(self.get_menu_item())
-        mem_used = MemoryUsed(self.get_menu_item())
-        mem_perc = MemoryPerc(self.get_menu_item())
-
-        heads = [
-            cpu_arch,
-            cpu_perc,
-            cpu_freq,
-            cpu_cores,
-            mem_total,
-            mem_free,
-            mem_used,
-            mem_perc,
-        ]
+        heads = []
+        for key in SYSTEM_METRICS:
+            option = MetricOption(self.get_menu_item(), self.sampler, key)
+            heads.append(option)
         return heads
 
     def get_submenus(self, heads: list[OptionABC]) -> list[OrdDict]:
         submenus = [OrdDict()] * len(heads)
         return submenus
 
+    def get_page(
+        self,
+        key: str,
+        sample: Callable[[], Any],
+        interval: float,
+        metrics: tuple[str, ...],
+    ) -> OrdDict[OptionABC, OrdDict]:
+        self.acquisition.register(key, sample, interval)
+        sampler = StoredSnapshot(self.acquisition.get_store(), key)
+
+        heads = []
+        for metric in metrics:
+            option = MetricOption(self.get_menu_item(), sampler, metric)
+            heads.append(option)
+        submenus = self.get_submenus(heads)
+        menu = MenuCreator(heads, submenus).create()
+        return menu
+
+    def get_pages(self) -> list[tuple[str, OrdDict[OptionABC, OrdDict]]]:
+        # Counters are sampled every second, rates are the difference
+        # between two samples.
+        disk = self.get_page("disk", DiskSampler().sample, 1.0, DISK_METRICS)
+        network = self.get_page(
+            "network", NetworkSampler().sample, 1.0, NETWORK_METRICS
+        )
+        load = self.get_page("load", LoadSampler().sample, 2.0, LOAD_METRICS)
+        soc = self.get_page("soc", SoCSampler().sample, 1.0, SOC_METRICS)
+
+        pages = [
+            ("Disk I/O", disk),
+            ("Network", network),
+            ("Load Average", load),
+            ("SoC", soc),
+        ]
+
+        # Only present when the handler was started with instrumentation.
+        if self.instrumentation is not None:
+            stats_menu = StatsMenu(self.lcd_config, self.instrumentation)
+            pages.append(("Stats", stats_menu.get_menu()))
+        return pages
+
     def get_menu(self) -> OrdDict[OptionABC, OrdDict]:
         heads = self.get_heads()
         submenus = self.get_submenus(heads)
+        for name, page in self.get_pages():
+            heads.append(StaticOption(name, self.get_menu_item()))
+            submenus.append(page)
         menu = MenuCreator(heads, submenus).create()
         return menu
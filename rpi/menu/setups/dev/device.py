@@ -12,10 +12,15 @@ from options.standards import (
 )
 
 from options.item import MenuItem
+from options.metrics import MetricOption
 from options.utils import MenuCreator
 from options.events import IntEvent, StrEvent, ActionEvent
 
 from devices.relay import RelayDevice
+from devices.dht import DHT11, DHT11Result
+from extensions.std.typing import Callable, Optional
+from extensions.acquisition import AcquisitionService
+from extensions.sampler import StoredSnapshot
 
 # For interchangeable compatibility with MicroPython
 from collections import OrderedDict as OrdDict
@@ -96,10 +101,17 @@ class DeviceInfoMenu:
 
 
 class DeviceControlMenu:
-    def __init__(self, lcd_config: LCDConfigABC, device_menu: DeviceMenu):
+    def __init__(
+        self,
+        lcd_config: LCDConfigABC,
+        device_menu: DeviceMenu,
+        acquisition: AcquisitionService,
+    ):
         self.lcd_config = lcd_config
         self.device_menu = device_menu
+        self.acquisition = acquisition
         self.devices = []
+        self.sources: list[str] = []
 
     def get_menu_item(self) -> MenuItem:
         columns = self.lcd_config.lcd_columns
@@ -133,7 +145,44 @@ class DeviceControlMenu:
         menu = MenuCreator(heads, submenus).create()
         return menu
 
+    def get_sensor_menu(self) -> OrdDict[OptionABC, OrdDict]:
+        # The sensor is read on the acquisition thread, a slow or failing
+        # read never holds up a frame.
+        pin = self.device_menu.get_pin()
+        dht = DHT11(pin)
+        self.devices.append(dht)
+        key = f"dht:{pin}"
+        # A little above the sensor's minimum interval, so scheduling jitter
+        # never lands a read inside it and returns the cached result.
+        interval = dht.get_min_interval() + 0.5
+        self.acquisition.register(key, self.get_dht_sampler(dht), interval)
+        self.sources.append(key)
+
+        sampler = StoredSnapshot(self.acquisition.get_store(), key)
+        temperature = MetricOption(self.get_menu_item(), sampler, "temperature")
+        humidity = MetricOption(self.get_menu_item(), sampler, "humidity")
+        heads: list[OptionABC] = [temperature, humidity]
+        submenus = [OrdDict()] * len(heads)
+        submenu = MenuCreator(heads, submenus).create()
+
+        sensor_option = StaticOption("Sensor", self.get_menu_item())
+        heads = [sensor_option]
+        submenus = [submenu]
+        menu = MenuCreator(heads, submenus).create()
+        return menu
+
+    def get_dht_sampler(self, dht: DHT11) -> Callable[[], Optional[DHT11Result]]:
+        def sample() -> Optional[DHT11Result]:
+            dht.read()
+            return dht.get_last_valid()
+
+        return sample
+
     def get_control_menu(self) -> OrdDict[OptionABC, OrdDict]:
+        if self.device_menu.get_type() == "DHT":
+            menu = self.get_sensor_menu()
+            return menu
+
         control = self.device_menu.get_control()
         if control == "Manual":
             menu = self.get_manual_control()
@@ -143,10 +192,13 @@ class DeviceControlMenu:
 
 
 class AddDeviceMenuBase:
-    def __init__(self, lcd_config: LCDConfigABC):
+    def __init__(self, lcd_config: LCDConfigABC, acquisition: AcquisitionService):
         self._lcd_config = lcd_config
+        self._acquisition = acquisition
         self._device_menu = DeviceMenu()
         self._add_device_submenu = OrdDict()
+        # Acquisition sources of each added device, by its menu option.
+        self._device_sources: dict[OptionABC, list[str]] = {}
         self._menu = self._get_menu()
 
     def _get_menu_item(self) -> MenuItem:
@@ -206,6 +258,8 @@ class AddDeviceMenuBase:
 
     def _delete_device(self, device_option: OptionABC):
         self._menu.pop(device_option)
+        for key in self._device_sources.pop(device_option, []):
+            self._acquisition.unregister(key)
 
     def _create_new_device(self) -> OrdDict[OptionABC, OrdDict]:
         pin = self._device_menu.get_pin()
@@ -214,7 +268,9 @@ class AddDeviceMenuBase:
         option = StaticOption(name, menu_item)
 
         device_info = DeviceInfoMenu(self._lcd_config, self._device_menu)
-        device_control = DeviceControlMenu(self._lcd_config, self._device_menu)
+        device_control = DeviceControlMenu(
+            self._lcd_config, self._device_menu, self._acquisition
+        )
 
         info_menu = device_info.get_info_menu()
         control_menu = device_control.get_control_menu()
@@ -224,6 +280,7 @@ class AddDeviceMenuBase:
         submenus = [submenus]
         menu = MenuCreator(heads, submenus).create()
 
+        self._device_sources[option] = device_control.sources
         return menu
 
     def _add_device_to_menu(self):
@@ -273,8 +330,8 @@ class AddDeviceMenuBase:
 
 
 class AddDeviceMenu(AddDeviceMenuBase):
-    def __init__(self, lcd_config: LCDConfigABC):
-        super().__init__(lcd_config)
+    def __init__(self, lcd_config: LCDConfigABC, acquisition: AcquisitionService):
+        super().__init__(lcd_config, acquisition)
 
     def get_menu(self) -> OrdDict[OptionABC, OrdDict]:
         return self._menu
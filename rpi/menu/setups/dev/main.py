@@ -1,6 +1,9 @@
 from menu.tickrate import Tickrate
 from writers.abstracts import WriterABC
 from configurations import LCDConfigABC
+from menu.instrumentation import Instrumentation
+from extensions.acquisition import AcquisitionService
+from extensions.std.typing import Optional
 
 from options.abstracts import OptionABC
 from options.standards import StaticOption
@@ -21,10 +24,21 @@ class MainMenu:
         writer: WriterABC,
         lcd_config: LCDConfigABC,
         tickrate: Tickrate,
+        instrumentation: Optional[Instrumentation] = None,
+        acquisition: Optional[AcquisitionService] = None,
     ):
         self.writer = writer
         self.lcd_config = lcd_config
         self.tickrate = tickrate
+        self.instrumentation = instrumentation
+        self.acquisition = self.get_acquisition(acquisition)
+
+    def get_acquisition(
+        self, acquisition: Optional[AcquisitionService]
+    ) -> AcquisitionService:
+        if acquisition is None:
+            return AcquisitionService()
+        return acquisition
 
     def get_menu_item(self) -> MenuItem:
         columns = self.lcd_config.lcd_columns
@@ -43,13 +57,17 @@ class MainMenu:
         return heads
 
     def get_submenus(self) -> list[OrdDict]:
-        devices_menu = AddDeviceMenu(self.lcd_config)
+        devices_menu = AddDeviceMenu(self.lcd_config, self.acquisition)
         config_menu = ConfigurationMenu(
             self.writer,
             self.lcd_config,
             self.tickrate,
         )
-        system_menu = SystemInfoMenu(self.lcd_config)
+        system_menu = SystemInfoMenu(
+            self.lcd_config,
+            self.acquisition,
+            self.instrumentation,
+        )
 
         submenus: list[OrdDict] = [
             devices_menu.get_menu(),
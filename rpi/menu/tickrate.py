@@ -1,4 +1,6 @@
 class Tickrate:
+    TICK_INTERVAL = 0.01
+
     def __init__(self, tick: int):
         self.tick = tick
 
@@ -7,3 +9,7 @@ class Tickrate:
 
     def set_tickrate(self, tick: int):
         self.tick = tick
+
+    def get_interval(self) -> float:
+        ticks = max(self.tick, 1)
+        return ticks * self.TICK_INTERVAL
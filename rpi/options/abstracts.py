@@ -1,4 +1,5 @@
 from extensions.std.abc import ABC, abstractmethod
+from extensions.std.typing import Optional
 from options.item import MenuItem
 
 from character.abstracts import CharABC
@@ -37,9 +38,24 @@ class OptionABC(ABC):
         pass
 
     @abstractmethod
-    def update(self):
+    def update(self) -> bool:
+        # Returns whether the row became dirty.
         pass
 
     @abstractmethod
     def update_shift(self):
         pass
+
+    def get_code_array(self) -> bytes:
+        return self.get_item().get_code_array()
+
+    def is_dirty(self) -> bool:
+        return self.get_item().is_dirty()
+
+    def get_refresh_interval(self) -> Optional[float]:
+        # Seconds between update() calls, None follows the Tickrate.
+        return None
+
+    def get_name(self) -> str:
+        # Identifies the option in the instrumentation.
+        return type(self).__name__
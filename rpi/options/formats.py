@@ -0,0 +1,108 @@
+from extensions.std.typing import Optional
+
+# (suffix, factor) pairs in ascending order, a value is shown in the
+# largest unit it reaches.
+Units = tuple[tuple[str, float], ...]
+
+BYTE_UNITS: Units = (
+    ("B", 1),
+    ("KB", 1024),
+    ("MB", 1024**2),
+    ("GB", 1024**3),
+    ("TB", 1024**4),
+)
+RATE_UNITS: Units = (
+    ("B/s", 1),
+    ("KB/s", 1024),
+    ("MB/s", 1024**2),
+    ("GB/s", 1024**3),
+)
+MEGAHERTZ_UNITS: Units = (("MHz", 1), ("GHz", 1000))
+PERCENT_UNITS: Units = (("%", 1),)
+CELSIUS_UNITS: Units = (("C", 1),)
+PLAIN_UNITS: Units = (("", 1),)
+
+
+class MetricFormatBase:
+    # Format strings only depend on the precision, formats share them.
+    _specs: dict[int, str] = {}
+
+    def __init__(self, label: str, units: Units, precision: int, width: int):
+        self._label = label
+        self._units = units
+        self._precision = precision
+        self._width = width
+        self._key: Optional[tuple[str, float | str, int]] = None
+        self._string = ""
+
+    def _get_spec(self, precision: int) -> str:
+        spec = self._specs.get(precision)
+        if spec is None:
+            spec = "{}: {:." + str(precision) + "f}{}"
+            self._specs[precision] = spec
+        return spec
+
+    def _get_unit(self, value: float) -> tuple[str, float]:
+        suffix, factor = self._units[0]
+        for unit_suffix, unit_factor in self._units[1:]:
+            if abs(value) < unit_factor:
+                break
+            suffix, factor = unit_suffix, unit_factor
+        return suffix, factor
+
+    def _get_precision(self, value: float, factor: float) -> int:
+        # Whole numbers in the base unit have no decimals to show.
+        if factor == 1 and isinstance(value, int):
+            return 0
+        return self._precision
+
+    def _get_key(self, value: float | str) -> tuple[str, float | str, int]:
+        if isinstance(value, str):
+            return "", value, 0
+
+        suffix, factor = self._get_unit(value)
+        precision = self._get_precision(value, factor)
+        return suffix, round(value / factor, precision), precision
+
+    def _get_string(self, suffix: str, value: float | str, precision: int) -> str:
+        # Text is shown as is and scrolls when it does not fit.
+        if isinstance(value, str):
+            return self._label + ": " + value
+
+        # Decimals are dropped first, then the label is cut, so the value
+        # fits the row instead of scrolling.
+        for idx in range(precision, -1, -1):
+            string = self._get_spec(idx).format(self._label, value, suffix)
+            if len(string) <= self._width:
+                return string
+
+        overflow = len(string) - self._width
+        label = self._label[: max(len(self._label) - overflow, 1)].rstrip()
+        return self._get_spec(0).format(label, value, suffix)
+
+
+class MetricFormat(MetricFormatBase):
+    def __init__(
+        self,
+        label: str,
+        units: Units = PLAIN_UNITS,
+        precision: int = 1,
+        width: int = 14,
+    ):
+        super().__init__(label, units, precision, width)
+
+    def format(self, value: float | str) -> str:
+        # Values that round to the shown digits reuse the last string.
+        key = self._get_key(value)
+        if key == self._key:
+            return self._string
+
+        self._key = key
+        self._string = self._get_string(*key)
+        return self._string
+
+    def get_placeholder(self) -> str:
+        return self._label + ": --"
+
+    def get_width(self) -> int:
+        return self._width
@@ -1,35 +1,47 @@
-from character.abstracts import CharABC
-from character.chars import (
-    CharArray,
-    LeftArrowChar,
-    RightArrowChar,
-    RightAngleChar,
-    SpaceChar,
-)
+from character.abstracts import CharABC, CustomCharABC
+from extensions.std.typing import Optional
+from character.chars import CharArray, char_table
+
+# (st_idx, shift_hold_st, shift_hold_en) of the scroll state machine.
+ScrollState = tuple[int, int, int]
 
 
 class MenuItemBase:
+    # Scroll cycles only depend on the string length, the columns and
+    # the hold, items of the same length share them.
+    _scroll_cycles: dict[tuple[int, int, int], list[ScrollState]] = {}
+
     def __init__(self, columns: int, shift_hold: int):
         self._columns = columns
         self._char_array: list[CharABC] = []
+        self._code_array = b""
+        self._glyphs: dict[int, CustomCharABC] = {}
+        self._string: Optional[str] = None
         self._shift_hold = shift_hold
+        self._cycle: list[ScrollState] = self._get_cycle(0)
+        self._cycle_idx = 0
         self._st_idx = 0
-        self._shift_hold_st = 0
-        self._shift_hold_en = 0
+        self._char_frames: dict[int, list[CharABC]] = {}
+        self._code_frames: dict[int, bytes] = {}
         self._is_selected = False
-
-    def _get_shifted_length(self) -> int:
-        len_string = len(self._char_array)
-        return len_string - self._st_idx
-
-    def _get_trimmed_columns(self) -> int:
+        self._dirty = True
+        self._revision = 0
+        self._cached_char_array: Optional[list[CharABC]] = None
+        self._cached_char_revision = -1
+        self._cached_code_array: Optional[bytes] = None
+        self._cached_code_revision = -1
+
+    def _set_dirty(self):
+        self._dirty = True
+        self._revision += 1
+
+    def _get_trimmed_columns(self, st_idx: int, length: int) -> int:
         available_columns = self._get_available_columns()
-        st_range = self._st_idx
 
-        if st_range > 0:
+        if st_idx > 0:
             available_columns -= 1
 
-        if available_columns != len(self._char_array):
+        if available_columns != length:
             available_columns -= 1
 
         return available_columns
@@ -37,83 +49,147 @@ class MenuItemBase:
     def _get_available_columns(self) -> int:
         return self._columns - 2
 
-    def _get_shift_condition(self) -> bool:
-        shifted_length = self._get_shifted_length()
-        trimmed_columns = self._get_trimmed_columns()
+    def _get_shift_condition(self, st_idx: int, length: int) -> bool:
+        shifted_length = length - st_idx
+        trimmed_columns = self._get_trimmed_columns(st_idx, length)
         available_columns = self._get_available_columns()
-        if len(self._char_array) > available_columns:
-            if shifted_length > trimmed_columns and self._is_selected:
+        if length > available_columns:
+            if shifted_length > trimmed_columns:
                 return True
         return False
 
-    def _get_reset_condition(self):
-        if not self._is_selected and self._st_idx != 0:
-            return True
-        return False
+    def _get_next_state(self, state: ScrollState, length: int) -> ScrollState:
+        # One tick of a selected item: hold at the start, shift until the
+        # end is visible, hold at the end, then start over.
+        st_idx, shift_hold_st, shift_hold_en = state
 
-    def _increment_shift(self):
-        shift_condition = self._get_shift_condition()
+        if self._get_shift_condition(st_idx, length):
+            if shift_hold_st < self._shift_hold:
+                return st_idx, shift_hold_st + 1, shift_hold_en
+            return st_idx + 1, shift_hold_st, shift_hold_en
 
-        if shift_condition:
-            if not self._hold_shift_start():
-                self._st_idx += 1
-            return
+        if shift_hold_en < self._shift_hold:
+            return st_idx, shift_hold_st, shift_hold_en + 1
+        return 0, 0, 0
 
-        if not shift_condition and self._is_selected:
-            if not self._hold_shift_end():
-                self._reset()
-            return
+    def _get_cycle(self, length: int) -> list[ScrollState]:
+        key = (length, self._columns, self._shift_hold)
+        cycle = self._scroll_cycles.get(key)
+        if cycle is not None:
+            return cycle
 
-        if self._get_reset_condition():
-            self._reset()
+        cycle = [(0, 0, 0)]
+        state = self._get_next_state(cycle[0], length)
+        while state != (0, 0, 0):
+            cycle.append(state)
+            state = self._get_next_state(state, length)
 
-    def _hold_shift_start(self):
-        if self._shift_hold_st < self._shift_hold:
-            self._shift_hold_st += 1
-            return True
-        return False
+        self._scroll_cycles[key] = cycle
+        return cycle
 
-    def _hold_shift_end(self):
-        if self._shift_hold_en < self._shift_hold:
-            self._shift_hold_en += 1
-            return True
-        return False
+    def _set_content(self, char_array: list[CharABC], code_array: bytes):
+        self._char_array = char_array
+        self._code_array = code_array
+        self._char_frames = {}
+        self._code_frames = {}
+
+        # A new length keeps the scroll position where the new cycle
+        # has the same state, otherwise the scroll starts over.
+        cycle = self._get_cycle(len(code_array))
+        if cycle is not self._cycle:
+            state = self._cycle[self._cycle_idx]
+            self._cycle = cycle
+            self._cycle_idx = cycle.index(state) if state in cycle else 0
+            self._st_idx = cycle[self._cycle_idx][0]
+        self._set_dirty()
+
+    def _set_cycle_idx(self, cycle_idx: int):
+        self._cycle_idx = cycle_idx
+        st_idx = self._cycle[cycle_idx][0]
+        if st_idx != self._st_idx:
+            self._st_idx = st_idx
+            self._set_dirty()
 
-    def _fill_preceding_char(self, char_array: list[CharABC], st_range: int):
-        if st_range > 0:
-            char_array.append(LeftArrowChar())
+    def _increment_shift(self):
+        if not self._is_selected:
+            if self._st_idx != 0:
+                self._reset()
+            return
 
-    def _fill_proceeding_char(self, char_array: list[CharABC], en_range: int):
-        if en_range != len(self._char_array):
-            char_array.append(RightArrowChar())
+        cycle_idx = self._cycle_idx + 1
+        if cycle_idx == len(self._cycle):
+            cycle_idx = 0
+        self._set_cycle_idx(cycle_idx)
 
-    def _fill_char_array(self, char_array: list[CharABC]):
-        shifted_length = self._get_shifted_length()
-        trimmed_columns = self._get_trimmed_columns()
+    def _get_window(self) -> tuple[int, int, bool]:
+        length = len(self._code_array)
+        shifted_length = length - self._st_idx
+        trimmed_columns = self._get_trimmed_columns(self._st_idx, length)
         available_columns = self._get_available_columns()
 
-        if len(self._char_array) > available_columns:
+        if length > available_columns:
             if shifted_length >= trimmed_columns:
                 st_range = self._st_idx
                 en_range = self._st_idx + trimmed_columns
-                self._fill_preceding_char(char_array, self._st_idx)
-                for idx in range(st_range, en_range):
-                    char_array.append(self._char_array[idx])
-                self._fill_proceeding_char(char_array, en_range)
-                return
+                return st_range, en_range, True
+
+        return self._st_idx, length, False
+
+    def _get_char_frame(self) -> list[CharABC]:
+        char_frame = self._char_frames.get(self._st_idx)
+        if char_frame is not None:
+            return char_frame
+
+        st_range, en_range, arrows = self._get_window()
+        char_frame = []
+        if arrows and st_range > 0:
+            char_frame.append(char_table.get_left_arrow_char())
+        char_frame.extend(self._char_array[st_range:en_range])
+        if arrows and en_range != len(self._char_array):
+            char_frame.append(char_table.get_right_arrow_char())
+
+        self._char_frames[self._st_idx] = char_frame
+        return char_frame
+
+    def _get_code_frame(self) -> bytes:
+        code_frame = self._code_frames.get(self._st_idx)
+        if code_frame is not None:
+            return code_frame
+
+        st_range, en_range, arrows = self._get_window()
+        code_array = bytearray()
+        if arrows and st_range > 0:
+            code_array.append(char_table.get_left_arrow_char().get_value())
+        code_array += self._code_array[st_range:en_range]
+        if arrows and en_range != len(self._code_array):
+            code_array.append(char_table.get_right_arrow_char().get_value())
+
+        code_frame = bytes(code_array)
+        self._code_frames[self._st_idx] = code_frame
+        return code_frame
+
+    def _get_prefix_code_array(self) -> bytearray:
+        space_code = char_table.get_space_char().get_value()
+        if self._is_selected:
+            angle_code = char_table.get_right_angle_char().get_value()
+            return bytearray((angle_code, space_code))
+        return bytearray((space_code, space_code))
 
-        for idx in range(self._st_idx, len(self._char_array)):
-            char_array.append(self._char_array[idx])
+    def _get_glyphs(self, char_array: list[CharABC]) -> dict[int, CustomCharABC]:
+        glyphs = {}
+        for char in char_array:
+            if isinstance(char, CustomCharABC):
+                glyphs[char.cgram] = char
+        return glyphs
 
     def _get_prefix_char_array(self) -> list[CharABC]:
+        space_char = char_table.get_space_char()
         if self._is_selected:
-            return [RightAngleChar(), SpaceChar()]
-        return [SpaceChar(), SpaceChar()]
+            return [char_table.get_right_angle_char(), space_char]
+        return [space_char, space_char]
 
     def _reset(self):
-        self._st_idx = 0
-        self._shift_hold_st = 0
-        self._shift_hold_en = 0
+        self._set_cycle_idx(0)
 
 
 class MenuItem(MenuItemBase):
@@ -123,21 +199,68 @@ class MenuItem(MenuItemBase):
     def is_selected(self) -> bool:
         return self._is_selected
 
+    def get_available_columns(self) -> int:
+        # Columns left for the text after the selection prefix.
+        return self._get_available_columns()
+
     def set_selected(self, state: bool):
+        if self._is_selected != state:
+            self._set_dirty()
         self._is_selected = state
 
-    def set_string(self, string: str):
-        char_array = CharArray().get_ascii_char_array(string)
-        self._char_array = char_array
+    def set_string(self, string: str) -> bool:
+        # Returns whether the row changed, an identical string is a no-op.
+        if string == self._string:
+            return False
 
-    def set_char_array(self, char_array: list[CharABC]):
-        self._char_array = char_array
+        char_array = CharArray().get_ascii_char_array(string)
+        code_array = CharArray().get_ascii_code_array(string)
+        self._string = string
+        self._glyphs = {}
+        self._set_content(char_array, code_array)
+        return True
+
+    def set_char_array(self, char_array: list[CharABC]) -> bool:
+        code_array = CharArray().get_code_array(char_array)
+        glyphs = self._get_glyphs(char_array)
+        if self._string is None and code_array == self._code_array:
+            if glyphs == self._glyphs:
+                return False
+
+        self._string = None
+        self._glyphs = glyphs
+        self._set_content(char_array, code_array)
+        return True
+
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def get_glyphs(self) -> dict[int, CustomCharABC]:
+        return self._glyphs
 
     def get_char_array(self) -> list[CharABC]:
+        # Unchanged rows hand out the same list, callers must not mutate it.
+        if self._cached_char_revision == self._revision:
+            return self._cached_char_array
+
         char_array = self._get_prefix_char_array()
-        self._fill_char_array(char_array)
+        char_array.extend(self._get_char_frame())
+        self._cached_char_array = char_array
+        self._cached_char_revision = self._revision
+        self._dirty = False
         return char_array
 
+    def get_code_array(self) -> bytes:
+        if self._cached_code_revision == self._revision:
+            return self._cached_code_array
+
+        code_array = self._get_prefix_code_array()
+        code_array += self._get_code_frame()
+        self._cached_code_array = bytes(code_array)
+        self._cached_code_revision = self._revision
+        self._dirty = False
+        return self._cached_code_array
+
     def shift(self):
         self._increment_shift()
 
@@ -0,0 +1,133 @@
+from options.abstracts import OptionABC
+from options.item import MenuItem
+from options.formats import MetricFormat, Units
+from options.formats import BYTE_UNITS, RATE_UNITS, MEGAHERTZ_UNITS, PERCENT_UNITS
+from options.formats import CELSIUS_UNITS, PLAIN_UNITS
+from character.abstracts import CharABC
+from extensions.sampler import SnapshotSourceABC
+from extensions.std.typing import Any, Optional
+
+
+class MetricSpec:
+    def __init__(
+        self,
+        label: str,
+        units: Units = PLAIN_UNITS,
+        precision: int = 1,
+        interval: Optional[float] = None,
+    ):
+        self.label = label
+        self.units = units
+        self.precision = precision
+        # Seconds between refreshes, None follows the Tickrate.
+        self.interval = interval
+
+    def get_format(self, width: int) -> MetricFormat:
+        return MetricFormat(self.label, self.units, self.precision, width)
+
+
+# Keyed by the snapshot attribute a row shows. Every row of a menu reads
+# the same stored snapshot, a new row only needs an entry here.
+METRICS: dict[str, MetricSpec] = {
+    "processor_name": MetricSpec("CPU"),
+    "cpu_usage": MetricSpec("Perc", PERCENT_UNITS, 1, 0.5),
+    "cpu_frequency_mhz": MetricSpec("Freq", MEGAHERTZ_UNITS, 1, 1.0),
+    "core_count": MetricSpec("Core Count", PLAIN_UNITS, 0),
+    "memory_total": MetricSpec("TMem", BYTE_UNITS, 1),
+    "memory_free": MetricSpec("FMem", BYTE_UNITS, 1, 1.0),
+    "memory_used": MetricSpec("UMem", BYTE_UNITS, 1, 1.0),
+    "memory_usage": MetricSpec("PMem", PERCENT_UNITS, 0, 1.0),
+    "temperature": MetricSpec("Temp", CELSIUS_UNITS, 1, 1.0),
+    "humidity": MetricSpec("Humidity", PERCENT_UNITS, 1, 1.0),
+    "disk_read_rate": MetricSpec("Read", RATE_UNITS, 1, 1.0),
+    "disk_write_rate": MetricSpec("Write", RATE_UNITS, 1, 1.0),
+    "net_rx_rate": MetricSpec("Rx", RATE_UNITS, 1, 1.0),
+    "net_tx_rate": MetricSpec("Tx", RATE_UNITS, 1, 1.0),
+    "load_1": MetricSpec("Load 1m", PLAIN_UNITS, 2, 2.0),
+    "load_5": MetricSpec("Load 5m", PLAIN_UNITS, 2, 2.0),
+    "load_15": MetricSpec("Load 15m", PLAIN_UNITS, 2, 2.0),
+    "soc_temperature": MetricSpec("SoC", CELSIUS_UNITS, 1, 1.0),
+    "throttled": MetricSpec("Throttle", interval=1.0),
+}
+
+
+class MetricOptionBase(OptionABC):
+    def __init__(
+        self,
+        item: MenuItem,
+        sampler: SnapshotSourceABC,
+        key: str,
+        spec: MetricSpec,
+    ):
+        self._item = item
+        self._sampler = sampler
+        self._key = key
+        self._spec = spec
+        self._format = spec.get_format(item.get_available_columns())
+        self._value: Any = None
+        self._item.set_string(self._format.get_placeholder())
+        self._update_menu_item()
+
+    def _get_value(self) -> Any:
+        # A source that has not been sampled yet keeps the placeholder.
+        snapshot = self._sampler.get_snapshot()
+        if snapshot is None:
+            return None
+        return getattr(snapshot, self._key)
+
+    def _update_menu_item(self) -> bool:
+        value = self._get_value()
+        # Compared before formatting, an unchanged reading costs nothing.
+        if value is None or value == self._value:
+            return False
+
+        self._value = value
+        string = self._format.format(value)
+        return self._item.set_string(string)
+
+
+class MetricOption(MetricOptionBase):
+    def __init__(
+        self,
+        item: MenuItem,
+        sampler: SnapshotSourceABC,
+        key: str,
+        spec: Optional[MetricSpec] = None,
+    ):
+        if spec is None:
+            spec = METRICS[key]
+        super().__init__(item, sampler, key, spec)
+
+    def back(self):
+        pass
+
+    def prev(self):
+        pass
+
+    def next(self):
+        pass
+
+    def apply(self):
+        pass
+
+    def get_hold_state(self) -> bool:
+        return False
+
+    def get_char_array(self) -> list[CharABC]:
+        return self._item.get_char_array()
+
+    def get_item(self) -> MenuItem:
+        return self._item
+
+    def update(self) -> bool:
+        return self._update_menu_item()
+
+    def update_shift(self):
+        self._item.shift()
+
+    def get_refresh_interval(self) -> Optional[float]:
+        return self._spec.interval
+
+    def get_name(self) -> str:
+        # Every metric row is a MetricOption, the key tells them apart.
+        return self._key
@@ -31,8 +31,8 @@ class StaticOption(OptionABC):
     def get_item(self) -> MenuItem:
         return self.item
 
-    def update(self):
-        pass
+    def update(self) -> bool:
+        return False
 
     def update_shift(self):
         self.item.shift()
@@ -78,8 +78,8 @@ class SActionOptionEvent(OptionABC):
     def get_item(self) -> MenuItem:
         return self.item
 
-    def update(self):
-        pass
+    def update(self) -> bool:
+        return False
 
     def update_shift(self):
         self.item.shift()
@@ -119,8 +119,8 @@ class ActionOptionEvent(OptionABC):
     def get_item(self) -> MenuItem:
         return self.item
 
-    def update(self):
-        pass
+    def update(self) -> bool:
+        return False
 
     def update_shift(self):
         self.item.shift()
@@ -131,13 +131,23 @@ class ToggleOptionEventBase(OptionABC):
         self._name = name
         self._item = item
         self._event = event
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> bool:
+        # The state the label is built from, compared before formatting.
+        return self._get_state()
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self._get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def _get_state_str(self) -> str:
         if self._get_state():
@@ -179,8 +189,8 @@ class ToggleOptionEvent(ToggleOptionEventBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
@@ -191,13 +201,22 @@ class ToggleOptionBase(OptionABC):
         self._name = name
         self._item = item
         self._state = False
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> bool:
+        return self._state
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self._get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def _get_state_str(self) -> str:
         if self._get_state():
@@ -239,8 +258,8 @@ class ToggleOption(ToggleOptionBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
@@ -254,13 +273,22 @@ class ListOptionBase(OptionABC):
         self._idx = 0
         self._max_idx = len(item_list) - 1
         self._change_state = False
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> tuple[int, bool]:
+        return (self._idx, self._change_state)
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self._get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def _get_state_str(self) -> str:
         if self._change_state:
@@ -328,8 +356,8 @@ class ListOption(ListOptionBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
@@ -350,13 +378,22 @@ class ListOptionEventBase(OptionABC):
         self._idx = 0
         self._max_idx = len(item_list) - 1
         self._change_state = False
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> tuple[int, bool]:
+        return (self._idx, self._change_state)
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self._get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def _get_state_str(self) -> str:
         if self._change_state:
@@ -432,8 +469,8 @@ class ListOptionEvent(ListOptionEventBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
@@ -456,13 +493,22 @@ class RangeOptionEventBase(OptionABC):
         self._min_range = min_range
         self._max_range = max_range
         self._change_state = False
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> tuple[int, bool]:
+        return (self._get_state(), self._change_state)
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self.get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def get_state_str(self) -> str:
         if self._change_state:
@@ -538,8 +584,8 @@ class RangeOptionEvent(RangeOptionEventBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
@@ -561,13 +607,22 @@ class RangeOptionBase(OptionABC):
         self._min_range = min_range
         self._max_range = max_range
         self._change_state = False
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> tuple[int, bool]:
+        return (self._value, self._change_state)
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self.get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def get_state_str(self) -> str:
         if self._change_state:
@@ -642,8 +697,8 @@ class RangeOption(RangeOptionBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
@@ -658,13 +713,28 @@ class TimeBase(OptionABC):
         self._selected = 0
         self._select_state = False
         self._change_state = False
+        self._source = None
         self._update_menu_item()
 
-    def _update_menu_item(self):
+    def _get_source(self) -> tuple[int, int, int, bool, bool]:
+        return (
+            self._hours,
+            self._minutes,
+            self._selected,
+            self._select_state,
+            self._change_state,
+        )
+
+    def _update_menu_item(self) -> bool:
+        source = self._get_source()
+        if source == self._source:
+            return False
+
+        self._source = source
         string = "{}; {}"
         state_str = self._get_state_str()
         string = string.format(self._name, state_str)
-        self._item.set_string(string)
+        return self._item.set_string(string)
 
     def _get_hours_str(self) -> str:
         if len(str(self._hours)) == 1:
@@ -808,8 +878,8 @@ class TimeOption(TimeBase):
     def get_item(self) -> MenuItem:
         return self._item
 
-    def update(self):
-        self._update_menu_item()
+    def update(self) -> bool:
+        return self._update_menu_item()
 
     def update_shift(self):
         self._item.shift()
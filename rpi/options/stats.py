@@ -0,0 +1,146 @@
+from options.abstracts import OptionABC
+from options.item import MenuItem
+from character.abstracts import CharABC
+from menu.instrumentation import Instrumentation
+from extensions.std.typing import Callable, Optional
+
+
+class StageTimeBase(OptionABC):
+    def __init__(
+        self,
+        label: str,
+        stage: str,
+        item: MenuItem,
+        instrumentation: Instrumentation,
+    ):
+        self._label = label
+        self._stage = stage
+        self._item = item
+        self._instrumentation = instrumentation
+        self._value: Optional[float] = None
+        self._update_menu_item()
+
+    def _get_value(self) -> float:
+        stats = self._instrumentation.get_stage(self._stage)
+        return round(stats.get_average() * 1000, 2)
+
+    def _update_menu_item(self) -> bool:
+        value = self._get_value()
+        if value == self._value:
+            return False
+
+        self._value = value
+        string = "{}: {:.2f}ms"
+        string = string.format(self._label, value)
+        return self._item.set_string(string)
+
+
+class StageTime(StageTimeBase):
+    def __init__(
+        self,
+        label: str,
+        stage: str,
+        item: MenuItem,
+        instrumentation: Instrumentation,
+    ):
+        super().__init__(label, stage, item, instrumentation)
+
+    def back(self):
+        pass
+
+    def prev(self):
+        pass
+
+    def next(self):
+        pass
+
+    def apply(self):
+        pass
+
+    def get_hold_state(self) -> bool:
+        return False
+
+    def get_char_array(self) -> list[CharABC]:
+        return self._item.get_char_array()
+
+    def get_item(self) -> MenuItem:
+        return self._item
+
+    def update(self) -> bool:
+        return self._update_menu_item()
+
+    def update_shift(self):
+        self._item.shift()
+
+    def get_refresh_interval(self) -> Optional[float]:
+        return 1.0
+
+
+class SlowestOptionBase(OptionABC):
+    def __init__(
+        self,
+        label: str,
+        item: MenuItem,
+        get_slowest: Callable[[], Optional[tuple[str, float]]],
+    ):
+        self._label = label
+        self._item = item
+        self._get_slowest = get_slowest
+        self._value: Optional[tuple[str, float]] = None
+        self._item.set_string(self._label + ": -")
+        self._update_menu_item()
+
+    def _update_menu_item(self) -> bool:
+        slowest = self._get_slowest()
+        if slowest is None:
+            return False
+
+        name, duration = slowest
+        value = (name, round(duration * 1000, 2))
+        if value == self._value:
+            return False
+
+        self._value = value
+        string = "{}: {} {:.2f}ms"
+        string = string.format(self._label, *value)
+        return self._item.set_string(string)
+
+
+class SlowestOption(SlowestOptionBase):
+    def __init__(
+        self,
+        label: str,
+        item: MenuItem,
+        get_slowest: Callable[[], Optional[tuple[str, float]]],
+    ):
+        super().__init__(label, item, get_slowest)
+
+    def back(self):
+        pass
+
+    def prev(self):
+        pass
+
+    def next(self):
+        pass
+
+    def apply(self):
+        pass
+
+    def get_hold_state(self) -> bool:
+        return False
+
+    def get_char_array(self) -> list[CharABC]:
+        return self._item.get_char_array()
+
+    def get_item(self) -> MenuItem:
+        return self._item
+
+    def update(self) -> bool:
+        return self._update_menu_item()
+
+    def update_shift(self):
+        self._item.shift()
+
+    def get_refresh_interval(self) -> Optional[float]:
+        return 1.0
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The emulated backend has to be selected before extensions.wgpio is
+# imported, the modules under test import from the rpi directory.
+os.environ["WGPIO_BACKEND"] = "emulated"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
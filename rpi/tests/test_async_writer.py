@@ -0,0 +1,39 @@
+import asyncio
+
+from character.frame import Frame
+from writers.abstracts import WriterABC
+from writers.async_writer import AsyncWriter
+
+
+class RecordingWriter(WriterABC):
+    def __init__(self):
+        super().__init__(2, 16)
+        self.hold_times = []
+
+    def write_with_cursor(self, chars, hold_time):
+        self.hold_times.append(hold_time)
+
+    def write(self, chars, hold_time):
+        self.hold_times.append(hold_time)
+
+    def write_frame(self, frame, hold_time):
+        self.hold_times.append(hold_time)
+
+    def set_backlight(self, backlight_bool):
+        pass
+
+    def get_backlight_state(self):
+        return True
+
+
+async def write_all(writer: AsyncWriter):
+    await writer.write_with_cursor_async([[]], 0.01)
+    await writer.write_async([[]], 0.01)
+    await writer.write_frame_async(Frame([b""], {}), 0.01)
+
+
+def test_hold_time_is_awaited_not_slept_in_the_worker():
+    recording = RecordingWriter()
+    asyncio.run(write_all(AsyncWriter(recording)))
+    # The worker thread only transfers, the loop waits out the hold.
+    assert recording.hold_times == [0.0, 0.0, 0.0]
@@ -0,0 +1,60 @@
+from menu.coordinator import MenuCoordinator
+from menu.instrumentation import Instrumentation
+from options.item import MenuItem
+from options.metrics import MetricOption, MetricSpec
+from options.standards import StaticOption
+from extensions.sampler import SnapshotSourceABC
+
+# For interchangeable compatibility with MicroPython
+from collections import OrderedDict as OrdDict
+
+
+class Snapshot:
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Source(SnapshotSourceABC):
+    def __init__(self):
+        self.snapshot = Snapshot(1)
+
+    def get_snapshot(self) -> Snapshot:
+        return self.snapshot
+
+
+def get_coordinator(source: Source) -> tuple[MenuCoordinator, MetricOption]:
+    metric_option = MetricOption(MenuItem(16), source, "value", MetricSpec("Value"))
+    options = OrdDict()
+    options[StaticOption("Static", MenuItem(16))] = OrdDict()
+    options[metric_option] = OrdDict()
+    return MenuCoordinator(2, 16, options), metric_option
+
+
+def test_due_row_shows_the_fresh_value():
+    source = Source()
+    coordinator, metric_option = get_coordinator(source)
+    assert coordinator.get_frame().rows[1] == b"  Value: 1"
+
+    source.snapshot = Snapshot(2)
+    frame = coordinator.get_frame([metric_option])
+    assert frame.rows[1] == b"  Value: 2"
+
+
+def test_unchanged_rows_reuse_the_frame():
+    source = Source()
+    coordinator, metric_option = get_coordinator(source)
+    frame = coordinator.get_frame()
+    assert coordinator.get_frame([metric_option]) is frame
+
+    coordinator.increment_selection()
+    moved_frame = coordinator.get_frame([metric_option])
+    assert moved_frame is not frame
+    assert moved_frame.rows[1].startswith(b"> Value")
+
+
+def test_metric_rows_are_timed_by_key():
+    instrumentation = Instrumentation()
+    coordinator, _ = get_coordinator(Source())
+    coordinator.set_instrumentation(instrumentation)
+    coordinator.get_frame()
+    assert sorted(instrumentation.get_dump()["options"]) == ["StaticOption", "value"]
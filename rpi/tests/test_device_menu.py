@@ -0,0 +1,18 @@
+from configurations import LCD1602Config
+from extensions.acquisition import AcquisitionService
+from menu.setups.dev.device import AddDeviceMenu
+
+
+def test_deleted_sensor_is_no_longer_sampled():
+    acquisition = AcquisitionService()
+    add_device = AddDeviceMenu(LCD1602Config(), acquisition)
+    add_device._device_menu.set_type("DHT")
+    add_device._device_menu.set_pin(4)
+    add_device._add_device_to_menu()
+    assert "dht:4" in acquisition._sources
+
+    device_option = list(add_device.get_menu())[-1]
+    add_device._delete_device(device_option)
+    assert "dht:4" not in acquisition._sources
+    assert device_option not in add_device.get_menu()
+    acquisition.stop()
@@ -0,0 +1,69 @@
+from devices import dht
+from devices.dht import DHT11, DHT11Result
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_reads_min_interval_apart_are_measured(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(dht.time, "monotonic", clock.monotonic)
+    sensor = DHT11(4, min_interval=2.0)
+    starts = []
+
+    def measure() -> DHT11Result:
+        # A measurement takes about 25ms.
+        starts.append(clock.now)
+        clock.now += 0.025
+        return DHT11Result(21.0, 40.0)
+
+    monkeypatch.setattr(sensor, "_measure", measure)
+    for tick in range(4):
+        clock.now = 2.0 + tick * 2.0
+        sensor.read()
+    assert starts == [2.0, 4.0, 6.0, 8.0]
+
+    clock.now = 9.0
+    assert sensor.read().temperature == 21.0
+    assert len(starts) == 4
+
+
+def get_widths(the_bytes: list[int]) -> list[int]:
+    # Release and response pulses first, then ~26us zeros and ~70us ones.
+    widths = [30, 80]
+    for byte in the_bytes:
+        for bit in range(7, -1, -1):
+            widths.append(70 if byte >> bit & 1 else 26)
+    return widths
+
+
+def test_pulse_widths_decode_to_a_reading():
+    result = DHT11(4)._decode(get_widths([40, 0, 21, 5, 66]))
+    assert result.is_valid()
+    assert result.humidity == 40.0
+    assert result.temperature == 21.5
+
+
+def test_checksum_mismatch_is_an_error():
+    result = DHT11(4)._decode(get_widths([40, 0, 21, 5, 67]))
+    assert result.error_code == DHT11Result.ERR_CRC
+
+
+def test_missing_bits_are_an_error():
+    result = DHT11(4)._decode(get_widths([40, 0, 21, 5, 66])[:39])
+    assert result.error_code == DHT11Result.ERR_MISSING_DATA
+
+
+def test_widths_around_the_threshold():
+    threshold = DHT11.BIT_THRESHOLD_US
+    widths = []
+    for width in get_widths([128, 0, 0, 0, 128]):
+        widths.append(threshold + 1 if width == 70 else threshold)
+    result = DHT11(4)._decode(widths)
+    assert result.is_valid()
+    assert result.humidity == 128.0
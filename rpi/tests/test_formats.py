@@ -0,0 +1,38 @@
+from options.formats import MetricFormat
+from options.formats import BYTE_UNITS, PERCENT_UNITS
+
+
+def test_value_is_shown_in_largest_unit():
+    metric_format = MetricFormat("Mem", BYTE_UNITS)
+    assert metric_format.format(512) == "Mem: 512B"
+    assert metric_format.format(1536) == "Mem: 1.5KB"
+    assert metric_format.format(3 * 1024**3) == "Mem: 3.0GB"
+
+
+def test_decimals_are_dropped_to_fit():
+    metric_format = MetricFormat("Utilization", PERCENT_UNITS, width=16)
+    assert metric_format.format(45.67) == "Utilization: 46%"
+
+
+def test_label_is_cut_when_value_does_not_fit():
+    metric_format = MetricFormat("Utilization", PERCENT_UNITS, width=12)
+    string = metric_format.format(45.67)
+    assert string == "Utiliza: 46%"
+    assert len(string) == metric_format.get_width()
+
+
+def test_text_is_not_fitted():
+    metric_format = MetricFormat("Throttled", width=12)
+    assert metric_format.format("under-voltage") == "Throttled: under-voltage"
+
+
+def test_same_rounded_value_reuses_string():
+    metric_format = MetricFormat("CPU", PERCENT_UNITS)
+    string = metric_format.format(12.34)
+    assert string == "CPU: 12.3%"
+    assert metric_format.format(12.31) is string
+    assert metric_format.format(12.36) == "CPU: 12.4%"
+
+
+def test_placeholder():
+    assert MetricFormat("CPU", PERCENT_UNITS).get_placeholder() == "CPU: --"
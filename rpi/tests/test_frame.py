@@ -0,0 +1,56 @@
+from character.chars import CharArray, CustomChar, char_table
+from character.frame import Frame
+from options.item import MenuItem
+from writers.lcd_frame_writer import LCDFrameWriter
+from extensions.wgpio.emulatedio import get_device
+
+DEGREE = CustomChar(1, [0x06, 0x09, 0x09, 0x06, 0x00, 0x00, 0x00, 0x00], ord("°"))
+
+
+def get_codes(item: MenuItem) -> bytes:
+    return CharArray().get_code_array(item.get_char_array())
+
+
+def test_code_array_matches_char_array():
+    item = MenuItem(16)
+    item.set_string("A long string that scrolls")
+    item.set_selected(True)
+    for _ in range(40):
+        assert item.get_code_array() == get_codes(item)
+        item.shift()
+
+
+def test_text_outside_the_rom_is_replaced():
+    item = MenuItem(16)
+    item.set_string("Temp: 21°C ✓")
+    assert item.get_code_array() == b"  Temp: 21\xb0C ?"
+    assert item.get_code_array() == get_codes(item)
+
+
+def test_custom_glyphs_reach_cgram():
+    item = MenuItem(16)
+    chars = CharArray().get_ascii_char_array("21")
+    chars.append(DEGREE)
+    chars.extend(CharArray().get_ascii_char_array("C"))
+    item.set_char_array(chars)
+    assert item.get_code_array() == b"  21\x01C"
+    assert item.get_glyphs() == {1: DEGREE}
+
+    writer = LCDFrameWriter(2, 16)
+    device = get_device(1, 0x27)
+    frame = Frame([item.get_code_array(), b""], item.get_glyphs())
+    writer.write_frame(frame, 0.0)
+    assert bytes(device.lcd.cgram[8:16]) == bytes(DEGREE.get_value())
+    assert device.lcd.get_row(0, 16)[:6] == b"  21\x01C"
+
+    # A glyph already in CGRAM is not sent again.
+    device.reset_stats()
+    writer.write_frame(Frame([b"  22\x01C", b""], item.get_glyphs()), 0.0)
+    assert device.get_stats().data_writes == 1
+
+
+def test_code_rows_map_back_to_shared_chars():
+    char_table.set_custom_char(DEGREE)
+    chars = CharArray().get_code_char_array(b"21\x01C")
+    assert chars[0] is char_table.get_ascii_char(ord("2"))
+    assert chars[2] is DEGREE
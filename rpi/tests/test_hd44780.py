@@ -0,0 +1,72 @@
+from lcd.api import LCDAPI
+from extensions.wgpio.emulatedio import get_device
+
+
+def get_lcd(rows: int, columns: int) -> LCDAPI:
+    lcd = LCDAPI(1, 0x27, rows, columns)
+    lcd.clear()
+    return lcd
+
+
+def test_address_wraps_from_first_to_second_line():
+    lcd = get_lcd(2, 16)
+    emulated = get_device(1, 0x27).lcd
+    lcd.hal_write_command(lcd.LCD_DDRAM | 0x26)
+    for char in "abc":
+        lcd.hal_write_data(ord(char))
+
+    assert emulated.ddram[0x26] == ord("a")
+    assert emulated.ddram[0x27] == ord("b")
+    assert emulated.ddram[0x40] == ord("c")
+    assert emulated.address == 0x41
+
+
+def test_address_wraps_from_second_to_first_line():
+    lcd = get_lcd(2, 16)
+    emulated = get_device(1, 0x27).lcd
+    lcd.hal_write_command(lcd.LCD_DDRAM | 0x67)
+    lcd.hal_write_data(ord("x"))
+
+    assert emulated.ddram[0x67] == ord("x")
+    assert emulated.address == 0x00
+
+
+def test_rows_map_to_ddram_lines():
+    lcd = get_lcd(4, 20)
+    emulated = get_device(1, 0x27).lcd
+    for row in range(4):
+        lcd.move_to(0, row)
+        lcd.put_string("row " + str(row))
+
+    assert emulated.get_rows(4, 20) == [
+        "row 0".ljust(20),
+        "row 1".ljust(20),
+        "row 2".ljust(20),
+        "row 3".ljust(20),
+    ]
+    assert emulated.ddram[0x14 : 0x14 + 5] == b"row 2"
+    assert emulated.ddram[0x54 : 0x54 + 5] == b"row 3"
+
+
+def test_character_codes_continue_on_next_row():
+    lcd = get_lcd(2, 16)
+    emulated = get_device(1, 0x27).lcd
+    lcd.move_to(12, 0)
+    lcd.put_character_codes([ord(char) for char in "abcdefgh"])
+
+    assert emulated.get_row(0, 16).endswith(b"abcd")
+    assert emulated.get_row(1, 16).startswith(b"efgh")
+
+
+def test_reset_stats_keeps_counting_controller_writes():
+    lcd = get_lcd(2, 16)
+    device = get_device(1, 0x27)
+    before = device.get_stats()
+    device.reset_stats()
+    lcd.hal_write_data(ord("a"))
+
+    stats = device.get_stats()
+    assert before.commands > 0
+    assert stats.commands == 0
+    assert stats.data_writes == 1
+    assert stats.transactions > 0
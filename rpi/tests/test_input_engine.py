@@ -0,0 +1,76 @@
+from configurations import InputConfig
+from controllers.input_engine import InputEngine
+
+BACK = 0
+NEXT = 1
+
+
+def get_engine() -> InputEngine:
+    return InputEngine(InputConfig(), [NEXT])
+
+
+def test_short_press_fires_on_release():
+    engine = get_engine()
+    assert engine.update(BACK, True, 0.0) == []
+    assert engine.poll(0.01) == []
+    assert engine.update(BACK, False, 0.1) == []
+    assert engine.poll(0.11) == [(BACK, InputEngine.PRESS)]
+
+
+def test_bounce_shorter_than_debounce_is_ignored():
+    engine = get_engine()
+    engine.update(BACK, True, 0.0)
+    engine.update(BACK, False, 0.002)
+    assert engine.poll(0.01) == []
+    assert engine.poll(1.0) == []
+
+
+def test_long_press_fires_once_without_press():
+    engine = get_engine()
+    engine.update(BACK, True, 0.0)
+    assert engine.poll(0.01) == []
+    assert engine.poll(0.7) == []
+    assert engine.poll(0.81) == [(BACK, InputEngine.LONG_PRESS)]
+    assert engine.poll(2.0) == []
+    engine.update(BACK, False, 2.1)
+    assert engine.poll(2.2) == []
+
+
+def test_repeat_starts_after_delay_and_accelerates():
+    engine = get_engine()
+    engine.update(NEXT, True, 0.0)
+    assert engine.poll(0.01) == [(NEXT, InputEngine.PRESS)]
+    assert engine.poll(0.4) == []
+    assert engine.poll(0.41) == [(NEXT, InputEngine.REPEAT)]
+    # Next deadline is 0.555, the one after is 0.1275 later.
+    assert engine.poll(0.55) == []
+    assert engine.poll(0.56) == [(NEXT, InputEngine.REPEAT)]
+    assert engine.poll(0.68) == []
+    assert engine.poll(0.69) == [(NEXT, InputEngine.REPEAT)]
+
+
+def test_late_poll_yields_a_single_repeat():
+    engine = get_engine()
+    engine.update(NEXT, True, 0.0)
+    engine.poll(0.01)
+    assert engine.poll(5.0) == [(NEXT, InputEngine.REPEAT)]
+    assert engine.poll(5.01) == []
+
+
+def test_repeat_stops_on_release():
+    engine = get_engine()
+    engine.update(NEXT, True, 0.0)
+    engine.poll(0.01)
+    assert engine.update(NEXT, False, 0.1) == []
+    assert engine.poll(0.2) == []
+    assert engine.poll(1.0) == []
+    assert engine.get_timeout(1.0) is None
+
+
+def test_timeout_points_at_next_deadline():
+    engine = get_engine()
+    assert engine.get_timeout(0.0) is None
+    engine.update(BACK, True, 0.0)
+    assert abs(engine.get_timeout(0.0) - 0.005) < 1e-9
+    engine.poll(0.01)
+    assert abs(engine.get_timeout(0.01) - 0.795) < 1e-9
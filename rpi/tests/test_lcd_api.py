@@ -0,0 +1,78 @@
+from lcd.api import LCDAPI
+from extensions.wgpio.emulatedio import get_device
+
+
+def get_lcd(rows: int, columns: int, batched: bool) -> LCDAPI:
+    lcd = LCDAPI(1, 0x27, rows, columns, batched)
+    lcd.clear()
+    lcd.move_to(0, 0)
+    return lcd
+
+
+def get_codes(string: str) -> list[int]:
+    return [ord(char) for char in string]
+
+
+def test_batched_run_is_one_transaction():
+    lcd = get_lcd(2, 16, True)
+    device = get_device(1, 0x27)
+    device.reset_stats()
+    lcd.put_character_codes(get_codes("abcd"))
+
+    stats = device.get_stats()
+    assert stats.transactions == 1
+    assert stats.bytes == 4 * 6
+    assert stats.data_writes == 4
+    assert stats.commands == 0
+    assert stats.sleep_us == 0
+    assert device.lcd.get_row(0, 16).startswith(b"abcd")
+
+
+def test_unbatched_run_pulses_every_nibble():
+    lcd = get_lcd(2, 16, False)
+    device = get_device(1, 0x27)
+    device.reset_stats()
+    lcd.put_character_codes(get_codes("abcd"))
+
+    stats = device.get_stats()
+    assert stats.transactions == 4 * 6
+    assert stats.data_writes == 4
+    assert stats.sleep_us == 4 * 2 * 51
+
+
+def test_batched_run_wraps_onto_next_row():
+    lcd = get_lcd(4, 20, True)
+    device = get_device(1, 0x27)
+    lcd.move_to(16, 1)
+    lcd.put_character_codes(get_codes("abcdefgh"))
+
+    rows = device.lcd.get_rows(4, 20)
+    assert rows[1].endswith("abcd")
+    assert rows[2].startswith("efgh")
+    assert lcd.address == device.lcd.address
+
+
+def test_batched_matches_unbatched_contents():
+    string = "Hello World 12345678" * 4
+    displays = []
+    for batched in (False, True):
+        lcd = get_lcd(4, 20, batched)
+        lcd.put_character_codes(get_codes(string))
+        displays.append(get_device(1, 0x27).lcd.get_rows(4, 20))
+
+    assert displays[0] == displays[1]
+    assert displays[1][3] == "Hello World 12345678"
+
+
+def test_batched_clear_waits_for_the_controller():
+    lcd = get_lcd(2, 16, True)
+    device = get_device(1, 0x27)
+    lcd.put_character_codes(get_codes("abcd"))
+    device.reset_stats()
+    lcd.clear()
+
+    stats = device.get_stats()
+    # Clear and home, each followed by the 2ms wait.
+    assert stats.commands == 2
+    assert stats.sleep_us == 2 * 2000
+    assert device.lcd.get_row(0, 16) == b" " * 16
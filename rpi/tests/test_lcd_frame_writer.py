@@ -0,0 +1,55 @@
+from character.frame import Frame
+from writers.lcd_frame_writer import LCDFrameWriter
+from extensions.wgpio.emulatedio import get_device
+
+
+def get_writer() -> LCDFrameWriter:
+    writer = LCDFrameWriter(2, 16)
+    writer.write_frame(Frame([b"  Temp: 21.5C", b"> Humidity: 40%"], {}), 0.0)
+    return writer
+
+
+def test_first_frame_fills_the_display():
+    get_writer()
+    assert get_device(1, 0x27).lcd.get_rows(2, 16) == [
+        "  Temp: 21.5C   ",
+        "> Humidity: 40% ",
+    ]
+
+
+def test_only_changed_runs_are_flushed():
+    writer = get_writer()
+    device = get_device(1, 0x27)
+    device.reset_stats()
+    frame = Frame([b"  Temp: 22.0C", b"> Humidity: 41%"], {})
+
+    spans = writer.get_frame_spans(frame)
+    assert [(row, st_idx, en_idx) for _, row, st_idx, en_idx in spans] == [
+        (0, 9, 10),
+        (0, 11, 12),
+        (1, 13, 14),
+    ]
+    for span in spans:
+        writer.flush_span(span)
+
+    stats = device.get_stats()
+    assert stats.data_writes == 3
+    assert stats.commands == 3
+    assert device.lcd.get_rows(2, 16) == ["  Temp: 22.0C   ", "> Humidity: 41% "]
+
+
+def test_unchanged_frame_sends_nothing():
+    writer = get_writer()
+    device = get_device(1, 0x27)
+    device.reset_stats()
+    frame = Frame([b"  Temp: 21.5C", b"> Humidity: 40%"], {})
+    writer.write_frame(frame, 0.0)
+    writer.write_frame(frame, 0.0)
+    assert device.get_stats().transactions == 0
+
+
+def test_shorter_row_clears_the_tail():
+    writer = get_writer()
+    device = get_device(1, 0x27)
+    writer.write_frame(Frame([b"  Temp: 9C", b"> Humidity: 40%"], {}), 0.0)
+    assert device.lcd.get_row(0, 16) == b"  Temp: 9C      "
@@ -0,0 +1,100 @@
+from character.frame import Frame
+from writers import lcd_group_writer
+from writers.lcd_group_writer import LCDGroupWriter
+from extensions.wgpio import emulatedio
+from extensions.wgpio.emulatedio import get_device
+
+ADDRESSES = (0x27, 0x26)
+FIRST = Frame([b"  Temp: 21.5C", b"> Humidity: 40%"], {})
+SECOND = Frame([b"  Temp: 22.0C", b"> Humidity: 40%"], {})
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def get_rows(address: int) -> list[str]:
+    return get_device(1, address).lcd.get_rows(2, 16)
+
+
+def break_display(monkeypatch, address: int):
+    write_device = emulatedio.I2CGPIO.write_device
+
+    def failing_write_device(self, buffer: list[int]):
+        if self.address == address:
+            raise OSError("I2C write failed")
+        write_device(self, buffer)
+
+    monkeypatch.setattr(emulatedio.I2CGPIO, "write_device", failing_write_device)
+
+
+def test_frame_is_mirrored_on_every_display():
+    writer = LCDGroupWriter(2, 16, 1, ADDRESSES)
+    writer.write_frame(FIRST, 0.0)
+    for device in (get_device(1, 0x27), get_device(1, 0x26)):
+        device.reset_stats()
+    writer.write_frame(SECOND, 0.0)
+
+    for address in ADDRESSES:
+        assert get_rows(address) == ["  Temp: 22.0C   ", "> Humidity: 40% "]
+        assert get_device(1, address).get_stats().data_writes == 2
+
+
+def test_spans_alternate_between_displays(monkeypatch):
+    writer = LCDGroupWriter(2, 16, 1, ADDRESSES)
+    writer.write_frame(FIRST, 0.0)
+    addresses = []
+    write_device = emulatedio.I2CGPIO.write_device
+
+    def recording_write_device(self, buffer: list[int]):
+        addresses.append(self.address)
+        write_device(self, buffer)
+
+    monkeypatch.setattr(emulatedio.I2CGPIO, "write_device", recording_write_device)
+    writer.write_frame(SECOND, 0.0)
+
+    # Per span a DDRAM move and a data run, displays take turns.
+    first_spans = addresses[0:2] + addresses[2:4]
+    assert first_spans == [0x27, 0x27, 0x26, 0x26]
+    assert addresses.count(0x27) == addresses.count(0x26)
+
+
+def test_failing_display_does_not_stop_the_others(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(lcd_group_writer.time, "monotonic", clock.monotonic)
+    writer = LCDGroupWriter(2, 16, 1, ADDRESSES)
+    writer.write_frame(FIRST, 0.0)
+
+    with monkeypatch.context() as context:
+        break_display(context, 0x26)
+        writer.write_frame(SECOND, 0.0)
+        assert get_rows(0x27)[0] == "  Temp: 22.0C   "
+        assert writer.get_writer(1) is None
+
+    # Left alone until the retry time, then cleared and redrawn.
+    writer.write_frame(FIRST, 0.0)
+    assert writer.get_writer(1) is None
+    clock.now += LCDGroupWriter.RETRY_INTERVAL
+    writer.write_frame(FIRST, 0.0)
+    assert writer.get_writer(1) is not None
+    assert get_rows(0x26) == ["  Temp: 21.5C   ", "> Humidity: 40% "]
+
+
+def test_display_missing_at_start_is_set_up_later(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(lcd_group_writer.time, "monotonic", clock.monotonic)
+    with monkeypatch.context() as context:
+        break_display(context, 0x26)
+        writer = LCDGroupWriter(2, 16, 1, ADDRESSES)
+        writer.set_backlight(False)
+        writer.write_frame(FIRST, 0.0)
+        assert get_rows(0x27)[0] == "  Temp: 21.5C   "
+
+    clock.now += LCDGroupWriter.RETRY_INTERVAL
+    writer.write_frame(FIRST, 0.0)
+    assert get_rows(0x26)[0] == "  Temp: 21.5C   "
+    assert not get_device(1, 0x26).lcd.backlight
@@ -0,0 +1,79 @@
+from character.frame import Frame
+from options.item import MenuItem
+from writers.lcd_frame_writer import LCDFrameWriter
+from extensions.wgpio.emulatedio import get_device
+
+# Columns 10, hold 1: two ticks at the start, shift to the end, two
+# ticks at the end, start over.
+SCROLL = [
+    b"> abcdefg~",
+    b"> abcdefg~",
+    b"> \x7fbcdefg~",
+    b"> \x7fcdefgh~",
+    b"> \x7fdefghi~",
+    b"> \x7fefghij~",
+    b"> \x7ffghijk~",
+    b"> \x7fghijkl",
+    b"> \x7fghijkl",
+]
+
+
+def get_item(string: str) -> MenuItem:
+    item = MenuItem(10, 1)
+    item.set_string(string)
+    item.set_selected(True)
+    return item
+
+
+def get_scroll(item: MenuItem, ticks: int) -> list[bytes]:
+    frames = []
+    for _ in range(ticks):
+        frames.append(item.get_code_array())
+        item.shift()
+    return frames
+
+
+def test_scroll_cycle():
+    item = get_item("abcdefghijkl")
+    assert get_scroll(item, len(SCROLL) * 2) == SCROLL * 2
+
+
+def test_items_of_same_length_share_the_cycle():
+    item = get_item("abcdefghijkl")
+    other_item = get_item("mnopqrstuvwx")
+    assert item._cycle is other_item._cycle
+    assert get_item("short")._cycle is not item._cycle
+
+
+def test_short_string_does_not_scroll():
+    item = get_item("short")
+    assert get_scroll(item, 5) == [b"> short"] * 5
+    assert not item.is_dirty()
+
+
+def test_same_length_string_keeps_position():
+    item = get_item("abcdefghijkl")
+    get_scroll(item, 4)
+    item.set_string("ABCDEFGHIJKL")
+    assert item.get_code_array() == b"> \x7fDEFGHI~"
+
+
+def test_deselected_item_returns_to_start():
+    item = get_item("abcdefghijkl")
+    get_scroll(item, 4)
+    item.set_selected(False)
+    item.shift()
+    assert item.get_code_array() == b"  abcdefg~"
+
+
+def test_scroll_only_sends_changed_cells():
+    item = get_item("abcdefghijkl")
+    writer = LCDFrameWriter(2, 10)
+    device = get_device(1, 0x27)
+    for code_array in get_scroll(item, len(SCROLL)):
+        device.reset_stats()
+        writer.write_frame(Frame([code_array, b""], {}), 0.0)
+        assert device.lcd.get_row(0, 10) == code_array.ljust(10)
+
+    # The end hold repeats the previous row, nothing is sent.
+    assert device.get_stats().data_writes == 0
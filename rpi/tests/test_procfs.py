@@ -0,0 +1,64 @@
+from extensions import procfs
+from extensions.procfs import DiskStats, KeptFile, NetDevStats
+
+DISKSTATS = """\
+   7       0 loop0 50 0 800 10 0 0 0 0 0 10 10
+   8       0 sda 100 5 2000 30 50 2 4000 60 0 90 90
+   8       1 sda1 90 5 1800 25 45 2 3600 55 0 80 80
+ 179       0 mmcblk0 10 0 200 5 20 0 600 8 0 12 12
+ 253       0 dm-0 70 0 1400 20 30 0 2400 40 0 60 60
+"""
+
+NET_DEV = """\
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:    1000      10    0    0    0     0          0         0     1000      10    0    0    0     0       0          0
+  eth0:    5000      50    0    0    0     0          0         0     7000      70    0    0    0     0       0          0
+ wlan0:     300       3    0    0    0     0          0         0      400       4    0    0    0     0       0          0
+"""
+
+
+def test_kept_file_reads_current_content(tmp_path):
+    path = tmp_path / "counter"
+    path.write_text("1\n")
+    kept_file = KeptFile(str(path))
+    assert kept_file.read() == "1\n"
+
+    # Rewritten in place, the open descriptor sees the new content.
+    with open(path, "r+") as file:
+        file.write("2\n")
+    assert kept_file.read() == "2\n"
+    kept_file.close()
+
+
+def test_kept_file_missing_path(tmp_path):
+    path = tmp_path / "missing"
+    kept_file = KeptFile(str(path))
+    assert kept_file.read() is None
+
+    # Missing files are not looked up again.
+    path.write_text("1\n")
+    assert kept_file.read() is None
+
+
+def test_disk_stats_sum_whole_disks(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        procfs.os, "listdir", lambda path: ["sda", "mmcblk0", "loop0", "dm-0"]
+    )
+    path = tmp_path / "diskstats"
+    path.write_text(DISKSTATS)
+
+    disk_stats = DiskStats(str(path))
+    assert disk_stats.read() == ((2000 + 200) * 512, (4000 + 600) * 512)
+
+
+def test_disk_stats_missing_file(tmp_path):
+    assert DiskStats(str(tmp_path / "diskstats")).read() is None
+
+
+def test_net_dev_stats_skip_loopback(tmp_path):
+    path = tmp_path / "dev"
+    path.write_text(NET_DEV)
+
+    net_dev_stats = NetDevStats(str(path))
+    assert net_dev_stats.read() == (5000 + 300, 7000 + 400)
@@ -0,0 +1,50 @@
+from devices.quadrature import QuadratureDecoder
+
+CLOCKWISE = ((1, 0), (0, 0), (0, 1), (1, 1))
+COUNTER_CLOCKWISE = ((0, 1), (0, 0), (1, 0), (1, 1))
+
+
+def get_steps(decoder: QuadratureDecoder, states) -> list[int]:
+    return [decoder.update(a_state, b_state) for a_state, b_state in states]
+
+
+def test_transitions_are_antisymmetric():
+    transitions = QuadratureDecoder.TRANSITIONS
+    for previous in range(4):
+        for current in range(4):
+            forward = transitions[(previous << 2) | current]
+            backward = transitions[(current << 2) | previous]
+            assert forward == -backward
+
+
+def test_skipped_states_count_nothing():
+    transitions = QuadratureDecoder.TRANSITIONS
+    assert transitions[(0b11 << 2) | 0b00] == 0
+    assert transitions[(0b10 << 2) | 0b01] == 0
+    for state in range(4):
+        assert transitions[(state << 2) | state] == 0
+
+
+def test_clockwise_cycle_is_one_detent():
+    decoder = QuadratureDecoder()
+    assert get_steps(decoder, CLOCKWISE) == [0, 0, 0, 1]
+    assert decoder.get_position() == 1
+
+
+def test_counter_clockwise_cycle_is_one_detent():
+    decoder = QuadratureDecoder()
+    assert get_steps(decoder, COUNTER_CLOCKWISE) == [0, 0, 0, -1]
+    assert decoder.get_position() == -1
+
+
+def test_half_turn_backed_out_counts_nothing():
+    decoder = QuadratureDecoder()
+    get_steps(decoder, ((1, 0), (0, 0), (1, 0), (1, 1)))
+    assert decoder.get_position() == 0
+    assert get_steps(decoder, CLOCKWISE) == [0, 0, 0, 1]
+
+
+def test_contact_bounce_counts_nothing():
+    decoder = QuadratureDecoder()
+    get_steps(decoder, ((1, 0), (1, 1), (1, 0), (1, 1)))
+    assert decoder.get_position() == 0
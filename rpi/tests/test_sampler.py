@@ -0,0 +1,32 @@
+import psutil
+
+from extensions.sampler import SystemSampler
+
+
+def test_system_sample_reads_all_fields():
+    snapshot = SystemSampler().sample()
+    assert snapshot.cpu_usage is not None
+    assert snapshot.memory_total > 0
+
+
+def test_failing_field_leaves_others(monkeypatch):
+    sampler = SystemSampler()
+    # No cpufreq driver: psutil returns None instead of a reading.
+    monkeypatch.setattr(psutil, "cpu_freq", lambda: None)
+    snapshot = sampler.sample()
+    assert snapshot.cpu_frequency_mhz is None
+    assert snapshot.cpu_usage is not None
+    assert snapshot.memory_total > 0
+
+
+def test_failing_memory_blanks_memory_fields(monkeypatch):
+    sampler = SystemSampler()
+
+    def virtual_memory():
+        raise OSError("/proc/meminfo")
+
+    monkeypatch.setattr(psutil, "virtual_memory", virtual_memory)
+    snapshot = sampler.sample()
+    assert snapshot.memory_total is None
+    assert snapshot.memory_usage is None
+    assert snapshot.cpu_usage is not None
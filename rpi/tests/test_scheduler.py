@@ -0,0 +1,29 @@
+from menu.scheduler import RenderScheduler
+from menu.tickrate import Tickrate
+from options.item import MenuItem
+from options.standards import StaticOption
+
+
+def get_options(count: int) -> list[StaticOption]:
+    return [StaticOption(str(idx), MenuItem(16)) for idx in range(count)]
+
+
+def test_first_deadline_is_one_interval_away():
+    scheduler = RenderScheduler(Tickrate(10))
+    options = get_options(2)
+    assert scheduler.get_due_options(options, 0.0) == []
+    assert abs(scheduler.get_timeout(options, 0.0) - 0.1) < 1e-9
+    assert scheduler.get_due_options(options, 0.1) == options
+
+
+def test_hidden_options_are_dropped():
+    scheduler = RenderScheduler(Tickrate(10))
+    options = get_options(4)
+    scheduler.get_due_options(options, 0.0)
+    scheduler.get_due_options(options[:2], 0.05)
+    assert len(scheduler._deadlines) == 2
+
+    # Shown again, a dropped option starts a new interval.
+    assert scheduler.get_due_options(options, 0.1) == options[:2]
+    assert scheduler.get_due_options(options, 0.15) == []
+    assert scheduler.get_due_options(options, 0.2) == options
@@ -1,5 +1,6 @@
 from extensions.std.abc import ABC, abstractmethod
 from character.abstracts import CharABC
+from character.frame import Frame
 
 
 class WriterABC(ABC):
@@ -15,6 +16,10 @@ class WriterABC(ABC):
     def write(self, chars: list[list[CharABC]], hold_time: float):
         pass
 
+    @abstractmethod
+    def write_frame(self, frame: Frame, hold_time: float):
+        pass
+
     @abstractmethod
     def set_backlight(self, backlight_bool: bool):
         pass
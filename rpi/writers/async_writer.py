@@ -0,0 +1,62 @@
+import asyncio
+from threading import Lock
+
+from writers.abstracts import WriterABC
+from character.abstracts import CharABC
+from character.frame import Frame
+
+
+class AsyncWriterBase(WriterABC):
+    def __init__(self, writer: WriterABC):
+        self._writer = writer
+        self._lock = Lock()
+
+    def _write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
+        with self._lock:
+            self._writer.write_with_cursor(chars, hold_time)
+
+    def _write(self, chars: list[list[CharABC]], hold_time: float):
+        with self._lock:
+            self._writer.write(chars, hold_time)
+
+    def _write_frame(self, frame: Frame, hold_time: float):
+        with self._lock:
+            self._writer.write_frame(frame, hold_time)
+
+    def _set_backlight(self, backlight_bool: bool):
+        with self._lock:
+            self._writer.set_backlight(backlight_bool)
+
+
+class AsyncWriter(AsyncWriterBase):
+    def __init__(self, writer: WriterABC):
+        super().__init__(writer)
+
+    def write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
+        self._write_with_cursor(chars, hold_time)
+
+    def write(self, chars: list[list[CharABC]], hold_time: float):
+        self._write(chars, hold_time)
+
+    def write_frame(self, frame: Frame, hold_time: float):
+        self._write_frame(frame, hold_time)
+
+    def set_backlight(self, backlight_bool: bool):
+        self._set_backlight(backlight_bool)
+
+    def get_backlight_state(self) -> bool:
+        return self._writer.get_backlight_state()
+
+    async def write_with_cursor_async(
+        self, chars: list[list[CharABC]], hold_time: float
+    ):
+        await asyncio.to_thread(self._write_with_cursor, chars, 0.0)
+        await asyncio.sleep(hold_time)
+
+    async def write_async(self, chars: list[list[CharABC]], hold_time: float):
+        await asyncio.to_thread(self._write, chars, 0.0)
+        await asyncio.sleep(hold_time)
+
+    async def write_frame_async(self, frame: Frame, hold_time: float):
+        await asyncio.to_thread(self._write_frame, frame, 0.0)
+        await asyncio.sleep(hold_time)
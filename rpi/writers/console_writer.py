@@ -2,8 +2,10 @@ import sys
 from time import sleep
 
 from writers.abstracts import WriterABC
-from character.abstracts import CharABC, ASCIICharABC, ByteCharABC
-from character.chars import SpaceChar
+from character.abstracts import CharABC, ASCIICharABC, ByteCharABC, CustomCharABC
+from character.chars import CharArray, char_table
+from character.frame import Frame
+from extensions.std.typing import Optional
 
 
 class ConsoleLCD:
@@ -65,6 +67,9 @@ class ConsoleWriterBase(WriterABC):
         self._console = self._get_console()
         self._row_states: list[int] = [0] * rows
         self._row_data: list[list[CharABC]] = [[]] * rows
+        # The unpadded lists as handed in, clean menu items hand out the
+        # very same list again. _row_data keeps the padded copy.
+        self._row_sources: list[Optional[list[CharABC]]] = [None] * rows
 
     def _get_console(self) -> ConsoleLCD:
         console = ConsoleLCD(self._rows, self._columns)
@@ -73,12 +78,12 @@ class ConsoleWriterBase(WriterABC):
     def _set_row_state(self, chars: list[CharABC], row: int):
         self._row_states[row] = len(chars)
 
-    def _fill_chars(self, chars: list[CharABC], row: int):
+    def _fill_chars(self, chars: list[CharABC], row: int) -> list[CharABC]:
         row_state = self._row_states[row]
         fill = row_state - len(chars)
         if fill > 0:
-            for _ in range(fill):
-                chars.append(SpaceChar())
+            chars = chars + [char_table.get_space_char()] * fill
+        return chars
 
     def _insert_row_data(self, chars: list[CharABC], row: int):
         self._row_data[row] = chars
@@ -111,12 +116,22 @@ class ConsoleWriterBase(WriterABC):
             self._console.put_character_code(value)
             return
 
+        elif isinstance(char, CustomCharABC):
+            self._console.move_to(column, row)
+            value = char.get_unicode_value()
+            self._console.put_character_code(value)
+            return
+
         raise NotImplementedError(f"Not Implemented: {char}")
 
     def _write_row(self, segment: list[CharABC], row: int):
+        if segment is self._row_sources[row]:
+            return
+
+        self._row_sources[row] = segment
         len_chars = len(segment)
         prev_chars = self._row_data[row]
-        self._fill_chars(segment, row)
+        segment = self._fill_chars(segment, row)
         changes = self._get_char_changes(segment, prev_chars)
 
         for char, column in changes:
@@ -126,6 +141,15 @@ class ConsoleWriterBase(WriterABC):
         self._insert_row_data(segment, row)
         self._set_row_state(segment, row)
 
+    def _get_frame_chars(self, frame: Frame) -> list[list[CharABC]]:
+        for glyph in frame.glyphs.values():
+            char_table.set_custom_char(glyph)
+
+        chars = []
+        for code_array in frame.rows:
+            chars.append(CharArray().get_code_char_array(code_array))
+        return chars
+
     def _write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
         self._console.blink_cursor_on()
         for idx, segment in enumerate(chars):
@@ -150,6 +174,10 @@ class ConsoleWriter(ConsoleWriterBase):
     def write(self, chars: list[list[CharABC]], hold_time: float):
         self._write(chars, hold_time)
 
+    def write_frame(self, frame: Frame, hold_time: float):
+        chars = self._get_frame_chars(frame)
+        self._write(chars, hold_time)
+
     def set_backlight(self, backlight_bool: bool):
         if backlight_bool:
             self._console.backlight_on()
@@ -0,0 +1,199 @@
+from time import sleep
+
+from lcd.api import LCDAPI
+from writers.abstracts import WriterABC
+from character.abstracts import CharABC, ASCIICharABC, ByteCharABC, CustomCharABC
+from character.frame import Frame
+from extensions.std.typing import Optional
+
+# (codes, row, st_idx, en_idx) of a run of changed cells.
+Span = tuple[bytes, int, int, int]
+
+
+class LCDFrameWriterBase(WriterABC):
+    def __init__(self, rows: int, columns: int, bus: int, address: int):
+        self._rows = rows
+        self._columns = columns
+        self._bus = bus
+        self._address = address
+        self._lcd_api = self._get_lcd_api()
+        self._space_code = ord(" ")
+        self._framebuffer = self._get_framebuffer()
+        self._row_sources: list[Optional[list[CharABC] | bytes]] = [None] * rows
+        self._glyphs: list[Optional[CustomCharABC]] = [None] * 8
+        self._frame: Optional[Frame] = None
+        self._cursor_hidden = False
+
+    def _get_lcd_api(self) -> LCDAPI:
+        lcd = LCDAPI(self._bus, self._address, self._rows, self._columns, batched=True)
+        return lcd
+
+    def _get_framebuffer(self) -> bytearray:
+        # The display RAM is filled with spaces after LCDAPI clears it.
+        framebuffer = bytearray([self._space_code]) * (self._rows * self._columns)
+        return framebuffer
+
+    def _get_char_code(self, char: CharABC) -> int:
+        if isinstance(char, ASCIICharABC):
+            return char.get_value()
+
+        elif isinstance(char, ByteCharABC):
+            return char.get_value()
+
+        elif isinstance(char, CustomCharABC):
+            self._load_glyph(char)
+            return char.cgram
+
+        raise NotImplementedError(f"Not Implemented: {char}")
+
+    def _get_row_codes(self, segment: list[CharABC]) -> bytearray:
+        codes = bytearray([self._space_code]) * self._columns
+        for idx in range(min(len(segment), self._columns)):
+            codes[idx] = self._get_char_code(segment[idx]) & 0xFF
+        return codes
+
+    def _get_padded_codes(self, code_array: bytes) -> bytes:
+        if len(code_array) == self._columns:
+            return code_array
+        padded = code_array[: self._columns]
+        return padded + bytes([self._space_code]) * (self._columns - len(padded))
+
+    def _load_glyph(self, glyph: CustomCharABC):
+        if self._glyphs[glyph.cgram] is glyph:
+            return
+        self._lcd_api.put_custom_char(glyph.cgram, glyph.get_value())
+        self._glyphs[glyph.cgram] = glyph
+
+    def _get_dirty_spans(self, codes: bytes, row: int) -> list[tuple[int, int]]:
+        offset = row * self._columns
+        framebuffer = self._framebuffer
+        spans = []
+        st_idx = -1
+
+        for idx in range(self._columns):
+            if codes[idx] != framebuffer[offset + idx]:
+                if st_idx < 0:
+                    st_idx = idx
+                continue
+
+            if st_idx >= 0:
+                spans.append((st_idx, idx))
+                st_idx = -1
+
+        if st_idx >= 0:
+            spans.append((st_idx, self._columns))
+        return spans
+
+    def _flush_span(self, codes: bytes, row: int, st_idx: int, en_idx: int):
+        offset = row * self._columns
+        self._lcd_api.move_to(st_idx, row)
+        self._lcd_api.put_character_codes(list(codes[st_idx:en_idx]))
+        self._framebuffer[offset + st_idx : offset + en_idx] = codes[st_idx:en_idx]
+
+    def _get_code_spans(self, codes: bytes, row: int) -> list[Span]:
+        offset = row * self._columns
+        if self._framebuffer[offset : offset + self._columns] == codes:
+            return []
+
+        spans = []
+        for st_idx, en_idx in self._get_dirty_spans(codes, row):
+            spans.append((codes, row, st_idx, en_idx))
+        return spans
+
+    def _write_codes(self, codes: bytes, row: int):
+        for span in self._get_code_spans(codes, row):
+            self._flush_span(*span)
+
+    def _hide_cursor(self):
+        if not self._cursor_hidden:
+            self._lcd_api.hide_cursor()
+            self._cursor_hidden = True
+
+    def _write_row(self, segment: list[CharABC], row: int):
+        # Clean menu items return the very same list as last frame.
+        if segment is self._row_sources[row]:
+            return
+
+        self._row_sources[row] = segment
+        self._write_codes(self._get_row_codes(segment), row)
+
+    def _get_code_row_spans(self, code_array: bytes, row: int) -> list[Span]:
+        if code_array is self._row_sources[row]:
+            return []
+
+        self._row_sources[row] = code_array
+        return self._get_code_spans(self._get_padded_codes(code_array), row)
+
+    def _write_rows(self, chars: list[list[CharABC]]):
+        self._frame = None
+        for idx, segment in enumerate(chars[: self._rows]):
+            self._write_row(segment, idx)
+
+    def _get_frame_spans(self, frame: Frame) -> list[Span]:
+        # The coordinator hands out the same Frame while nothing changed.
+        if frame is self._frame:
+            return []
+
+        self._frame = frame
+        for glyph in frame.glyphs.values():
+            self._load_glyph(glyph)
+
+        spans = []
+        for idx, code_array in enumerate(frame.rows[: self._rows]):
+            spans.extend(self._get_code_row_spans(code_array, idx))
+        return spans
+
+    def _write_frame_rows(self, frame: Frame):
+        for span in self._get_frame_spans(frame):
+            self._flush_span(*span)
+
+    def _write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
+        self._cursor_hidden = False
+        self._lcd_api.blink_cursor_on()
+        self._write_rows(chars)
+        if chars:
+            self._lcd_api.move_to(len(chars[-1]), len(chars) - 1)
+        sleep(hold_time)
+        self._lcd_api.blink_cursor_off()
+
+    def _write(self, chars: list[list[CharABC]], hold_time: float):
+        self._hide_cursor()
+        self._write_rows(chars)
+        sleep(hold_time)
+
+    def _write_frame(self, frame: Frame, hold_time: float):
+        self._hide_cursor()
+        self._write_frame_rows(frame)
+        sleep(hold_time)
+
+
+class LCDFrameWriter(LCDFrameWriterBase):
+    def __init__(self, rows: int, columns: int, bus: int = 1, address: int = 0x27):
+        super().__init__(rows, columns, bus, address)
+
+    def write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
+        self._write_with_cursor(chars, hold_time)
+
+    def write(self, chars: list[list[CharABC]], hold_time: float):
+        self._write(chars, hold_time)
+
+    def write_frame(self, frame: Frame, hold_time: float):
+        self._write_frame(frame, hold_time)
+
+    def get_frame_spans(self, frame: Frame) -> list[Span]:
+        return self._get_frame_spans(frame)
+
+    def flush_span(self, span: Span):
+        self._flush_span(*span)
+
+    def hide_cursor(self):
+        self._hide_cursor()
+
+    def set_backlight(self, backlight_bool: bool):
+        if backlight_bool:
+            self._lcd_api.backlight_on()
+            return
+        self._lcd_api.backlight_off()
+
+    def get_backlight_state(self) -> bool:
+        return self._lcd_api.get_backlight_state()
@@ -0,0 +1,166 @@
+import time
+import logging
+
+from writers.abstracts import WriterABC
+from writers.lcd_frame_writer import LCDFrameWriter, Span
+from character.abstracts import CharABC, CustomCharABC
+from character.chars import CharArray
+from character.frame import Frame
+from extensions.std.typing import Optional
+
+
+class LCDGroupWriterBase(WriterABC):
+    # Seconds a failed display is left alone before it is set up again.
+    RETRY_INTERVAL = 5.0
+
+    def __init__(self, rows: int, columns: int, bus: int, addresses: tuple[int, ...]):
+        self._rows = rows
+        self._columns = columns
+        self._bus = bus
+        self._addresses = addresses
+        self._backlight = True
+        # A failed display has no writer until its retry time.
+        self._writers: list[Optional[LCDFrameWriter]] = [None] * len(addresses)
+        self._retry_times = [0.0] * len(addresses)
+        now = time.monotonic()
+        for idx in range(len(addresses)):
+            self._get_writer(idx, now)
+
+    def _get_new_writer(self, idx: int) -> LCDFrameWriter:
+        address = self._addresses[idx]
+        writer = LCDFrameWriter(self._rows, self._columns, self._bus, address)
+        if not self._backlight:
+            writer.set_backlight(False)
+        return writer
+
+    def _get_writer(self, idx: int, now: float) -> Optional[LCDFrameWriter]:
+        writer = self._writers[idx]
+        if writer is not None:
+            return writer
+
+        if now < self._retry_times[idx]:
+            return None
+
+        # Set up from scratch, the display may have lost power.
+        try:
+            writer = self._get_new_writer(idx)
+        except Exception as error:
+            self._set_failed(idx, error, now)
+            return None
+        self._writers[idx] = writer
+        return writer
+
+    def _set_failed(self, idx: int, error: Exception, now: float):
+        # The display's contents are unknown after a failed transfer, it
+        # is skipped for a while and then cleared and redrawn.
+        address = self._addresses[idx]
+        logging.warning(f"Display 0x{address:02x} failed: {error}")
+        self._writers[idx] = None
+        self._retry_times[idx] = now + self.RETRY_INTERVAL
+
+    def _get_chars_frame(self, chars: list[list[CharABC]]) -> Frame:
+        glyphs = {}
+        rows = []
+        for segment in chars:
+            rows.append(CharArray().get_code_array(segment))
+            for char in segment:
+                if isinstance(char, CustomCharABC):
+                    glyphs[char.cgram] = char
+        return Frame(rows, glyphs)
+
+    def _get_pending_spans(self, frame: Frame, now: float) -> list[list[Span]]:
+        pending: list[list[Span]] = []
+        for idx in range(len(self._addresses)):
+            writer = self._get_writer(idx, now)
+            spans: list[Span] = []
+            if writer is not None:
+                try:
+                    writer.hide_cursor()
+                    spans = writer.get_frame_spans(frame)
+                except Exception as error:
+                    self._set_failed(idx, error, now)
+            pending.append(spans)
+        return pending
+
+    def _flush_span(self, idx: int, span: Span, now: float):
+        writer = self._writers[idx]
+        if writer is None:
+            return
+        try:
+            writer.flush_span(span)
+        except Exception as error:
+            self._set_failed(idx, error, now)
+
+    def _write_frame(self, frame: Frame, hold_time: float):
+        now = time.monotonic()
+        pending = self._get_pending_spans(frame, now)
+
+        # Round-robin over the displays so each panel receives its first
+        # span before any panel receives its second, a long diff on one
+        # display does not hold back the others.
+        depth = max((len(spans) for spans in pending), default=0)
+        for span_idx in range(depth):
+            for idx, spans in enumerate(pending):
+                if span_idx < len(spans):
+                    self._flush_span(idx, spans[span_idx], now)
+        time.sleep(hold_time)
+
+    def _write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
+        now = time.monotonic()
+        for idx in range(len(self._addresses)):
+            writer = self._get_writer(idx, now)
+            if writer is None:
+                continue
+            try:
+                writer.write_with_cursor(chars, 0.0)
+            except Exception as error:
+                self._set_failed(idx, error, now)
+        time.sleep(hold_time)
+
+    def _set_backlight(self, backlight_bool: bool):
+        # Remembered, a display set up again later gets the same state.
+        self._backlight = backlight_bool
+        now = time.monotonic()
+        for idx in range(len(self._addresses)):
+            writer = self._get_writer(idx, now)
+            if writer is None:
+                continue
+            try:
+                writer.set_backlight(backlight_bool)
+            except Exception as error:
+                self._set_failed(idx, error, now)
+
+
+class LCDGroupWriter(LCDGroupWriterBase):
+    def __init__(
+        self,
+        rows: int,
+        columns: int,
+        bus: int = 1,
+        addresses: tuple[int, ...] = (0x27,),
+    ):
+        super().__init__(rows, columns, bus, addresses)
+
+    def get_writer(self, index: int) -> Optional[LCDFrameWriter]:
+        # None while the display is failed and waiting for its retry.
+        return self._writers[index]
+
+    def get_display_count(self) -> int:
+        return len(self._addresses)
+
+    def write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
+        self._write_with_cursor(chars, hold_time)
+
+    def write(self, chars: list[list[CharABC]], hold_time: float):
+        frame = self._get_chars_frame(chars)
+        self._write_frame(frame, hold_time)
+
+    def write_frame(self, frame: Frame, hold_time: float):
+        # Mirrored: the frame is rendered once and diffed per display.
+        self._write_frame(frame, hold_time)
+
+    def set_backlight(self, backlight_bool: bool):
+        self._set_backlight(backlight_bool)
+
+    def get_backlight_state(self) -> bool:
+        return self._backlight
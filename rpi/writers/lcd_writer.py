@@ -2,31 +2,39 @@ from time import sleep
 
 from lcd.api import LCDAPI
 from writers.abstracts import WriterABC
-from character.abstracts import CharABC, ASCIICharABC, ByteCharABC
-from character.chars import SpaceChar
+from character.abstracts import CharABC, ASCIICharABC, ByteCharABC, CustomCharABC
+from character.chars import CharArray, char_table
+from character.frame import Frame
+from extensions.std.typing import Optional
 
 
 class LCDWriterBase(WriterABC):
-    def __init__(self, rows: int, columns: int):
+    def __init__(self, rows: int, columns: int, bus: int, address: int):
         self._rows = rows
         self._columns = columns
+        self._bus = bus
+        self._address = address
         self._lcd_api = self._get_lcd_api()
         self._row_states: list[int] = [0] * rows
         self._row_data: list[list[CharABC]] = [[]] * rows
+        # The unpadded lists as handed in, clean menu items hand out the
+        # very same list again. _row_data keeps the padded copy.
+        self._row_sources: list[Optional[list[CharABC]]] = [None] * rows
+        self._glyphs: list[Optional[CustomCharABC]] = [None] * 8
 
     def _get_lcd_api(self) -> LCDAPI:
-        lcd = LCDAPI(1, 0x27, self._rows, self._columns)
+        lcd = LCDAPI(self._bus, self._address, self._rows, self._columns, batched=True)
         return lcd
 
     def _set_row_state(self, chars: list[CharABC], row: int):
         self._row_states[row] = len(chars)
 
-    def _fill_chars(self, chars: list[CharABC], row: int):
+    def _fill_chars(self, chars: list[CharABC], row: int) -> list[CharABC]:
         row_state = self._row_states[row]
         fill = row_state - len(chars)
         if fill > 0:
-            for _ in range(fill):
-                chars.append(SpaceChar())
+            chars = chars + [char_table.get_space_char()] * fill
+        return chars
 
     def _insert_row_data(self, chars: list[CharABC], row: int):
         self._row_data[row] = chars
@@ -46,6 +54,12 @@ class LCDWriterBase(WriterABC):
             changes.append((char1, idx))
         return changes
 
+    def _load_glyph(self, glyph: CustomCharABC):
+        if self._glyphs[glyph.cgram] is glyph:
+            return
+        self._lcd_api.put_custom_char(glyph.cgram, glyph.get_value())
+        self._glyphs[glyph.cgram] = glyph
+
     def _write_char(self, char: CharABC, column: int, row: int):
         if isinstance(char, ASCIICharABC):
             self._lcd_api.move_to(column, row)
@@ -59,12 +73,22 @@ class LCDWriterBase(WriterABC):
             self._lcd_api.put_character_code(value)
             return
 
+        elif isinstance(char, CustomCharABC):
+            self._load_glyph(char)
+            self._lcd_api.move_to(column, row)
+            self._lcd_api.put_character_code(char.cgram)
+            return
+
         raise NotImplementedError(f"Not Implemented: {char}")
 
     def _write_row(self, segment: list[CharABC], row: int):
+        if segment is self._row_sources[row]:
+            return
+
+        self._row_sources[row] = segment
         len_chars = len(segment)
         prev_chars = self._row_data[row]
-        self._fill_chars(segment, row)
+        segment = self._fill_chars(segment, row)
         changes = self._get_char_changes(segment, prev_chars)
 
         for char, column in changes:
@@ -74,6 +98,15 @@ class LCDWriterBase(WriterABC):
         self._insert_row_data(segment, row)
         self._set_row_state(segment, row)
 
+    def _get_frame_chars(self, frame: Frame) -> list[list[CharABC]]:
+        for glyph in frame.glyphs.values():
+            char_table.set_custom_char(glyph)
+
+        chars = []
+        for code_array in frame.rows:
+            chars.append(CharArray().get_code_char_array(code_array))
+        return chars
+
     def _write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
         self._lcd_api.blink_cursor_on()
         for idx, segment in enumerate(chars):
@@ -89,8 +122,8 @@ class LCDWriterBase(WriterABC):
 
 
 class LCDWriter(LCDWriterBase):
-    def __init__(self, rows: int, columns: int):
-        super().__init__(rows, columns)
+    def __init__(self, rows: int, columns: int, bus: int = 1, address: int = 0x27):
+        super().__init__(rows, columns, bus, address)
 
     def write_with_cursor(self, chars: list[list[CharABC]], hold_time: float):
         self._write_with_cursor(chars, hold_time)
@@ -98,6 +131,10 @@ class LCDWriter(LCDWriterBase):
     def write(self, chars: list[list[CharABC]], hold_time: float):
         self._write(chars, hold_time)
 
+    def write_frame(self, frame: Frame, hold_time: float):
+        chars = self._get_frame_chars(frame)
+        self._write(chars, hold_time)
+
     def set_backlight(self, backlight_bool: bool):
         if backlight_bool:
             self._lcd_api.backlight_on()